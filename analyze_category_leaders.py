@@ -6,6 +6,8 @@ Uses the scoreboard data directly instead of parsing narrative text.
 
 import pandas as pd
 
+from swimmer_identity import SWIMMER_ID, SWIMMER_INDEX_NAME, SwimmerIndex, with_swimmer_ids
+
 def main():
     # Load the scoreboard data (has Distance_Events column)
     df_boys = pd.read_csv('WSC_Club_Champs_2025/championship_results/championship_scoreboard_boys.csv')
@@ -14,43 +16,22 @@ def main():
     # Load all events to calculate category totals
     df_all = pd.read_parquet('WSC_Club_Champs_2025/championship_results/events_all.parquet')
     
-    # For each swimmer, calculate best performance per category
-    def calculate_category_points(swimmer_name, age, gender):
-        swimmer_events = df_all[
-            (df_all['Name'] == swimmer_name) & 
-            (df_all['Age'] == age) & 
-            (df_all['Gender'] == gender)
-        ]
-        
-        category_points = {}
-        for category in ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']:
-            cat_events = swimmer_events[swimmer_events['Event Category'] == category]
-            # Get best (max) points for this category
-            if len(cat_events) > 0:
-                category_points[category] = cat_events['WA Points'].max()
-            else:
-                category_points[category] = 0
-        
-        return category_points
-    
     # Combine boys and girls data
     df_boys['Gender'] = 'Male/Open'
     df_girls['Gender'] = 'Female'
     df_all_swimmers = pd.concat([df_boys, df_girls], ignore_index=True)
     
-    # Calculate category points for each swimmer
-    swimmer_categories = []
-    for _, swimmer in df_all_swimmers.iterrows():
-        cat_points = calculate_category_points(swimmer['Name'], swimmer['Age'], swimmer['Gender'])
-        entry = {
-            'Name': swimmer['Name'],
-            'Age': swimmer['Age'],
-            'Gender': swimmer['Gender'],
-            **cat_points
-        }
-        swimmer_categories.append(entry)
+    # Files from before swimmer ids get them from the saved swimmer index
+    swimmers = SwimmerIndex.load(f'WSC_Club_Champs_2025/championship_results/{SWIMMER_INDEX_NAME}', 2025)
+    df_all = with_swimmer_ids(df_all, swimmers)
+    df_all_swimmers = with_swimmer_ids(df_all_swimmers, swimmers)
     
-    df_categories = pd.DataFrame(swimmer_categories)
+    # Best (max) points per swimmer, gender and category in one pass
+    categories = ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']
+    best_points = (df_all.groupby([SWIMMER_ID, 'Gender', 'Event Category'], observed=True)['WA Points'].max()
+                   .unstack(fill_value=0).reindex(columns=categories, fill_value=0))
+    df_categories = df_all_swimmers[['Name', 'Age', 'Gender', SWIMMER_ID]].join(best_points, on=[SWIMMER_ID, 'Gender'])
+    df_categories[categories] = df_categories[categories].fillna(0)
     
     # Define age groups
     age_groups = {
@@ -69,8 +50,6 @@ def main():
     output.append("## 🏅 Category Leaders by Age Group\n")
     output.append("*Highest single performance in each category for each age group*\n")
     
-    categories = ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']
-    
     for age_label, ages in age_groups.items():
         df_age = df_categories[df_categories['Age'].isin(ages)]
         
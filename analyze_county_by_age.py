@@ -5,18 +5,23 @@ Analyze county times achievement by age
 
 import pandas as pd
 
+from swimmer_identity import SWIMMER_ID
+
 def main():
     # Load the comparison data
     df = pd.read_csv('county_times_2026/county_times_comparison.csv')
+    if SWIMMER_ID not in df.columns:
+        # Comparison files from before swimmer ids: one swimmer per name
+        df[SWIMMER_ID] = pd.factorize(df['Name'])[0]
     
     # Filter only those who achieved county times
     achieved = df[df['Achieved_County_Time'] == 'Yes'].copy()
     
     # Get unique swimmers by age who achieved at least one county time (using 2026 age)
-    swimmers_by_age = achieved.groupby('Age_2026')['Name'].nunique().sort_index()
+    swimmers_by_age = achieved.groupby('Age_2026')[SWIMMER_ID].nunique().sort_index()
     
     # Get total swimmers by age (who competed) (using 2026 age)
-    total_swimmers_by_age = df.groupby('Age_2026')['Name'].nunique().sort_index()
+    total_swimmers_by_age = df.groupby('Age_2026')[SWIMMER_ID].nunique().sort_index()
     
     # Get total county times achieved by age (using 2026 age)
     county_times_by_age = achieved.groupby('Age_2026').size().sort_index()
@@ -58,10 +63,10 @@ def main():
     
     for age in sorted(achieved['Age_2026'].unique()):
         age_data = achieved[achieved['Age_2026'] == age]
-        top_performers = age_data.groupby('Name').size().sort_values(ascending=False).head(3)
+        top_performers = age_data.groupby(['Name', SWIMMER_ID]).size().sort_values(ascending=False).head(3)
         
         print(f"\nAge {age}:")
-        for i, (name, count) in enumerate(top_performers.items(), 1):
+        for i, ((name, _), count) in enumerate(top_performers.items(), 1):
             print(f"  {i}. {name}: {count} county times")
 
 if __name__ == '__main__':
@@ -6,22 +6,15 @@ Groups by stroke discipline: Freestyle, Backstroke, Breaststroke, Butterfly
 
 import pandas as pd
 
+from event_descriptor import describe_event
+from swimmer_identity import SWIMMER_ID, SWIMMER_INDEX_NAME, SwimmerIndex, with_swimmer_ids
+
 def categorize_by_stroke(event_name):
     """Determine stroke from event name."""
-    event_lower = event_name.lower()
-    
-    if 'freestyle' in event_lower or 'free' in event_lower:
-        return 'Freestyle'
-    elif 'backstroke' in event_lower or 'back' in event_lower:
-        return 'Backstroke'
-    elif 'breaststroke' in event_lower or 'breast' in event_lower:
-        return 'Breaststroke'
-    elif 'butterfly' in event_lower or 'fly' in event_lower:
-        return 'Butterfly'
-    elif 'im' in event_lower or 'medley' in event_lower:
+    stroke = describe_event(event_name).stroke
+    if stroke == 'IM':
         return None  # IM not included in stroke analysis
-    else:
-        return None
+    return stroke
 
 def main():
     # Load the scoreboard data
@@ -37,43 +30,22 @@ def main():
     # Remove IM events
     df_all = df_all[df_all['Stroke'].notna()]
     
-    # For each swimmer, calculate best performance per stroke
-    def calculate_stroke_points(swimmer_name, age, gender):
-        swimmer_events = df_all[
-            (df_all['Name'] == swimmer_name) & 
-            (df_all['Age'] == age) & 
-            (df_all['Gender'] == gender)
-        ]
-        
-        stroke_points = {}
-        for stroke in ['Freestyle', 'Backstroke', 'Breaststroke', 'Butterfly']:
-            stroke_events = swimmer_events[swimmer_events['Stroke'] == stroke]
-            # Get best (max) points for this stroke
-            if len(stroke_events) > 0:
-                stroke_points[stroke] = stroke_events['WA Points'].max()
-            else:
-                stroke_points[stroke] = 0
-        
-        return stroke_points
-    
     # Combine boys and girls data
     df_boys['Gender'] = 'Male/Open'
     df_girls['Gender'] = 'Female'
     df_all_swimmers = pd.concat([df_boys, df_girls], ignore_index=True)
     
-    # Calculate stroke points for each swimmer
-    swimmer_strokes = []
-    for _, swimmer in df_all_swimmers.iterrows():
-        stroke_pts = calculate_stroke_points(swimmer['Name'], swimmer['Age'], swimmer['Gender'])
-        entry = {
-            'Name': swimmer['Name'],
-            'Age': swimmer['Age'],
-            'Gender': swimmer['Gender'],
-            **stroke_pts
-        }
-        swimmer_strokes.append(entry)
+    # Files from before swimmer ids get them from the saved swimmer index
+    swimmers = SwimmerIndex.load(f'WSC_Club_Champs_2025/championship_results/{SWIMMER_INDEX_NAME}', 2025)
+    df_all = with_swimmer_ids(df_all, swimmers)
+    df_all_swimmers = with_swimmer_ids(df_all_swimmers, swimmers)
     
-    df_strokes = pd.DataFrame(swimmer_strokes)
+    # Best (max) points per swimmer, gender and stroke in one pass
+    strokes = ['Freestyle', 'Backstroke', 'Breaststroke', 'Butterfly']
+    best_points = (df_all.groupby([SWIMMER_ID, 'Gender', 'Stroke'])['WA Points'].max()
+                   .unstack(fill_value=0).reindex(columns=strokes, fill_value=0))
+    df_strokes = df_all_swimmers[['Name', 'Age', 'Gender', SWIMMER_ID]].join(best_points, on=[SWIMMER_ID, 'Gender'])
+    df_strokes[strokes] = df_strokes[strokes].fillna(0)
     
     # Define age groups
     age_groups = {
@@ -92,8 +64,6 @@ def main():
     output.append("## 🏊 Stroke Specialists by Age Group\n")
     output.append("*Highest single performance in each stroke (best event score regardless of distance)*\n")
     
-    strokes = ['Freestyle', 'Backstroke', 'Breaststroke', 'Butterfly']
-    
     for age_label, ages in age_groups.items():
         df_age = df_strokes[df_strokes['Age'].isin(ages)]
         
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading many cleaned event CSVs, per-file pd.read_csv vs event_loader.
+
+"Before" is the loop load_all_events used to run (pd.read_csv one file at a
+time, then pd.concat). "After" is event_loader.read_event_csvs (pyarrow CSV
+reader with an explicit schema on a thread pool, zero-copy table concat), run
+single-threaded and with each --jobs value. All results are compared with
+the loop's output.
+
+By default --files synthetic event CSVs are written to a temporary folder;
+--folder benchmarks an existing cleaned_files/ folder instead.
+
+Usage:
+    python benchmarks/bench_csv_loader.py [--files 2000] [--rows 40] [--jobs 4 8]
+    python benchmarks/bench_csv_loader.py --folder WSC_Club_Champs_2025/cleaned_files
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from event_loader import read_event_csvs  # noqa: E402
+from res_records import CSV_COLUMNS  # noqa: E402
+
+
+def write_synthetic_csvs(folder: str, files: int, rows: int, seed: int = 0) -> list:
+    """Write `files` event CSVs of ~`rows` results each; returns their paths."""
+    rng = np.random.default_rng(seed)
+    clubs = np.array(['Worcester', 'WORM', 'Pershore', 'Royal Wolv', 'Malvern'], dtype=object)
+    paths = []
+    for i in range(files):
+        n = int(rng.integers(rows // 2, rows * 3 // 2 + 1))
+        event_number = str(1000 + i)
+        gender = 'Female' if i % 2 else 'Open/Male'
+        hundredths = rng.integers(2500, 120000, n)
+        times = np.where(hundredths >= 6000,
+                         np.char.add(np.char.add((hundredths // 6000).astype(str), ':'),
+                                     np.char.zfill((hundredths // 100 % 60).astype(str), 2)),
+                         (hundredths // 100).astype(str))
+        df = pd.DataFrame({
+            'Event Number': event_number,
+            'Event Name': f"{gender} 100m Freestyle",
+            'Event Category': 'Free',
+            'Gender': 'Female' if i % 2 else 'Male/Open',
+            'Name': np.char.add('Swimmer ', rng.integers(0, files * 5, n).astype(str)),
+            'Age': rng.integers(9, 18, n),
+            'Club': clubs[rng.integers(0, len(clubs), n)],
+            'Time': np.char.add(np.char.add(times, '.'), np.char.zfill((hundredths % 100).astype(str), 2)),
+            'WA Points': rng.integers(50, 800, n),
+        }, columns=list(CSV_COLUMNS))
+        path = os.path.join(folder, f"event_{event_number}.csv")
+        df.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def read_event_csvs_legacy(paths) -> pd.DataFrame:
+    """The pre-event_loader loop from load_all_events, kept for comparison."""
+    return pd.concat([pd.read_csv(path, dtype={'Time': 'string'}) for path in paths], ignore_index=True)
+
+
+def best_time(func, repeats: int):
+    """Fastest of `repeats` runs, and the last result."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def same_content(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    """Equal values regardless of dtype (the loop infers int64 event numbers)."""
+    return a.shape == b.shape and (a.astype(str).to_numpy() == b.astype(str).to_numpy()).all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--folder', help='Existing folder of event_*.csv files to load instead')
+    parser.add_argument('--files', type=int, default=2000, help='Synthetic event files (default: %(default)s)')
+    parser.add_argument('--rows', type=int, default=40, help='Mean results per file (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[4, 8],
+                        help='Thread counts to time besides 1 (default: %(default)s)')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per loader, best kept (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: %(default)s)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.folder:
+            paths = sorted(glob.glob(os.path.join(args.folder, 'event_*.csv')))
+            source = args.folder
+        else:
+            paths = write_synthetic_csvs(tmp, args.files, args.rows, args.seed)
+            source = f"{args.files:,} synthetic event files"
+
+        legacy_time, expected = best_time(lambda: read_event_csvs_legacy(paths), args.repeats)
+        print(f"📂 {source}: {len(expected):,} rows, {os.cpu_count()} CPUs\n")
+        print(f"{'Loader':<24} {'Time':>9} {'Files/s':>9} {'Speed-up':>9}  Identical")
+        print('-' * 66)
+        print(f"{'pd.read_csv loop':<24} {legacy_time:>8.3f}s {len(paths) / legacy_time:>9,.0f} {'1.0x':>9}  -")
+
+        all_identical = True
+        for jobs in [1] + [j for j in args.jobs if j != 1]:
+            elapsed, df = best_time(lambda: read_event_csvs(paths, jobs=jobs), args.repeats)
+            identical = same_content(df, expected)
+            all_identical &= identical
+            label = f"event_loader, {jobs} thread{'s' if jobs > 1 else ''}"
+            print(f"{label:<24} {elapsed:>8.3f}s {len(paths) / elapsed:>9,.0f} "
+                  f"{legacy_time / elapsed:>8.1f}x  {'yes' if identical else 'NO'}")
+
+    return 0 if all_identical else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
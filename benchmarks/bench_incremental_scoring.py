@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: re-scoring after a single event is corrected, incremental vs full.
+
+Simulates --events result corrections one at a time (points changed, a swimmer
+removed), plus one event deleted and re-added. After every change the
+IncrementalScorer state is compared with a full recompute over the same
+events: selection table, scores, narratives, both scoreboards and the age
+winners must all be identical.
+
+Usage:
+    python benchmarks/bench_incremental_scoring.py [--folder WSC_Club_Champs_2025] [--events 10]
+    python benchmarks/bench_incremental_scoring.py --synthetic 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from bench_scoring import synthetic_events  # noqa: E402
+from championship_scoring import IncrementalScorer  # noqa: E402
+from club_championships_scoreboard import get_event_gender_map_from_csvs, load_all_events  # noqa: E402
+
+STATE = ('selection', 'scores', 'narratives', 'boys', 'girls', 'winners')
+
+
+def corrected_event(df_all: pd.DataFrame, event_number: str, rng: np.random.Generator) -> pd.DataFrame:
+    """The event's rows with points nudged and (when possible) one swimmer removed."""
+    rows = df_all[df_all['Event Number'].astype(str) == event_number].copy()
+    rows['WA Points'] = np.maximum(pd.to_numeric(rows['WA Points']).to_numpy() + rng.integers(-40, 41, len(rows)), 0)
+    if len(rows) > 1:
+        rows = rows.drop(rows.index[rng.integers(len(rows))])
+    return rows
+
+
+def mismatches(incremental: IncrementalScorer, full: IncrementalScorer) -> list:
+    """Names of the state tables that differ between the two scorers."""
+    different = []
+    for name in STATE:
+        # The full scorer relabels rows, so compare content and order only
+        a = getattr(incremental, name).reset_index(drop=True)
+        b = getattr(full, name).reset_index(drop=True)
+        if not a.astype(str).equals(b.astype(str)):
+            different.append(name)
+    return different
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--folder', default='WSC_Club_Champs_2025',
+                        help='Championship folder to score (default: %(default)s)')
+    parser.add_argument('--synthetic', type=int, metavar='SWIMMERS',
+                        help='Use an in-memory synthetic meet with this many swimmers instead')
+    parser.add_argument('--events', type=int, default=10,
+                        help='Event corrections to simulate (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        df_all, gender_map = synthetic_events(args.synthetic)
+        source = f"synthetic meet, {args.synthetic:,} swimmers"
+    else:
+        df_all = load_all_events(args.folder)
+        gender_map = get_event_gender_map_from_csvs(args.folder)
+        source = args.folder
+    print(f"📂 {source}: {len(df_all):,} rows, {df_all['Name'].nunique():,} swimmers\n")
+
+    rng = np.random.default_rng(args.seed)
+    scorer = IncrementalScorer(df_all, gender_map)
+    events = sorted(scorer.df_all['Event Number'].astype(str).unique())
+
+    # (label, rows, event numbers) per change: corrections, then a delete and re-add
+    changes = []
+    for event_number in rng.choice(events, size=min(args.events, len(events)), replace=False):
+        changes.append((f"correct {event_number}", event_number))
+    removed = str(rng.choice(events))
+    changes += [(f"delete {removed}", removed), (f"re-add {removed}", removed)]
+    removed_rows = scorer.df_all[scorer.df_all['Event Number'].astype(str) == removed].copy()
+
+    print(f"{'Change':<16} {'Swimmers':>9} {'Incremental':>12} {'Full':>9}  Identical")
+    print('-' * 60)
+    inc_total = full_total = 0.0
+    all_identical = True
+    for label, event_number in changes:
+        if label.startswith('delete'):
+            rows = removed_rows.iloc[:0]
+        elif label.startswith('re-add'):
+            rows = removed_rows
+        else:
+            rows = corrected_event(scorer.df_all, event_number, rng)
+
+        start = time.perf_counter()
+        swimmer_ids = scorer.update_events(rows, {event_number})
+        inc_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        full = IncrementalScorer(scorer.df_all, scorer.event_gender_map, scorer.swimmers)
+        full_time = time.perf_counter() - start
+
+        different = mismatches(scorer, full)
+        all_identical &= not different
+        inc_total += inc_time
+        full_total += full_time
+        print(f"{label:<16} {len(swimmer_ids):>9,} {inc_time * 1000:>9.1f} ms {full_time * 1000:>6.0f} ms  "
+              f"{'yes' if not different else 'NO: ' + ', '.join(different)}")
+
+    print(f"\nMean incremental update: {inc_total / len(changes) * 1000:.1f} ms, "
+          f"full recompute: {full_total / len(changes) * 1000:.0f} ms "
+          f"({full_total / max(inc_total, 1e-9):.1f}x)")
+    print(f"All changes identical to a full recompute: {all_identical}")
+    sys.exit(0 if all_identical else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: parsed rows held as dicts vs compact ResultRecords.
+
+Parses the RES files repeatedly until --rows rows are held in memory, once as
+the dict-per-row view (iter_res_records, the previous representation) and once
+as ResultRecord tuples (iter_result_records), and reports the tracemalloc peak
+and parse time of each. Also times the bulk transpose into columns.
+
+Usage:
+    python benchmarks/bench_record_memory.py [--res-dir <folder>] [--rows N]
+"""
+
+import argparse
+import gc
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from res_records import RECORD_COLUMNS, records_to_columns  # noqa: E402
+from swim_event_extractor import SwimEventExtractor  # noqa: E402
+
+
+def parse_rows(extractor: SwimEventExtractor, res_files, target_rows: int, as_dicts: bool) -> list:
+    """Parse res_files round-robin until target_rows rows are held."""
+    parse = extractor.iter_res_records if as_dicts else extractor.iter_result_records
+    rows = []
+    while len(rows) < target_rows:
+        for path in res_files:
+            rows.extend(parse(path))
+            if len(rows) >= target_rows:
+                break
+    del rows[target_rows:]
+    return rows
+
+
+def measure(extractor: SwimEventExtractor, res_files, target_rows: int, as_dicts: bool):
+    """Return (rows, peak_bytes, seconds) for one representation."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = parse_rows(extractor, res_files, target_rows, as_dicts)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--res-dir', default='WSC_Club_Champs_2025/raw_files',
+                        help='Folder of .RES files to parse (default: %(default)s)')
+    parser.add_argument('--rows', type=int, default=100_000,
+                        help='Rows to hold in memory per representation (default: %(default)s)')
+    args = parser.parse_args()
+
+    res_files = sorted(glob.glob(os.path.join(args.res_dir, '*.RES')))
+    if not res_files:
+        print(f"No .RES files found in {args.res_dir}")
+        sys.exit(1)
+
+    extractor = SwimEventExtractor()
+    print(f"📂 {len(res_files)} RES files from {args.res_dir}, {args.rows:,} rows per run\n")
+
+    dict_rows, dict_peak, dict_time = measure(extractor, res_files, args.rows, as_dicts=True)
+    del dict_rows
+    records, rec_peak, rec_time = measure(extractor, res_files, args.rows, as_dicts=False)
+
+    start = time.perf_counter()
+    columns = records_to_columns(records)
+    transpose_time = time.perf_counter() - start
+    assert list(columns) == list(RECORD_COLUMNS) and len(columns['Name']) == len(records)
+
+    print(f"{'Representation':<16} {'Peak memory':>12} {'Per row':>9} {'Parse time':>11}")
+    print('-' * 51)
+    for label, peak, elapsed in (('dict rows', dict_peak, dict_time), ('ResultRecord', rec_peak, rec_time)):
+        print(f"{label:<16} {peak / 2**20:>9.1f} MB {peak / args.rows:>7.0f} B {elapsed:>10.2f}s")
+    print(f"\nMemory saved: {(1 - rec_peak / dict_peak) * 100:.0f}%")
+    print(f"records_to_columns: {transpose_time * 1000:.1f} ms for {len(records):,} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: championship scoring, per-swimmer groupby loop vs vectorised.
+
+"Before" is the per-swimmer loop calculate_championship_scores used to run
+(sort, filter per category, drop_duplicates, head, concat, nlargest for every
+swimmer). "After" is the whole-frame selection in championship_scoring.
+Both are run on the same data and their outputs compared with DataFrame.equals.
+
+The loop is only timed on the first --legacy-swimmers swimmers (it takes
+several milliseconds per swimmer); the vectorised scorer runs on all of them.
+Swimmer ids are assigned before timing, as the scoreboard's load stage does.
+
+Usage:
+    python benchmarks/bench_scoring.py [--folder WSC_Club_Champs_2025]
+    python benchmarks/bench_scoring.py --synthetic 100000 [--legacy-swimmers 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+
+from club_championships_scoreboard import (  # noqa: E402
+    calculate_championship_scores,
+    get_event_gender_map_from_csvs,
+    load_all_events,
+)
+from event_descriptor import CATEGORIES  # noqa: E402
+from swimmer_identity import SWIMMER_ID, SwimmerIndex  # noqa: E402
+
+
+def calculate_championship_scores_legacy(df_all: pd.DataFrame, event_gender_map) -> pd.DataFrame:
+    """The pre-vectorisation per-swimmer loop, kept for comparison."""
+    df_all['Event Number'] = df_all['Event Number'].astype(str)
+    df_all['Gender'] = df_all['Event Number'].map(event_gender_map)
+    df_all['WA Points'] = pd.to_numeric(df_all['WA Points'], errors='coerce').fillna(0).astype(int)
+    df_all['Age'] = pd.to_numeric(df_all['Age'], errors='coerce').fillna(0).astype(int)
+    df_all = df_all[df_all['Gender'] != 'Unknown'].copy()
+    df_all = df_all[df_all['Club'].isin(['Worcester', 'WORM'])].copy()
+
+    championship_results = []
+    for name, swimmer_events in df_all.groupby('Name'):
+        age = swimmer_events['Age'].iloc[0]
+        club = swimmer_events['Club'].iloc[0]
+        gender = swimmer_events['Gender'].mode()[0] if len(swimmer_events['Gender'].mode()) > 0 else swimmer_events['Gender'].iloc[0]
+        swimmer_events_sorted = swimmer_events.sort_values('WA Points', ascending=False)
+        category_events = {}
+        for category in CATEGORIES:
+            cat_events = swimmer_events_sorted[swimmer_events_sorted['Event Category'] == category]
+            cat_events = cat_events.drop_duplicates(subset=['Event Number'], keep='first')
+            top_n = cat_events.head(2)
+            if len(top_n) > 0:
+                category_events[category] = top_n
+        all_category_events = pd.concat(category_events.values(), ignore_index=True)
+        top_8_events = all_category_events.nlargest(8, 'WA Points')
+        category_counts = top_8_events['Event Category'].value_counts().to_dict()
+        championship_results.append({
+            'Name': name, 'Age': age, 'Gender': gender, 'Club': club,
+            'Total_Points': top_8_events['WA Points'].sum(),
+            'Average_Points': top_8_events['WA Points'].mean(),
+            'Best_Event_Points': top_8_events['WA Points'].max(),
+            'Events_Count': len(top_8_events),
+            'Categories_Competed': len(category_events),
+            'Sprint_Events': category_counts.get('Sprint', 0),
+            'Free_Events': category_counts.get('Free', 0),
+            'Form_100_Events': category_counts.get('100 Form', 0),
+            'Form_200_Events': category_counts.get('200 Form', 0),
+            'IM_Events': category_counts.get('IM', 0),
+            'Distance_Events': category_counts.get('Distance', 0),
+        })
+    return pd.DataFrame(championship_results)
+
+
+def synthetic_events(swimmers: int, entries: int = 7, seed: int = 0):
+    """Build an events frame in memory: `swimmers` swimmers with ~`entries` races each."""
+    rng = np.random.default_rng(seed)
+    programme = [(f"{i // 12 + 1}{i % 12 + 1:02d}", CATEGORIES[(i // 2) % len(CATEGORIES)]) for i in range(36)]
+    n = swimmers * entries
+    swimmer = rng.integers(0, swimmers, n)
+    # Female swimmers swim odd-indexed (Female) events, others even
+    event_index = rng.integers(0, 18, n) * 2 + (swimmer % 2)
+    numbers = np.array([p[0] for p in programme], dtype=object)
+    categories = np.array([p[1] for p in programme], dtype=object)
+    df = pd.DataFrame({
+        'Event Number': numbers[event_index],
+        'Event Name': np.where(swimmer % 2 == 1, 'Female event', 'Open/Male event'),
+        'Event Category': categories[event_index],
+        'Name': np.char.add('Swimmer ', swimmer.astype(str)),
+        'Age': 9 + swimmer % 9,
+        'Club': np.where(swimmer % 20 == 0, 'Pershore', 'Worcester'),
+        'Time_Hundredths': pd.array(np.full(n, 6000), dtype='Int32'),
+        # Coarse points so ties are common
+        'WA Points': (rng.integers(10, 80, n) * 10).astype(int),
+    })
+    gender_map = {num: ('Female' if i % 2 else 'Male/Open') for i, (num, _) in enumerate(programme)}
+    return df, gender_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--folder', default='WSC_Club_Champs_2025',
+                        help='Championship folder to score (default: %(default)s)')
+    parser.add_argument('--synthetic', type=int, metavar='SWIMMERS',
+                        help='Score an in-memory synthetic meet with this many swimmers instead')
+    parser.add_argument('--legacy-swimmers', type=int, default=2000,
+                        help='Swimmers to run the old loop on (default: %(default)s)')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        df_all, gender_map = synthetic_events(args.synthetic)
+        source = f"synthetic meet, {args.synthetic:,} swimmers"
+    else:
+        df_all = load_all_events(args.folder)
+        gender_map = get_event_gender_map_from_csvs(args.folder)
+        source = args.folder
+    print(f"📂 {source}: {len(df_all):,} rows, {df_all['Name'].nunique():,} swimmers")
+
+    # Ids are assigned once when events are loaded (identify_swimmers), not by
+    # the scorer, so time that separately
+    start = time.perf_counter()
+    df_all[SWIMMER_ID] = SwimmerIndex().assign(df_all)
+    print(f"Swimmer ids assigned in {time.perf_counter() - start:.3f}s\n")
+
+    # calculate_championship_scores adds columns in place, so score copies
+    frame = df_all.copy()
+    start = time.perf_counter()
+    vectorised = calculate_championship_scores(frame, gender_map)
+    vec_time = time.perf_counter() - start
+
+    legacy_names = sorted(df_all['Name'].dropna().unique())[:args.legacy_swimmers]
+    subset = df_all[df_all['Name'].isin(legacy_names)]
+    frame = subset.copy()
+    start = time.perf_counter()
+    legacy = calculate_championship_scores_legacy(frame, gender_map)
+    legacy_time = time.perf_counter() - start
+    # The loop predates swimmer ids
+    expected = calculate_championship_scores(subset.copy(), gender_map).drop(columns=SWIMMER_ID)
+
+    print(f"{'Scorer':<12} {'Swimmers':>9} {'Time':>9} {'Per swimmer':>12}")
+    print('-' * 45)
+    print(f"{'loop':<12} {len(legacy):>9,} {legacy_time:>8.3f}s {legacy_time / max(len(legacy), 1) * 1e6:>9.0f} µs")
+    print(f"{'vectorised':<12} {len(vectorised):>9,} {vec_time:>8.3f}s {vec_time / max(len(vectorised), 1) * 1e6:>9.1f} µs")
+    print(f"\nOutputs identical on the {len(legacy):,} compared swimmers: {legacy.equals(expected)}")
+
+
+if __name__ == '__main__':
+    main()
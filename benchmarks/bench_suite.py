@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: extractor, scoring, county checks and dashboard data prep.
+
+Times each stage on the 2025 meet (scale 1) and on synthetic meets 10x and
+100x its size, written by generate_synthetic_meet.py and run through the
+extractor. Each benchmark keeps the best of --repeats runs (fewer once a
+benchmark has used --budget seconds). Results are written as JSON with
+machine details; with --baseline they are compared with an earlier run and
+the suite exits 1 when any benchmark is more than --threshold times slower.
+
+Benchmarks:
+    parse_res               SwimEventExtractor._parse_res_file over every .RES file
+    load_all_events         club_championships_scoreboard.load_all_events
+    championship_scores     club_championships_scoreboard.calculate_championship_scores
+    swimmer_narratives      club_championships_scoreboard.export_swimmer_narratives
+    county_times            check_county_times.compare_with_county_times
+    dashboard_load          dashboard_data.load_events_prefer_union + with_event_genders
+    dashboard_scores        dashboard_data selection table + scores for every swimmer (live)
+    dashboard_saved_scores  dashboard_data.load_all_swimmer_scores (the scoreboard's saved file)
+    dashboard_selection     dashboard_data.load_saved_selection (saved Included/Reason/ranks per race)
+    dashboard_narratives    dashboard_data.build_swimmer_narratives
+    dashboard_filters       dashboard_data.ScoreboardViews, built and looked up for every view
+    dashboard_details       dashboard_data.DatasetIndex, built and looked up for every swimmer and event
+
+The county comparison is a row-by-row loop; at 100x it takes minutes.
+
+Usage:
+    python benchmarks/bench_suite.py [--scales 1 10 100] [--output bench_results.json]
+    python benchmarks/bench_suite.py --scales 1 10 --baseline bench_results.json --threshold 1.5
+    python benchmarks/bench_suite.py --benchmarks parse_res load_all_events --repeats 5
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+
+import dashboard_data  # noqa: E402
+from check_county_times import compare_with_county_times  # noqa: E402
+from club_championships_scoreboard import (  # noqa: E402
+    calculate_championship_scores,
+    export_all_events_union,
+    export_all_swimmer_scores,
+    export_selection_table,
+    export_swimmer_narratives,
+    get_event_gender_map_from_csvs,
+    identify_swimmers,
+    load_all_events,
+)
+from championship_scoring import build_selection_table, summarise_selection  # noqa: E402
+from generate_synthetic_meet import BASE_SWIMMERS, generate_meet  # noqa: E402
+from stage_profiler import machine_info  # noqa: E402
+from swim_event_extractor import SwimEventExtractor  # noqa: E402
+from swimmer_identity import SWIMMER_ID  # noqa: E402
+from time_codec import TIME_COLUMN, format_times, parse_times  # noqa: E402
+
+RESULTS_VERSION = 1
+COUNTY_TIMES = os.path.join(ROOT, 'county_times_2026', 'county_qualifying_times_2026.csv')
+
+
+class Meet:
+    """A meet folder in the scratch area, with inputs derived once and shared by benchmarks."""
+
+    def __init__(self, folder: str, scale: int):
+        self.folder = folder
+        self.scale = scale
+        self._cache: Dict[str, object] = {}
+
+    def derived(self, name: str, build: Callable[[], object]) -> object:
+        if name not in self._cache:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self._cache[name] = build()
+        return self._cache[name]
+
+    @property
+    def raw_dir(self) -> str:
+        return os.path.join(self.folder, 'raw_files')
+
+    @property
+    def events(self) -> pd.DataFrame:
+        """Loaded events with swimmer ids (what the scoreboard scores)."""
+        return self.derived('events', lambda: identify_swimmers(self.folder, load_all_events(self.folder)))
+
+    @property
+    def gender_map(self) -> Dict[str, str]:
+        return self.derived('gender_map', lambda: get_event_gender_map_from_csvs(self.folder))
+
+    @property
+    def selection(self) -> pd.DataFrame:
+        return self.derived('selection', lambda: build_selection_table(self.events.copy(), self.gender_map))
+
+    @property
+    def dashboard_events(self) -> pd.DataFrame:
+        """Events as the dashboard sees them, read back from the union file."""
+        def build():
+            export_all_events_union(self.folder, self.events)
+            return dashboard_data.with_event_genders(dashboard_data.load_events_prefer_union(self.folder), self.folder)
+        return self.derived('dashboard_events', build)
+
+    @property
+    def saved_scores_folder(self) -> str:
+        """The meet folder, once the scoreboard's all-swimmer score and selection files are written."""
+        def build():
+            self.dashboard_events  # the saved files record the union they came from
+            export_all_swimmer_scores(self.folder, summarise_selection(self.selection))
+            export_selection_table(self.folder, self.selection)
+            if (dashboard_data.load_all_swimmer_scores(self.folder) is None
+                    or dashboard_data.load_saved_selection(self.folder) is None):
+                raise RuntimeError(f"saved scores in {self.folder} are not usable")
+            return self.folder
+        return self.derived('saved_scores_folder', build)
+
+    @property
+    def dashboard_scores(self) -> pd.DataFrame:
+        return self.derived('dashboard_scores', lambda: dashboard_data.calculate_all_championship_scores(
+            dashboard_data.build_championship_selection(self.dashboard_events)))
+
+
+def prepare_meet(scratch: str, scale: int, folder: str, seed: int) -> Meet:
+    """
+    Copy the real meet (scale 1) or write a synthetic one `scale` times its size.
+
+    Synthetic meets are written as .RES files and extracted like a real meet,
+    so every benchmark reads the same kinds of files it does in production.
+    """
+    meet_dir = os.path.join(scratch, f"meet_x{scale}")
+    if scale == 1:
+        for sub in ('raw_files', 'cleaned_files'):
+            shutil.copytree(os.path.join(folder, sub), os.path.join(meet_dir, sub))
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_meet(os.path.join(meet_dir, 'raw_files'), swimmers=BASE_SWIMMERS * scale, seed=seed)
+            SwimEventExtractor(output_dir=meet_dir).extract_all_events_from_res(
+                os.path.join(meet_dir, 'raw_files'), verbose=False, incremental=False)
+    return Meet(meet_dir, scale)
+
+
+def _res_paths(meet: Meet) -> List[str]:
+    return sorted(os.path.join(meet.raw_dir, f) for f in os.listdir(meet.raw_dir) if f.upper().endswith('.RES'))
+
+
+def _county_inputs(meet: Meet) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """check_county_times.main's inputs: union events with display times, and the standards."""
+    def build():
+        df_events = meet.dashboard_events.copy()
+        df_events['Time'] = format_times(df_events[TIME_COLUMN])
+        df_county = pd.read_csv(COUNTY_TIMES)
+        df_county['TIME_HUNDREDTHS'] = parse_times(df_county['TIME'])
+        return df_events, df_county
+    return meet.derived('county_inputs', build)
+
+
+def _dashboard_views(df: pd.DataFrame) -> List:
+    """Build the ranking index and look up every (gender, age) view the dashboard offers."""
+    views = dashboard_data.ScoreboardViews(df)
+    return [views.get(gender, age) for gender in ('Male/Open', 'Female') for age in views.age_options]
+
+
+def _dashboard_details(selection: pd.DataFrame) -> List:
+    """Build the row index and look up every swimmer and (event, gender) the detail views offer."""
+    index = dashboard_data.DatasetIndex(selection)
+    rows = [index.swimmer_rows(swimmer_id) for swimmer_id in selection[SWIMMER_ID].unique()]
+    for gender in ('Male/Open', 'Female'):
+        rows += [index.event_rows(number, gender) for number, _ in index.event_options(gender)]
+    return rows
+
+
+# Each benchmark: name -> (setup(meet) -> args, run(*args), rows(meet))
+# Setup runs before every timed call (untimed), so runs never see each other's edits
+BENCHMARKS: Dict[str, Tuple[Callable, Callable, Callable]] = {
+    'parse_res': (
+        lambda meet: (SwimEventExtractor(output_dir=meet.folder), _res_paths(meet)),
+        lambda extractor, paths: [extractor._parse_res_file(path) for path in paths],
+        lambda meet: len(meet.events),
+    ),
+    'load_all_events': (
+        lambda meet: (meet.folder,),
+        load_all_events,
+        lambda meet: len(meet.events),
+    ),
+    'championship_scores': (
+        lambda meet: (meet.events.copy(), meet.gender_map),
+        calculate_championship_scores,
+        lambda meet: len(meet.events),
+    ),
+    'swimmer_narratives': (
+        lambda meet: (meet.folder, meet.selection),
+        export_swimmer_narratives,
+        lambda meet: len(meet.selection),
+    ),
+    'county_times': (
+        lambda meet: _county_inputs(meet),
+        compare_with_county_times,
+        lambda meet: len(_county_inputs(meet)[0]),
+    ),
+    'dashboard_load': (
+        lambda meet: (meet.dashboard_events, meet.folder),
+        lambda _, folder: dashboard_data.with_event_genders(dashboard_data.load_events_prefer_union(folder), folder),
+        lambda meet: len(meet.dashboard_events),
+    ),
+    'dashboard_scores': (
+        lambda meet: (meet.dashboard_events.copy(),),
+        lambda df_all: dashboard_data.calculate_all_championship_scores(
+            dashboard_data.build_championship_selection(df_all)),
+        lambda meet: len(meet.dashboard_events),
+    ),
+    'dashboard_saved_scores': (
+        lambda meet: (meet.saved_scores_folder,),
+        dashboard_data.load_all_swimmer_scores,
+        lambda meet: len(meet.dashboard_events),
+    ),
+    'dashboard_selection': (
+        lambda meet: (meet.saved_scores_folder,),
+        dashboard_data.load_saved_selection,
+        lambda meet: len(meet.dashboard_events),
+    ),
+    'dashboard_narratives': (
+        lambda meet: (dashboard_data.build_championship_selection(meet.dashboard_events),),
+        dashboard_data.build_swimmer_narratives,
+        lambda meet: len(meet.dashboard_events),
+    ),
+    'dashboard_filters': (
+        lambda meet: (meet.dashboard_scores,),
+        _dashboard_views,
+        lambda meet: len(meet.dashboard_scores),
+    ),
+    'dashboard_details': (
+        lambda meet: (dashboard_data.build_championship_selection(meet.dashboard_events),),
+        _dashboard_details,
+        lambda meet: len(meet.dashboard_events),
+    ),
+}
+
+
+def time_benchmark(setup: Callable, run: Callable, meet: Meet, repeats: int, budget: float) -> List[float]:
+    """Time `run` up to `repeats` times (at least once), stopping once `budget` seconds are spent."""
+    times: List[float] = []
+    while len(times) < repeats and (not times or sum(times) < budget):
+        with contextlib.redirect_stdout(io.StringIO()):
+            args = setup(meet)
+            start = time.perf_counter()
+            run(*args)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline: Dict, threshold: float, min_delta: float) -> List[str]:
+    """Benchmarks slower than `threshold` x their baseline (ignoring changes under `min_delta` s)."""
+    previous = {(r['benchmark'], r['scale']): r['best_s'] for r in baseline.get('results', [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result['benchmark'], result['scale']))
+        if before is None:
+            continue
+        result['baseline_s'] = before
+        result['ratio'] = result['best_s'] / before if before > 0 else None
+        if result['best_s'] > before * threshold and result['best_s'] - before > min_delta:
+            regressions.append(f"{result['benchmark']} x{result['scale']}: "
+                               f"{before * 1000:.1f} ms -> {result['best_s'] * 1000:.1f} ms ({result['ratio']:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--folder', default=os.path.join(ROOT, 'WSC_Club_Champs_2025'),
+                        help='Real meet used for scale 1 (default: %(default)s)')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help='Meet sizes relative to the real meet (default: %(default)s)')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        help='Benchmarks to run (default: all)')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per benchmark, best kept (default: %(default)s)')
+    parser.add_argument('--budget', type=float, default=10.0,
+                        help='Stop repeating a benchmark after this many seconds (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic meet seed (default: %(default)s)')
+    parser.add_argument('--output', default='bench_results.json', help='JSON results file (default: %(default)s)')
+    parser.add_argument('--baseline', help='Earlier results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=1.5,
+                        help='Fail when a benchmark is this many times slower than the baseline (default: %(default)s)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='Ignore slowdowns smaller than this many seconds (default: %(default)s)')
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results: List[Dict] = []
+    print(f"{'Benchmark':<24} {'Scale':>6} {'Rows':>9} {'Best':>11} {'Runs':>5}")
+    print('-' * 60)
+    with tempfile.TemporaryDirectory() as scratch:
+        for scale in args.scales:
+            meet = prepare_meet(scratch, scale, args.folder, args.seed)
+            for name in args.benchmarks:
+                setup, run, rows = BENCHMARKS[name]
+                times = time_benchmark(setup, run, meet, args.repeats, args.budget)
+                results.append({'benchmark': name, 'scale': scale, 'rows': rows(meet),
+                                'best_s': min(times), 'mean_s': sum(times) / len(times), 'runs': times})
+                print(f"{name:<24} {'x' + str(scale):>6} {results[-1]['rows']:>9,} "
+                      f"{min(times) * 1000:>8.1f} ms {len(times):>5}")
+            shutil.rmtree(meet.folder)
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta) if baseline else []
+    report = {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'machine': machine_info(),
+        'settings': {'folder': args.folder, 'scales': args.scales, 'repeats': args.repeats,
+                     'budget': args.budget, 'seed': args.seed},
+        'results': results,
+    }
+    if baseline:
+        report['baseline'] = {'file': args.baseline, 'git_commit': baseline.get('git_commit'),
+                              'threshold': args.threshold, 'regressions': regressions}
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Saved results to: {args.output}")
+
+    if baseline:
+        if regressions:
+            print(f"❌ {len(regressions)} benchmark(s) regressed past {args.threshold}x:")
+            for line in regressions:
+                print(f"  • {line}")
+            return 1
+        print(f"✓ No benchmark regressed past {args.threshold}x the baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
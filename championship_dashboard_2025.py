@@ -5,22 +5,29 @@ Interactive dashboard to view championship rankings by age group and gender.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import os
 import psutil
 from typing import Dict
 
+import dashboard_data
+from dashboard_data import MEMORY_OPTIMIZATION, age_bucket, results_fingerprint, with_event_genders
+from swimmer_identity import SWIMMER_ID
+from time_codec import TIME_COLUMN, format_times
+
 # Compatibility for different Streamlit versions
 if hasattr(st, 'cache_data'):
-    # Add conservative defaults for cache: 1 entry and 1-hour TTL
-    def cache_decorator(func=None, *, max_entries=1, ttl=3600):
+    # 1 entry and no TTL: every loader takes the results fingerprint (see
+    # dashboard_data.results_fingerprint), so entries are replaced exactly when
+    # new results are published and never expire otherwise
+    def cache_decorator(func=None, *, max_entries=1, ttl=None):
         return st.cache_data(func, max_entries=max_entries, ttl=ttl) if func else (lambda f: st.cache_data(f, max_entries=max_entries, ttl=ttl))
+    # Indexes shared by every session and returned as-is (not copied): read-only
+    resource_decorator = st.cache_resource(max_entries=1)
 else:
     cache_decorator = st.cache
-
-# Memory optimization settings
-MEMORY_OPTIMIZATION = True
-
+    resource_decorator = st.cache(allow_output_mutation=True, max_entries=1)
 
 # Page configuration
 st.set_page_config(
@@ -38,427 +45,84 @@ except Exception:
     pass
 
 
-@cache_decorator
-def load_all_events(folder: str) -> pd.DataFrame:
-    """Load all event CSV files into a single dataframe with memory optimization."""
-    # Look for event files in cleaned_files subfolder
-    cleaned_folder = os.path.join(folder, 'cleaned_files')
-    if os.path.exists(cleaned_folder):
-        search_folder = cleaned_folder
-    else:
-        search_folder = folder
-    
-    csv_files = [f for f in os.listdir(search_folder) if f.startswith('event_') and f.endswith('.csv')]
-    
-    if not csv_files:
-        print(f"No CSV files found in {search_folder}")
-        return pd.DataFrame()
-    
-    dfs = []
-    for csv_file in csv_files:
-        file_path = os.path.join(search_folder, csv_file)
-        try:
-            # Load with optimized data types for memory efficiency
-            df = pd.read_csv(file_path, dtype={
-                'Event Number': 'category',  # Use category for repeated values
-                'Event Name': 'category',    # Use category for repeated values
-                'Event Category': 'category', # Use category for repeated values
-                'Name': 'object',            # Use object for names
-                'Age': 'int8',              # Use smallest int type
-                'Club': 'category',          # Use category for repeated values
-                'Time': 'object',           # Keep as object for time format
-                'WA Points': 'int16'        # Use int16 instead of int64
-            })
-            dfs.append(df)
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
-            continue
-    
-    if not dfs:
-        return pd.DataFrame()
-    
-    # Concatenate and optimize memory usage
-    combined_df = pd.concat(dfs, ignore_index=True)
-    
-    # Additional memory optimizations
-    if MEMORY_OPTIMIZATION:
-        # Convert string columns to category where beneficial
-        for col in combined_df.columns:
-            if combined_df[col].dtype == 'object':
-                # Convert to category if it has many repeated values
-                if combined_df[col].nunique() / len(combined_df) < 0.5:
-                    combined_df[col] = combined_df[col].astype('category')
-    
-    return combined_df
+# Data preparation lives in dashboard_data (no Streamlit, so it can be
+# benchmarked); these wrappers add the app's caching. Each takes the results
+# fingerprint as its cache key; frames derived from the results are passed as
+# underscore arguments, which Streamlit does not hash, since the fingerprint
+# already identifies them.
 
 
 @cache_decorator
-def get_event_gender_map_from_csvs(folder: str) -> Dict[str, str]:
-    """Build a mapping of event number -> gender by inspecting event CSV names.
-
-    This is used as a fallback when input data lacks a Gender column.
-    """
-    import glob
-
-    # Prefer cleaned_files subfolder if present
-    cleaned_folder = os.path.join(folder, 'cleaned_files')
-    search_folder = cleaned_folder if os.path.exists(cleaned_folder) else folder
+def load_all_events(folder: str, fingerprint: str) -> pd.DataFrame:
+    """Load all event CSV files into a single dataframe with memory optimization."""
+    return dashboard_data.load_all_events(folder)
 
-    csv_files = glob.glob(os.path.join(search_folder, 'event_*.csv'))
 
-    event_gender_map: Dict[str, str] = {}
+@cache_decorator
+def get_event_gender_map_from_csvs(folder: str, fingerprint: str) -> Dict[str, str]:
+    """Build a mapping of event number -> gender from the extractor's event index."""
+    return dashboard_data.get_event_gender_map_from_csvs(folder)
 
-    for csv_file in csv_files:
-        try:
-            # Extract event number from filename like event_101.csv
-            basename = os.path.basename(csv_file)
-            event_number = os.path.splitext(basename)[0].split('_')[-1]
 
-            df = pd.read_csv(csv_file)
-            if 'Event Name' in df.columns and len(df) > 0:
-                event_name = str(df['Event Name'].iloc[0]).lower()
+@resource_decorator
+def scoreboard_views(_df_scores: pd.DataFrame, fingerprint: str) -> dashboard_data.ScoreboardViews:
+    """Every (gender, age) ranking, sorted once per dataset; selectbox changes are lookups."""
+    return dashboard_data.ScoreboardViews(_df_scores)
 
-                if 'female' in event_name or 'girl' in event_name:
-                    event_gender_map[event_number] = 'Female'
-                elif 'male' in event_name or 'open/male' in event_name or 'boy' in event_name or 'open' in event_name:
-                    # Treat any open/male indicator as Male/Open
-                    event_gender_map[event_number] = 'Male/Open'
-                else:
-                    # Default if unspecified
-                    event_gender_map[event_number] = 'Male/Open'
-            else:
-                event_gender_map[event_number] = 'Unknown'
-        except Exception:
-            # On any error, mark unknown and continue
-            event_gender_map[event_number] = 'Unknown'
 
-    return event_gender_map
+@resource_decorator
+def dataset_index(_selection: pd.DataFrame, fingerprint: str) -> dashboard_data.DatasetIndex:
+    """Swimmer and (event, gender) row positions for the detail views, built once per dataset."""
+    return dashboard_data.DatasetIndex(_selection)
 
 
 @cache_decorator
-def filter_dataframe_memory_efficient(df: pd.DataFrame, gender: str | list, age: str) -> pd.DataFrame:
-    """Memory-efficient filtering of dataframe."""
-    # Start with a copy to avoid modifying original
-    filtered_df = df.copy()
-    
-    # Apply gender filter (supports single value or list of acceptable values)
-    if gender != 'All':
-        if isinstance(gender, (list, set, tuple)):
-            filtered_df = filtered_df[filtered_df['Gender'].isin(list(gender))]
-        else:
-            filtered_df = filtered_df[filtered_df['Gender'] == gender]
-    
-    # Apply age filter
-    if age != 'All':
-        if age == '16+':
-            filtered_df = filtered_df[filtered_df['Age'] >= 16]
-        else:
-            filtered_df = filtered_df[filtered_df['Age'] == int(age)]
-    
-    # Sort by total points descending
-    filtered_df = filtered_df.sort_values('Total_Points', ascending=False).reset_index(drop=True)
-    filtered_df.index = filtered_df.index + 1  # Start ranking from 1
-    
-    return filtered_df
+def build_championship_selection(_df_all: pd.DataFrame, fingerprint: str) -> pd.DataFrame:
+    """Apply the championship rules once; scores, narratives and the swimmer
+    detail view are all read from this per-race table."""
+    return dashboard_data.build_championship_selection(_df_all)
 
 
 @cache_decorator
-def calculate_all_championship_scores(df_all: pd.DataFrame, 
+def calculate_all_championship_scores(_selection: pd.DataFrame, fingerprint: str,
                                       min_categories: int = 0) -> pd.DataFrame:
-    """
-    Calculate championship scores for ALL swimmers (no minimum category requirement).
-    
-    Args:
-        df_all: Dataframe with all events
-        min_categories: Minimum categories required (0 = show all)
-    """
-    # Ensure Event Number is string and Gender column exists
-    df_all['Event Number'] = df_all['Event Number'].astype(str)
-    if 'Gender' not in df_all.columns:
-        df_all['Gender'] = 'Unknown'
-    
-    # Remove Unknown gender entries
-    df_all = df_all[df_all['Gender'] != 'Unknown'].copy()
-    
-    # Filter for Worcester/WORM swimmers only
-    df_all = df_all[df_all['Club'].isin(['Worcester', 'WORM'])].copy()
-    
-    championship_results = []
-    
-    # Group by swimmer name
-    for name, swimmer_events in df_all.groupby('Name'):
-        # Get swimmer info
-        age = swimmer_events['Age'].iloc[0]
-        club = swimmer_events['Club'].iloc[0]
-        # Use the most common gender across all events for this swimmer
-        gender_counts = swimmer_events['Gender'].value_counts()
-        if len(gender_counts) > 0:
-            # Get the most frequent gender
-            most_frequent_gender = gender_counts.index[0]
-            most_frequent_count = gender_counts.iloc[0]
-            
-            # If there's a tie, use the gender from the event with highest WA Points
-            if len(gender_counts) > 1 and gender_counts.iloc[1] == most_frequent_count:
-                # Tie - use gender from best performance
-                best_event = swimmer_events.loc[swimmer_events['WA Points'].idxmax()]
-                gender = best_event['Gender']
-            else:
-                gender = most_frequent_gender
-        else:
-            gender = swimmer_events['Gender'].iloc[0]
-        
-        # Max 2 races per category for all ages (updated rule)
-        max_per_category = 2
-        
-        # Sort by WA Points descending
-        swimmer_events_sorted = swimmer_events.sort_values('WA Points', ascending=False)
-        
-        # For each category, take top N races
-        category_events = {}
-        for category in ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']:
-            cat_events = swimmer_events_sorted[swimmer_events_sorted['Event Category'] == category]
-            # Remove duplicates - keep only best score per unique event
-            cat_events = cat_events.drop_duplicates(subset=['Event Number'], keep='first')
-            # Take top N for this category
-            top_n = cat_events.head(max_per_category)
-            if len(top_n) > 0:
-                category_events[category] = top_n
-        
-        # Count categories
-        num_categories = len(category_events)
-        
-        # Apply minimum category filter
-        if num_categories < min_categories:
-            continue
-        
-        # Combine all category events and take top 8
-        if category_events:
-            all_category_events = pd.concat(category_events.values(), ignore_index=True)
-            top_8_events = all_category_events.nlargest(8, 'WA Points')
-        else:
-            continue
-        
-        # Calculate totals
-        total_points = top_8_events['WA Points'].sum()
-        avg_points = top_8_events['WA Points'].mean()
-        best_event_points = top_8_events['WA Points'].max()
-        num_events = len(top_8_events)
-        
-        # Count events per category
-        category_counts = top_8_events['Event Category'].value_counts().to_dict()
-        
-        championship_results.append({
-            'Name': name,
-            'Age': age,
-            'Gender': gender,
-            'Club': club,
-            'Total_Points': total_points,
-            'Average_Points': avg_points,
-            'Best_Event_Points': best_event_points,
-            'Events_Count': num_events,
-            'Categories_Competed': num_categories,
-            'Sprint_Events': category_counts.get('Sprint', 0),
-            'Free_Events': category_counts.get('Free', 0),
-            'Form_100_Events': category_counts.get('100 Form', 0),
-            'Form_200_Events': category_counts.get('200 Form', 0),
-            'IM_Events': category_counts.get('IM', 0),
-            'Distance_Events': category_counts.get('Distance', 0)
-        })
-    
-    df = pd.DataFrame(championship_results)
-    return df
+    """Calculate championship scores for ALL swimmers (no minimum category requirement)."""
+    return dashboard_data.calculate_all_championship_scores(_selection, min_categories)
 
 
 @cache_decorator
-def build_swimmer_narratives(df_all: pd.DataFrame) -> pd.DataFrame:
-    """Build per-swimmer narratives describing included/excluded events.
-
-    Returns a dataframe with columns:
-      Name, Age, Gender, Total_Points, Narrative
-    """
-    if len(df_all) == 0:
-        return pd.DataFrame(columns=['Name', 'Age', 'Gender', 'Total_Points', 'Narrative'])
-
-    # Filter for Worcester/WORM swimmers only
-    df_all = df_all[df_all['Club'].isin(['Worcester', 'WORM'])].copy()
-
-    results = []
-    for swimmer_name, swimmer_events in df_all.groupby('Name'):
-        swimmer_events = swimmer_events.sort_values('WA Points', ascending=False).copy()
-        age = int(swimmer_events['Age'].iloc[0])
-        gender = swimmer_events['Gender'].iloc[0]
-
-        # Category limit and selection (max 2 per category for all ages)
-        limit_per_category = 2
-        categories = ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']
-        selected_rows = []
-        excluded_due_to_limit = []
-
-        # Ensure one best per Event Number
-        swimmer_events = swimmer_events.drop_duplicates(subset=['Event Number'], keep='first')
-
-        for cat in categories:
-            cat_df = swimmer_events[swimmer_events['Event Category'] == cat]
-            if len(cat_df) == 0:
-                continue
-            top_cat = cat_df.head(limit_per_category)
-            selected_rows.append(top_cat)
-            if len(cat_df) > len(top_cat):
-                over_limit = cat_df.iloc[len(top_cat):]
-                excluded_due_to_limit.extend(
-                    [f"{row['Event Name']} ({int(row['WA Points'])} pts)" for _, row in over_limit.iterrows()]
-                )
-
-        included_numbers = []
-        if selected_rows:
-            all_candidates = pd.concat(selected_rows, ignore_index=True)
-            top8 = all_candidates.nlargest(8, 'WA Points')
-            included_numbers = top8['Event Number'].astype(str).tolist()
-        else:
-            top8 = pd.DataFrame(columns=swimmer_events.columns)
-
-        # Included/Excluded lists
-        included_by_cat = {}
-        for _, row in top8.iterrows():
-            cat = row['Event Category']
-            included_by_cat.setdefault(cat, []).append(f"{row['Event Name']} – {int(row['WA Points'])} pts")
-
-        excluded_other = []
-        for _, row in swimmer_events.iterrows():
-            if str(row['Event Number']) not in included_numbers:
-                excluded_other.append(f"{row['Event Name']} – {int(row['WA Points'])} pts")
-
-        total_points = int(top8['WA Points'].sum()) if len(top8) else 0
-        avg_points = float(top8['WA Points'].mean()) if len(top8) else 0.0
-        best_points = int(top8['WA Points'].max()) if len(top8) else 0
-
-        # Helpers for natural language joins
-        def _join(items, max_items=3):
-            items = [i for i in items if i]
-            if not items:
-                return ""
-            if len(items) > max_items:
-                shown = items[:max_items]
-                return ", ".join(shown) + f" and {len(items)-max_items} more"
-            if len(items) == 1:
-                return items[0]
-            return ", ".join(items[:-1]) + f" and {items[-1]}"
+def build_swimmer_narratives(_selection: pd.DataFrame, fingerprint: str) -> pd.DataFrame:
+    """Build per-swimmer narratives describing included/excluded events."""
+    return dashboard_data.build_swimmer_narratives(_selection)
 
-        # Compose narrative (natural language)
-        included_parts = []
-        for cat in categories:
-            if cat in included_by_cat:
-                included_parts.append(f"{cat} (" + _join(included_by_cat[cat], max_items=2) + ")")
-        included_sentence = _join(included_parts, max_items=4) if included_parts else "no events yet counted"
 
-        reason_bits = []
-        if excluded_due_to_limit:
-            reason_bits.append("some races exceeded the per‑category limit: " + _join(excluded_due_to_limit, max_items=3))
-        if excluded_other:
-            reason_bits.append("others were just outside the swimmer’s top eight: " + _join(excluded_other, max_items=3))
-        reasons_sentence = ("; ".join(reason_bits) + ".") if reason_bits else "All eligible races are currently counted."
-
-        narrative = (
-            f"{total_points} points from the top eight races (average {avg_points:.1f}, best {best_points}). "
-            f"Included: {included_sentence}. {reasons_sentence}"
-        )
-
-        results.append({
-            'Name': swimmer_name,
-            'Age': age,
-            'Gender': gender,
-            'Total_Points': total_points,
-            'Narrative': narrative,
-            'IncludedShort': included_sentence,
-        })
-
-    df_narr = pd.DataFrame(results)
-    return df_narr
+@cache_decorator
+def load_all_swimmer_scores(base_folder: str, fingerprint: str) -> pd.DataFrame | None:
+    """Load every swimmer's scores as saved by the scoreboard (None if missing or stale)."""
+    return dashboard_data.load_all_swimmer_scores(base_folder)
 
 
 @cache_decorator
-def load_precomputed_scoreboard(base_folder: str) -> pd.DataFrame | None:
-    """Load precomputed championship scoreboard (boys+girls) if available.
-
-    Expects CSVs under `<base_folder>/championship_results/` as written by
-    `club_championships_scoreboard.export_scoreboard()`.
-    Returns a dataframe matching the columns used by the dashboard, or None.
-    """
-    try:
-        results_dir = os.path.join(base_folder, 'championship_results')
-        boys_csv = os.path.join(results_dir, 'championship_scoreboard_boys.csv')
-        girls_csv = os.path.join(results_dir, 'championship_scoreboard_girls.csv')
-        if not (os.path.exists(boys_csv) and os.path.exists(girls_csv)):
-            return None
-        df_boys = pd.read_csv(boys_csv)
-        df_girls = pd.read_csv(girls_csv)
-        df_boys['Gender'] = 'Male'
-        df_girls['Gender'] = 'Female'
-        df = pd.concat([df_boys, df_girls], ignore_index=True)
-        # Ensure required columns exist and types are consistent
-        expected_cols = [
-            'Name', 'Age', 'Gender', 'Club', 'Total_Points', 'Average_Points',
-            'Best_Event_Points', 'Events_Count', 'Categories_Competed',
-            'Sprint_Events', 'Free_Events', 'Form_100_Events', 'Form_200_Events',
-            'IM_Events', 'Distance_Events'
-        ]
-        for col in expected_cols:
-            if col not in df.columns:
-                df[col] = 0 if 'Events' in col or 'Points' in col else ''
-        # Order columns (not strictly necessary, but helps consistency)
-        df = df[expected_cols + [c for c in df.columns if c not in expected_cols]]
-        return df
-    except Exception:
-        return None
+def load_saved_selection(base_folder: str, fingerprint: str) -> pd.DataFrame | None:
+    """Load every race's Included flag, exclusion reason and ranks as saved by the scoreboard."""
+    return dashboard_data.load_saved_selection(base_folder)
 
 
 @cache_decorator
-def load_swimmer_narratives_csv(base_folder: str) -> pd.DataFrame | None:
+def load_swimmer_narratives_csv(base_folder: str, fingerprint: str) -> pd.DataFrame | None:
     """Load prebuilt swimmer narratives if present."""
-    try:
-        csv_path = os.path.join(base_folder, 'championship_results', 'championship_swimmer_narratives.csv')
-        if not os.path.exists(csv_path):
-            return None
-        return pd.read_csv(csv_path)
-    except Exception:
-        return None
+    return dashboard_data.load_swimmer_narratives_csv(base_folder)
 
 
 @cache_decorator
-def load_events_prefer_union(base_folder: str) -> pd.DataFrame:
-    """Load all events, preferring a single union file if present.
+def load_events_prefer_union(base_folder: str, fingerprint: str) -> pd.DataFrame:
+    """Load all events, preferring the union Parquet file if present."""
+    return dashboard_data.load_events_prefer_union(base_folder)
 
-    Order of preference:
-      1) championship_results/events_all.parquet (fastest)
-      2) championship_results/events_all.csv
-      3) Fall back to concatenating cleaned_files/event_*.csv
-    """
-    # Require Parquet (preferred); fall back to per-file loader only if missing
-    results_dir = os.path.join(base_folder, 'championship_results')
-    pq_path = os.path.join(results_dir, 'events_all.parquet')
-    if os.path.exists(pq_path):
-        try:
-            return pd.read_parquet(pq_path)
-        except Exception:
-            pass
-    # Fallback to per-file loader
-    return load_all_events(base_folder)
+
+load_last_updated_timestamp = dashboard_data.load_last_updated_timestamp
 
 
-def load_last_updated_timestamp(base_folder: str) -> str | None:
-    """Load the last updated timestamp from the championship results folder.
-    
-    Returns:
-        Timestamp string in format 'YYYY-MM-DD HH:MM:SS' or None if not available
-    """
-    try:
-        timestamp_file = os.path.join(base_folder, 'championship_results', 'last_updated.txt')
-        if os.path.exists(timestamp_file):
-            with open(timestamp_file, 'r') as f:
-                return f.read().strip()
-    except Exception:
-        pass
-    return None
 def main():
     """Main Streamlit app."""
     
@@ -517,35 +181,36 @@ def main():
         st.error(f"❌ Events folder not found: {events_folder}")
         return
     
+    # Cache key for everything loaded below: changes only when results are published
+    fingerprint = results_fingerprint(events_folder)
+    
     # Load data with memory optimization
     with st.spinner("Loading championship data..."):
         # Load all data (prefer union file for performance)
-        df_all = load_events_prefer_union(events_folder)
+        df_all = load_events_prefer_union(events_folder, fingerprint)
         
         # Ensure Gender column exists; derive from event CSVs if needed
-        if 'Gender' not in df_all.columns:
-            df_all['Event Number'] = df_all['Event Number'].astype(str)
-            event_gender_map = get_event_gender_map_from_csvs(events_folder)
-            df_all['Gender'] = df_all['Event Number'].map(event_gender_map)
-            df_all = df_all[df_all['Gender'] != 'Unknown'].copy()
-        else:
-            # Ensure Event Number is string for consistency
-            df_all['Event Number'] = df_all['Event Number'].astype(str)
-            # Normalize legacy gender labels to new scheme
-            df_all['Gender'] = df_all['Gender'].replace({'Male': 'Male/Open'})
+        df_all = with_event_genders(df_all, events_folder)
         
         # Reuse the same dataframe (read-only below) to avoid extra memory copy
         df_all_with_gender = df_all
         
-        # Always compute scores for ALL swimmers (no minimum) so counts aren't limited to eligible only
-        # Precomputed CSVs contain only championship-eligible swimmers; that undercounts.
-        df_precomputed = load_precomputed_scoreboard(events_folder)
-        df_all_swimmers = calculate_all_championship_scores(df_all, min_categories=0)
+        # Scores for ALL swimmers (no minimum) so counts aren't limited to eligible only.
+        # The scoreboard saves them and every race's selection outcome; each is rebuilt
+        # live only when its file is missing or stale (the selection on first use).
+        df_all_swimmers = load_all_swimmer_scores(events_folder, fingerprint)
+        selection = load_saved_selection(events_folder, fingerprint)
+        if df_all_swimmers is None:
+            if selection is None:
+                selection = build_championship_selection(df_all, fingerprint)
+            df_all_swimmers = calculate_all_championship_scores(selection, fingerprint, min_categories=0)
 
         # Try to load prebuilt narratives; if missing, build on the fly
-        df_narratives = load_swimmer_narratives_csv(events_folder)
+        df_narratives = load_swimmer_narratives_csv(events_folder, fingerprint)
         if df_narratives is None or len(df_narratives) == 0:
-            df_narratives = build_swimmer_narratives(df_all)
+            if selection is None:
+                selection = build_championship_selection(df_all, fingerprint)
+            df_narratives = build_swimmer_narratives(selection, fingerprint)
         
         # Memory cleanup - remove intermediate variables
         del df_all
@@ -610,15 +275,9 @@ def main():
             gender_filter_value = 'Male/Open' if selected_gender == 'Male/Open' else 'Female'
         
         with col2:
-            # Get all ages from all swimmers for initial display, group 16+ together
-            all_ages = sorted(df_all_swimmers['Age'].unique().tolist())
-            # Create age options with 16+ grouping
-            age_options = ['All']
-            for age in all_ages:
-                if age < 16:
-                    age_options.append(str(age))
-                elif age >= 16 and '16+' not in age_options:
-                    age_options.append('16+')
+            # Ages of all swimmers, 16+ grouped together
+            views = scoreboard_views(df_all_swimmers, fingerprint)
+            age_options = views.age_options
             selected_age = st.selectbox("Age", age_options, key='age_filter')
         
         with col3:
@@ -628,12 +287,8 @@ def main():
     
     # Only run analysis if button is pressed
     if submit_button:
-        # Use memory-efficient filtering
-        df_display = filter_dataframe_memory_efficient(
-            df_all_swimmers, 
-            gender_filter_value, 
-            selected_age
-        )
+        # Pre-sorted, ranked view (a slice of the shared index, not a copy)
+        df_display = views.get(gender_filter_value, selected_age)
         
         # Global tooltip styles now provided by styles.css
         
@@ -729,8 +384,7 @@ def main():
             # Display rankings table
             if len(df_display) > 0:
                 # Prepare display dataframe
-                df_show = df_display.copy()
-                df_show['Rank'] = df_show.index
+                df_show = df_display.assign(Rank=df_display.index)
             
                 # Select columns to display (removed Eligible and Categories)
                 display_columns = [
@@ -761,6 +415,7 @@ def main():
                 # Keep numeric version for chart
                 df_for_chart = df_show_renamed.copy()
                 df_for_chart['Total Points'] = df_display['Total_Points'].values
+                df_for_chart[SWIMMER_ID] = df_display[SWIMMER_ID].values
                 
                 # Format numbers for table display
                 df_show_renamed['Total Points'] = df_show_renamed['Total Points'].apply(lambda x: f"{x:.0f}")
@@ -772,12 +427,14 @@ def main():
                 with tab1:
                     # Join narratives for tooltips (prefer IncludedShort -> compact included events list)
                     try:
-                        cols = ['Name']
+                        # Older narrative files have no swimmer ids; join those on name
+                        key = SWIMMER_ID if SWIMMER_ID in df_narratives.columns else 'Name'
+                        cols = [key]
                         if 'IncludedShort' in df_narratives.columns:
                             cols.append('IncludedShort')
                         if 'Narrative' in df_narratives.columns:
                             cols.append('Narrative')
-                        df_with_narr = df_for_chart.merge(df_narratives[cols].drop_duplicates('Name'), on='Name', how='left')
+                        df_with_narr = df_for_chart.merge(df_narratives[cols].drop_duplicates(key), on=key, how='left')
                     except Exception:
                         df_with_narr = df_for_chart.copy()
 
@@ -849,23 +506,36 @@ def main():
             else:
                 st.info("No swimmers found matching the selected filters.")
         
+        # Row index over the per-race selection table for the detail views below
+        if selection is None:
+            selection = build_championship_selection(df_all_with_gender, fingerprint)
+        index = dataset_index(selection, fingerprint)
+        
         with st.expander("Individual Swimmer Details", expanded=True):
             # Individual Swimmer Detail Section
             st.markdown("---")
             st.markdown('<h3 class="wsc-h3">Swimmer Event Details</h3>', unsafe_allow_html=True)
             st.markdown("Select a swimmer to view their individual event breakdown:")
         
-            # Create a dropdown with swimmer names
-            swimmer_names = sorted(df_display['Name'].unique().tolist())
-            selected_swimmer = st.selectbox(
+            # Create a dropdown of swimmers by id, labelled by name (plus club
+            # and age for swimmers who share a name)
+            swimmer_rows = df_display.sort_values(['Name', SWIMMER_ID]).set_index(SWIMMER_ID)
+            shared_names = swimmer_rows['Name'].duplicated(keep=False)
+            swimmer_labels = {
+                swimmer_id: f"{row.Name} ({row.Club}, {row.Age})" if shared else row.Name
+                for swimmer_id, row, shared in zip(swimmer_rows.index, swimmer_rows.itertuples(), shared_names)
+            }
+            selected_id = st.selectbox(
                 "Choose a swimmer:",
-                options=[''] + swimmer_names,
-                index=0
+                options=[None] + list(swimmer_labels),
+                index=0,
+                format_func=lambda swimmer_id: '' if swimmer_id is None else swimmer_labels[swimmer_id]
             )
         
-            if selected_swimmer:
+            if selected_id is not None:
                 # Get swimmer's info
-                swimmer_info = df_display[df_display['Name'] == selected_swimmer].iloc[0]
+                swimmer_info = swimmer_rows.loc[selected_id]
+                selected_swimmer = swimmer_info['Name']
             
                 # Display swimmer summary
                 st.markdown(f'<h4 class="wsc-h4">{selected_swimmer}</h4>', unsafe_allow_html=True)
@@ -918,106 +588,37 @@ def main():
                 with col_f:
                     st.metric("Events Counted", swimmer_info['Events_Count'])
             
-                # Get all events for this swimmer
-                swimmer_events = df_all_with_gender[df_all_with_gender['Name'] == selected_swimmer].copy()
+                # All events for this swimmer with the selection outcome of each,
+                # best WA Points first (ties keep the scoring order)
+                swimmer_events = index.swimmer_rows(selected_id)
             
                 if len(swimmer_events) > 0:
-                    # Sort by WA Points descending
-                    swimmer_events = swimmer_events.sort_values('WA Points', ascending=False)
-                
-                    # Ensure gender column exists (it should already be present)
-                    if 'Gender' not in swimmer_events.columns:
-                        swimmer_events['Gender'] = 'Unknown'
-                
-                    # Determine which events are INCLUDED in championship scoring for this swimmer
-                    limit_per_category = 2  # Max 2 per category for all ages
-                    categories_for_scoring = ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']
-                    selected_per_cat = []
-                    for cat in categories_for_scoring:
-                        cat_events = swimmer_events[swimmer_events['Event Category'] == cat]
-                        if len(cat_events) == 0:
-                            continue
-                        cat_events = cat_events.drop_duplicates(subset=['Event Number'], keep='first')
-                        top_cat = cat_events.head(limit_per_category)
-                        if len(top_cat) > 0:
-                            selected_per_cat.append(top_cat)
-                    included_event_numbers = set()
-                    if len(selected_per_cat) > 0:
-                        all_candidates = pd.concat(selected_per_cat, ignore_index=True)
-                        top8 = all_candidates.nlargest(8, 'WA Points')
-                        included_event_numbers = set(top8['Event Number'].astype(str).tolist())
-                
-                    # Prepare display dataframe
-                    event_display = swimmer_events[['Event Number', 'Event Name', 'Event Category', 'Time', 'WA Points']].copy()
-                    event_display['Included'] = event_display['Event Number'].astype(str).apply(lambda x: '✅' if x in included_event_numbers else '')
-                
-                    # Format Time to hh:mm:ss.hh (hundredths of seconds)
-                    def format_time(time_val):
-                        if pd.isna(time_val) or time_val is None or time_val == '':
-                            return '-'
-                        s = str(time_val).strip()
-                        if s == '-':
-                            return '-'
-                        # If already normalized (HH:MM:SS.HS), keep as-is
-                        import re
-                        if re.match(r"^\d{2}:\d{2}:\d{2}\.\d{2}$", s):
-                            return s
-                        # HH:MM:SS(.HS)? -> HH:MM:SS.HS
-                        m = re.match(r"^(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,2}))?$", s)
-                        if m:
-                            hh = int(m.group(1)); mm = int(m.group(2)); ss = int(m.group(3)); hs = int(m.group(4)) if m.group(4) else 0
-                            return f"{hh:02d}:{mm:02d}:{ss:02d}.{hs:02d}"
-                        # MM:SS(.HS)? -> 00:MM:SS.HS
-                        m = re.match(r"^(\d{1,2}):(\d{1,2})(?:\.(\d{1,2}))?$", s)
-                        if m:
-                            mm = int(m.group(1)); ss = int(m.group(2)); hs = int(m.group(3)) if m.group(3) else 0
-                            return f"00:{mm:02d}:{ss:02d}.{hs:02d}"
-                        # SS.HS -> 00:00:SS.HS
-                        m = re.match(r"^(\d{1,2})\.(\d{1,2})$", s)
-                        if m:
-                            ss = int(m.group(1)); hs = int(m.group(2))
-                            return f"00:00:{ss:02d}.{hs:02d}"
-                        # Seconds only -> 00:00:SS.00
-                        if re.match(r"^\d+$", s):
-                            ss = int(s)
-                            return f"00:00:{ss:02d}.00"
-                        # Seconds with decimals -> 00:00:SS.HS
-                        if re.match(r"^\d+\.\d+$", s):
-                            parts = s.split('.')
-                            ss = int(parts[0]); hs = int(parts[1])
-                            return f"00:00:{ss:02d}.{hs:02d}"
-                        return s
-                    
-                    event_display['Time'] = event_display['Time'].apply(format_time)
-                    # Ensure any lingering microsecond-style values are trimmed to 2 decimals
-                    try:
-                        event_display['Time'] = event_display['Time'].astype(str).str.replace(
-                            r'^(\d{2}:\d{2}:\d{2})\.(\d{2}).*$', r'\1.\2', regex=True
-                        )
-                    except Exception:
-                        pass
-                
-                    event_display = event_display.rename(columns={
-                        'Event Number': 'Event #',
-                        'Event Name': 'Event',
-                        'Event Category': 'Category',
-                        'Time': 'Time',
-                        'WA Points': 'FINA Points'
+                    # Prepare display dataframe; Included, Reason and Category_Rank
+                    # are the scoring stage's own outcome for each race
+                    category_rank = swimmer_events['Category_Rank']
+                    event_display_clean = pd.DataFrame({
+                        'Included': swimmer_events['Included'].to_numpy(dtype=bool),
+                        'Event #': swimmer_events['Event Number'].to_numpy(),
+                        'Event': swimmer_events['Event Name'].to_numpy(),
+                        'Category': swimmer_events['Event Category'].to_numpy(),
+                        # Times are integer hundredths; format to hh:mm:ss.hh for display only
+                        'Time': format_times(swimmer_events[TIME_COLUMN]).to_numpy(),
+                        'FINA Points': swimmer_events['WA Points'].to_numpy(),
+                        # 0 means the race never reached the category ranking
+                        'Category Rank': category_rank.where(category_rank > 0).astype('Int32').array,
+                        'Reason': swimmer_events['Reason'].astype(str).to_numpy(),
                     })
                 
-                    # Reorder columns and remove numeric rank
-                    event_display = event_display[['Included', 'Event #', 'Event', 'Category', 'Time', 'FINA Points']]
-                
                     st.markdown(f"**Total Events Competed: {len(swimmer_events)}**")
                 
-                    # Reset index for cleaner display
-                    event_display_clean = event_display.reset_index(drop=True)
-                
-                    # Conditional highlight: lightly highlight included rows
-                    def _highlight_row(row: pd.Series):
-                        return ['background-color: #e8f7ee' if row.get('Included', '') == '✅' else '' for _ in row]
+                    # Lightly highlight included rows: one style table built from the
+                    # Included column, not a Python call per row
+                    def _highlight_included(df: pd.DataFrame) -> pd.DataFrame:
+                        row_styles = np.where(df['Included'].to_numpy(), 'background-color: #e8f7ee', '')
+                        return pd.DataFrame(np.repeat(row_styles[:, None], df.shape[1], axis=1),
+                                            index=df.index, columns=df.columns)
                     try:
-                        styled = event_display_clean.style.apply(_highlight_row, axis=1)
+                        styled = event_display_clean.style.apply(_highlight_included, axis=None)
                         st.dataframe(styled, height=400, use_container_width=True)
                     except Exception:
                         st.dataframe(event_display_clean, height=400, use_container_width=True)
@@ -1037,34 +638,27 @@ def main():
 
                     st.markdown(' View number of included events counted by event category (only those used in scoring)')
 
-                    # Interactive category chips with hover details
+                    # Interactive category chips with hover details. The ranked races
+                    # (best per event, Category_Rank > 0) are labelled in one pass and
+                    # grouped once; a dot marks those included in scoring.
+                    ranked = swimmer_events[swimmer_events['Category_Rank'] > 0].sort_values('Category_Rank', kind='stable')
+                    dots = pd.Series(np.where(ranked['Included'].to_numpy(dtype=bool), "<span class='cat-dot'></span>", ''),
+                                     index=ranked.index)
+                    items = ("<div class='cat-tooltip-item'>• " + dots + ranked['Event Number'].astype(str) + ' - '
+                             + ranked['Event Name'].astype(str) + ' (' + ranked['WA Points'].astype(str) + ' pts)</div>')
+                    tooltips = items.groupby(ranked['Event Category'].astype(str), sort=False).agg(''.join)
                     chip_html_parts = ["<div class='cat-chip-wrap'>"]
                     for cat in ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']:
-                        cat_df = swimmer_events[swimmer_events['Event Category'] == cat].copy()
-                        if len(cat_df) == 0:
+                        if cat not in tooltips.index:
                             continue
-                        # Best per event number, sorted by points
-                        cat_df = cat_df.drop_duplicates(subset=['Event Number'], keep='first')
-                        cat_df = cat_df.sort_values('WA Points', ascending=False)
-                        # mark included with star
-                        def label_row(r):
-                            included = str(r['Event Number']) in included_event_numbers
-                            dot = "<span class='cat-dot'></span>" if included else ""
-                            return f"{dot}{int(r['Event Number'])} - {r['Event Name']} ({int(r['WA Points'])} pts)"
-                        items = [label_row(r) for _, r in cat_df.iterrows()]
-                        tooltip_items = ''.join([f"<div class='cat-tooltip-item'>• {it}</div>" for it in items])
                         chip_html_parts.append(
-                            f"<div class='cat-chip'>{cat}<div class='cat-tooltip'><div class='cat-tooltip-title'>{cat} events</div>{tooltip_items}<div class='cat-tooltip-note'><span class='cat-dot'></span> indicates events included in scoring</div></div></div>"
+                            f"<div class='cat-chip'>{cat}<div class='cat-tooltip'><div class='cat-tooltip-title'>{cat} events</div>{tooltips[cat]}<div class='cat-tooltip-note'><span class='cat-dot'></span> indicates events included in scoring</div></div></div>"
                         )
                     chip_html_parts.append("</div>")
                     st.markdown(''.join(chip_html_parts), unsafe_allow_html=True)
                     
                     # Filter to only INCLUDED events for category stats
-                    swimmer_events_included = swimmer_events.copy()
-                    swimmer_events_included['__included'] = swimmer_events_included['Event Number'].astype(str).apply(
-                        lambda x: x in included_event_numbers
-                    )
-                    swimmer_events_included = swimmer_events_included[swimmer_events_included['__included']]
+                    swimmer_events_included = swimmer_events[swimmer_events['Included']]
                     
                     # Calculate statistics for each category (only included events)
                     category_stats = swimmer_events_included.groupby('Event Category').agg({
@@ -1120,12 +714,8 @@ def main():
         with st.expander("🏁 Event Rankings - View All Swimmers by Event", expanded=True):
             st.markdown('<h3 class="wsc-h3">Select an Event to View Rankings</h3>', unsafe_allow_html=True)
             
-            # Filter events by selected gender first
-            df_gender_events = df_all_with_gender[df_all_with_gender['Gender'] == gender_filter_value].copy()
-            
-            # Get unique events for the selected gender
-            event_options = df_gender_events[['Event Number', 'Event Name']].drop_duplicates().sort_values('Event Number')
-            event_list = [f"{row['Event Number']} - {row['Event Name']}" for _, row in event_options.iterrows()]
+            # Events swum by the selected gender
+            event_list = [f"{number} - {name}" for number, name in index.event_options(gender_filter_value)]
             
             selected_event = st.selectbox(
                 "Choose an event:",
@@ -1137,62 +727,17 @@ def main():
                 # Extract event number
                 event_num = selected_event.split(' - ')[0].strip()
                 
-                # Get all swimmers for this event from the selected gender
-                event_swimmers = df_gender_events[df_gender_events['Event Number'].astype(str) == event_num].copy()
+                # All swimmers for this event from the selected gender, best first
+                event_swimmers = index.event_rows(event_num, gender_filter_value)
                 
                 # Apply age filter if not 'All'
                 if selected_age != 'All':
-                    if selected_age == '16+':
-                        event_swimmers = event_swimmers[event_swimmers['Age'] >= 16]
-                    else:
-                        event_swimmers = event_swimmers[event_swimmers['Age'] == int(selected_age)]
+                    event_swimmers = event_swimmers[event_swimmers['Age'].map(age_bucket) == selected_age]
                 
                 if len(event_swimmers) > 0:
-                    # Sort by WA Points descending (best performance first)
-                    event_swimmers = event_swimmers.sort_values('WA Points', ascending=False)
-                    
-                    # Add rank
-                    event_swimmers['Rank'] = range(1, len(event_swimmers) + 1)
-                    
-                    # Format time for rankings to hh:mm:ss.hh
-                    def format_time_event(time_val):
-                        if pd.isna(time_val) or time_val is None or time_val == '':
-                            return '-'
-                        s = str(time_val).strip()
-                        if s == '-':
-                            return '-'
-                        import re
-                        if re.match(r"^\d{2}:\d{2}:\d{2}\.\d{2}$", s):
-                            return s
-                        m = re.match(r"^(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,2}))?$", s)
-                        if m:
-                            hh = int(m.group(1)); mm = int(m.group(2)); ss = int(m.group(3)); hs = int(m.group(4)) if m.group(4) else 0
-                            return f"{hh:02d}:{mm:02d}:{ss:02d}.{hs:02d}"
-                        m = re.match(r"^(\d{1,2}):(\d{1,2})(?:\.(\d{1,2}))?$", s)
-                        if m:
-                            mm = int(m.group(1)); ss = int(m.group(2)); hs = int(m.group(3)) if m.group(3) else 0
-                            return f"00:{mm:02d}:{ss:02d}.{hs:02d}"
-                        m = re.match(r"^(\d{1,2})\.(\d{1,2})$", s)
-                        if m:
-                            ss = int(m.group(1)); hs = int(m.group(2))
-                            return f"00:00:{ss:02d}.{hs:02d}"
-                        if re.match(r"^\d+$", s):
-                            ss = int(s)
-                            return f"00:00:{ss:02d}.00"
-                        if re.match(r"^\d+\.\d+$", s):
-                            parts = s.split('.')
-                            ss = int(parts[0]); hs = int(parts[1])
-                            return f"00:00:{ss:02d}.{hs:02d}"
-                        return s
-                    
-                    event_swimmers['Time'] = event_swimmers['Time'].apply(format_time_event)
-                    # Enforce 2-decimal display even if upstream produced microseconds
-                    try:
-                        event_swimmers['Time'] = event_swimmers['Time'].astype(str).str.replace(
-                            r'^(\d{2}:\d{2}:\d{2})\.(\d{2}).*$', r'\1.\2', regex=True
-                        )
-                    except Exception:
-                        pass
+                    # Add rank, and format time for rankings to hh:mm:ss.hh
+                    event_swimmers = event_swimmers.assign(Rank=range(1, len(event_swimmers) + 1),
+                                                           Time=format_times(event_swimmers[TIME_COLUMN]))
                     
                     # Display event information
                     st.markdown(f"**Event:** {selected_event}")
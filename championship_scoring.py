@@ -0,0 +1,531 @@
+"""
+Championship Scoring
+====================
+
+The club championship selection rules, applied once per run. The selection
+table built here has one row per result (swimmer-event) recording whether the
+race counts towards the swimmer's total, why not when it doesn't, and where it
+ranked. Scoreboards, narratives and the dashboard all summarise this table
+rather than re-running the selection themselves. Swimmers are grouped by
+their integer swimmer_id (see swimmer_identity), never by name.
+
+Rules:
+- Worcester/WORM swimmers in events of known gender only
+- Best score per event (a repeated event counts once)
+- Maximum 2 races per category (all ages)
+- The best 8 remaining races count
+
+IncrementalScorer keeps the table for a meet and, when events are added or
+corrected, re-scores only the swimmers in them.
+
+Usage:
+    from championship_scoring import build_selection_table, summarise_selection
+
+    selection = build_selection_table(df_all, event_gender_map)
+    df_champs = summarise_selection(selection)
+    selection[selection['swimmer_id'] == 42][['Event Name', 'Included', 'Reason']]
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from event_descriptor import CATEGORIES, GENDER_FEMALE, GENDER_MALE_OPEN, GENDER_UNKNOWN
+from swimmer_identity import MISSING_ID, SWIMMER_ID, SwimmerIndex
+
+# Championship scoring rules
+CLUBS = ('Worcester', 'WORM')
+MAX_PER_CATEGORY = 2
+MAX_SCORING_EVENTS = 8
+
+_CATEGORY_ORDER = {category: i for i, category in enumerate(CATEGORIES)}
+_CATEGORY_COUNT_COLUMNS = ('Sprint_Events', 'Free_Events', 'Form_100_Events', 'Form_200_Events',
+                           'IM_Events', 'Distance_Events')
+SCORE_COLUMNS = ['Name', 'Age', 'Gender', 'Club',
+                 'Total_Points', 'Average_Points', 'Best_Event_Points', 'Events_Count',
+                 'Categories_Competed', *_CATEGORY_COUNT_COLUMNS, SWIMMER_ID]
+NARRATIVE_COLUMNS = ['Name', 'Age', 'Gender', 'Total_Points', 'IncludedShort',
+                     'Average_Points', 'Best_Event_Points', 'Narrative', SWIMMER_ID]
+
+# Trophies: one per single age 9-15 and one for 16 and over, per gender
+TROPHY_AGES = (9, 10, 11, 12, 13, 14, 15, '16+')
+TROPHY_GENDERS = (GENDER_MALE_OPEN, GENDER_FEMALE)
+SCOREBOARD_COLUMNS = ['Age', 'Name', 'Club', 'Total_Points', 'Average_Points',
+                      'Best_Event_Points', 'Events_Count', 'Categories_Competed', *_CATEGORY_COUNT_COLUMNS,
+                      SWIMMER_ID]
+WINNER_COLUMNS = ['Age', 'Gender', 'Winner', 'Club', 'Total Points', 'Events', 'Categories']
+
+# Why a row does or doesn't count, in the order the rules are applied (reversed)
+REASON_INCLUDED = 'included'
+REASON_OUTSIDE_TOP = 'outside top 8'
+REASON_CATEGORY_CAP = 'over category cap'
+REASON_DUPLICATE = 'duplicate event'
+REASON_NO_CATEGORY = 'no category'
+REASON_NOT_ELIGIBLE = 'not eligible'
+REASONS = (REASON_INCLUDED, REASON_OUTSIDE_TOP, REASON_CATEGORY_CAP,
+           REASON_DUPLICATE, REASON_NO_CATEGORY, REASON_NOT_ELIGIBLE)
+# Columns build_selection_table adds to the events frame
+SELECTION_COLUMNS = ['Included', 'Reason', 'Category_Rank', 'Scoring_Rank']
+
+
+def scoring_rules() -> Dict:
+    """The championship rules as JSON-friendly values, for fingerprinting results."""
+    return {'clubs': list(CLUBS), 'max_per_category': MAX_PER_CATEGORY, 'max_scoring_events': MAX_SCORING_EVENTS}
+
+
+def build_selection_table(df_all: pd.DataFrame,
+                          event_gender_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Apply the championship rules to every result row.
+
+    Each swimmer's races are ranked by WA Points (ties go to the lower event
+    number, then file order),
+    deduplicated per event, capped at 2 per category, then capped at 8 overall
+    with equal points going to the earlier category.
+
+    Args:
+        df_all: Dataframe with all events (not modified); rows without a
+            SWIMMER_ID column get ids from a fresh SwimmerIndex
+        event_gender_map: Mapping of event numbers to gender; when None the
+            frame's own Gender column is used
+
+    Returns:
+        Copy of df_all in event-number order (file order within an event,
+        index labels kept) with Gender and SWIMMER_ID set and these columns added:
+        Included (bool), Reason (one of REASONS), Category_Rank (1-based rank
+        within the swimmer's category after deduplication) and Scoring_Rank
+        (1-based rank among the swimmer's capped races; included when <= 8).
+        Ranks are 0 for rows that did not reach that stage.
+    """
+    # Canonical row order, so ties resolve the same however the events were
+    # loaded (directory order) or patched in (IncrementalScorer)
+    event_codes, event_numbers = _sorted_codes(df_all['Event Number'].astype(str))
+    # A meet has few events: 16-bit codes let numpy use its radix sort
+    sort_codes = event_codes.astype(np.int16) if len(event_numbers) < np.iinfo(np.int16).max else event_codes
+    order = np.argsort(sort_codes, kind='stable')
+    event_codes = event_codes[order]
+    selection = df_all.take(order)
+    selection['Event Number'] = selection['Event Number'].astype(str)
+    if SWIMMER_ID not in selection.columns:
+        selection[SWIMMER_ID] = SwimmerIndex().assign(selection)
+    if event_gender_map is not None:
+        event_genders = np.asarray(event_numbers.map(event_gender_map), dtype=object)
+        gender_codes, genders = pd.factorize(event_genders, sort=True)
+        gender_codes = np.append(gender_codes, -1)[event_codes]
+        # Categorical: one lookup per event instead of one string per row
+        selection['Gender'] = pd.Categorical.from_codes(gender_codes, categories=genders)
+    elif 'Gender' not in selection.columns:
+        selection['Gender'] = GENDER_UNKNOWN
+    selection['WA Points'] = pd.to_numeric(selection['WA Points'], errors='coerce').fillna(0).astype(int)
+    selection['Age'] = pd.to_numeric(selection['Age'], errors='coerce').fillna(0).astype(int)
+
+    # Work on integer codes rather than strings; -1 marks missing values
+    swimmer_codes, _ = _swimmer_codes(selection[SWIMMER_ID])
+    cat_codes = _category_codes(selection['Event Category'])
+    points = selection['WA Points'].to_numpy(dtype=np.int64)
+
+    n = len(selection)
+    reason = np.full(n, REASONS.index(REASON_NOT_ELIGIBLE), dtype=np.int8)
+    category_rank = np.zeros(n, dtype=np.int64)
+    scoring_rank = np.zeros(n, dtype=np.int64)
+
+    # Unknown gender entries and other clubs' swimmers never score (missing
+    # genders are not excluded, matching a != 'Unknown' filter)
+    eligible = (~(selection['Gender'] == GENDER_UNKNOWN).to_numpy(dtype=bool, na_value=False)
+                & selection['Club'].isin(CLUBS).to_numpy() & (swimmer_codes >= 0))
+    reason[eligible] = REASONS.index(REASON_NO_CATEGORY)
+    rows = np.flatnonzero(eligible & (cat_codes >= 0))
+
+    if len(rows):
+        # Best score first within each swimmer; equal points go to the earlier
+        # category, then keep row order. Later steps only drop rows, so this
+        # is also the order the top 8 are picked in.
+        n_cats = len(CATEGORIES)
+        desc_points = points.max() - points
+        span = int(desc_points.max()) + 1
+        rows = rows[np.argsort((swimmer_codes[rows] * span + desc_points[rows]) * n_cats + cat_codes[rows],
+                               kind='stable')]
+
+        # Keep only the best score per unique event
+        duplicate = pd.Series(swimmer_codes[rows] * (len(event_numbers) + 1) + event_codes[rows]).duplicated().to_numpy()
+        reason[rows[duplicate]] = REASONS.index(REASON_DUPLICATE)
+        rows = rows[~duplicate]
+
+        # Max 2 races per category for all ages
+        swimmer_cat = swimmer_codes[rows] * n_cats + cat_codes[rows]
+        rank = np.empty(len(rows), dtype=np.int64)
+        order = np.argsort(swimmer_cat, kind='stable')
+        rank[order] = _rank_in_sorted_groups(swimmer_cat[order])
+        category_rank[rows] = rank + 1
+        over_cap = rank >= MAX_PER_CATEGORY
+        reason[rows[over_cap]] = REASONS.index(REASON_CATEGORY_CAP)
+        rows = rows[~over_cap]
+
+        # Top 8 per swimmer, in the order sorted above
+        rank = _rank_in_sorted_groups(swimmer_codes[rows])
+        scoring_rank[rows] = rank + 1
+        reason[rows] = np.where(rank < MAX_SCORING_EVENTS,
+                                REASONS.index(REASON_INCLUDED), REASONS.index(REASON_OUTSIDE_TOP))
+
+    selection['Included'] = reason == REASONS.index(REASON_INCLUDED)
+    selection['Reason'] = pd.Categorical.from_codes(reason, categories=REASONS)
+    selection['Category_Rank'] = category_rank
+    selection['Scoring_Rank'] = scoring_rank
+    return selection
+
+
+def summarise_selection(selection: pd.DataFrame, include_unscored: bool = False) -> pd.DataFrame:
+    """
+    Total each swimmer's included races into the championship score table.
+
+    Args:
+        selection: Table from build_selection_table
+        include_unscored: Also return eligible swimmers with no scoring races
+            (zero totals); by default only swimmers with a score are listed
+
+    Returns:
+        Dataframe with SCORE_COLUMNS, one row per swimmer sorted by name
+        (then swimmer_id, so namesakes keep a fixed order)
+    """
+    swimmer_codes, swimmer_ids = _swimmer_codes(selection[SWIMMER_ID])
+    eligible_rows = np.flatnonzero((selection['Reason'] != REASON_NOT_ELIGIBLE).to_numpy() & (swimmer_codes >= 0))
+    if len(eligible_rows) == 0:
+        # If no swimmers qualified, return an empty DataFrame with expected columns
+        return pd.DataFrame(columns=SCORE_COLUMNS)
+
+    n_swimmers, n_cats = len(swimmer_ids), len(CATEGORIES)
+    points = selection['WA Points'].to_numpy(dtype=np.int64)
+    cat_codes = _category_codes(selection['Event Category'])
+    included = np.flatnonzero(selection['Included'].to_numpy(dtype=bool))
+    top_swimmers = swimmer_codes[included]
+
+    events_count = np.bincount(top_swimmers, minlength=n_swimmers)
+    total_points = np.bincount(top_swimmers, weights=points[included], minlength=n_swimmers).astype(np.int64)
+    average_points = np.divide(total_points, events_count, out=np.zeros(n_swimmers), where=events_count > 0)
+    best_points = np.zeros(n_swimmers, dtype=np.int64)
+    best = np.flatnonzero(selection['Scoring_Rank'].to_numpy() == 1)
+    best_points[swimmer_codes[best]] = points[best]
+    category_counts = np.bincount(top_swimmers * n_cats + cat_codes[included],
+                                  minlength=n_swimmers * n_cats).reshape(n_swimmers, n_cats)
+    # Number of categories competed (informational only) counts all candidates
+    candidates = np.flatnonzero(selection['Category_Rank'].to_numpy() > 0)
+    num_categories = (np.bincount(swimmer_codes[candidates] * n_cats + cat_codes[candidates],
+                                  minlength=n_swimmers * n_cats).reshape(n_swimmers, n_cats) > 0).sum(axis=1)
+
+    if include_unscored:
+        swimmers = np.unique(swimmer_codes[eligible_rows])
+    else:
+        swimmers = np.flatnonzero(events_count)
+
+    # Swimmer info (name included) from their first eligible row; gender is the most common
+    # one (ties broken alphabetically, like Series.mode)
+    first = pd.Series(swimmer_codes[eligible_rows]).drop_duplicates()
+    first_row = np.zeros(n_swimmers, dtype=np.int64)
+    first_row[first.to_numpy()] = eligible_rows[first.index.to_numpy()]
+    first_row = first_row[swimmers]
+    gender_codes, genders = pd.factorize(selection['Gender'], sort=True)
+    counted = eligible_rows[gender_codes[eligible_rows] >= 0]
+    n_genders = max(len(genders), 1)
+    gender_counts = np.bincount(swimmer_codes[counted] * n_genders + gender_codes[counted],
+                                minlength=n_swimmers * n_genders).reshape(n_swimmers, n_genders)[swimmers]
+    gender = np.asarray(genders, dtype=object).take(gender_counts.argmax(axis=1), mode='clip')
+    gender = np.where(gender_counts.max(axis=1) > 0, gender, None)
+
+    results = pd.DataFrame({
+        'Name': pd.Series(selection['Name'].array.take(first_row)).astype(str),
+        'Age': selection['Age'].to_numpy()[first_row],
+        'Gender': gender,
+        'Club': pd.Series(selection['Club'].array.take(first_row)).astype(str),
+        'Total_Points': total_points[swimmers],
+        'Average_Points': average_points[swimmers],
+        'Best_Event_Points': best_points[swimmers],
+        'Events_Count': events_count[swimmers],
+        'Categories_Competed': num_categories[swimmers],
+    })
+    # Count events per category
+    for i, column in enumerate(_CATEGORY_COUNT_COLUMNS):
+        results[column] = category_counts[swimmers, i]
+    results[SWIMMER_ID] = swimmer_ids[swimmers]
+    return results.sort_values(['Name', SWIMMER_ID], kind='stable').reset_index(drop=True)
+
+
+def narrate_selection(selection: pd.DataFrame) -> pd.DataFrame:
+    """
+    Describe, in plain English, which of each swimmer's races count and why.
+
+    Args:
+        selection: Table from build_selection_table
+
+    Returns:
+        Dataframe with NARRATIVE_COLUMNS, one row per eligible swimmer sorted
+        by name then swimmer_id. IncludedShort is the compact included-events list used for
+        chart tooltips; Narrative adds totals and the excluded races.
+    """
+    scores = summarise_selection(selection, include_unscored=True)
+    if len(scores) == 0:
+        return pd.DataFrame(columns=NARRATIVE_COLUMNS)
+
+    # Ranked races in category order, best first within each category
+    ranked = selection[selection['Category_Rank'] > 0]
+    ranked = ranked.assign(_cat=_category_codes(ranked['Event Category']))
+    ranked = ranked.sort_values([SWIMMER_ID, '_cat', 'Category_Rank'], kind='stable')
+
+    # swimmer id -> ({category: [included races]}, [over the category cap], [(rank, outside top 8)])
+    details: Dict[int, Tuple[Dict[str, List[str]], List[str], List[Tuple[int, str]]]] = {}
+    for swimmer_id, event, category, points, reason, rank in zip(
+            ranked[SWIMMER_ID], ranked['Event Name'], ranked['Event Category'],
+            ranked['WA Points'], ranked['Reason'], ranked['Scoring_Rank']):
+        included_by_cat, over_cap, outside_top = details.setdefault(swimmer_id, ({}, [], []))
+        if reason == REASON_INCLUDED:
+            included_by_cat.setdefault(category, []).append(f"{event} – {int(points)} pts")
+        elif reason == REASON_CATEGORY_CAP:
+            over_cap.append(f"{event} ({int(points)} pts)")
+        else:
+            outside_top.append((rank, f"{event} – {int(points)} pts"))
+
+    included_short, narratives = [], []
+    for swimmer_id, total, average, best in zip(scores[SWIMMER_ID], scores['Total_Points'],
+                                                scores['Average_Points'], scores['Best_Event_Points']):
+        included_by_cat, over_cap, outside_top = details.get(swimmer_id, ({}, [], []))
+        parts = [f"{cat} (" + _join(included_by_cat[cat], 2) + ")" for cat in CATEGORIES if cat in included_by_cat]
+        included_sentence = _join(parts, 4) if parts else "no events yet counted"
+
+        reason_bits = []
+        if over_cap:
+            reason_bits.append("some races exceeded the per‑category limit: " + _join(over_cap, 3))
+        if outside_top:
+            reason_bits.append("others were just outside the swimmer’s top eight: "
+                               + _join([text for _, text in sorted(outside_top)], 3))
+        reasons_sentence = ("; ".join(reason_bits) + ".") if reason_bits else "All eligible races are currently counted."
+
+        included_short.append(included_sentence)
+        narratives.append(
+            f"{total} points from the top eight races (average {average:.1f}, best {best}). "
+            f"Included: {included_sentence}. {reasons_sentence}"
+        )
+
+    scores['IncludedShort'] = included_short
+    scores['Narrative'] = narratives
+    return scores[NARRATIVE_COLUMNS]
+
+
+def rank_scoreboard(scores: pd.DataFrame, gender: str) -> pd.DataFrame:
+    """
+    One gender's scoreboard rows, sorted by age then total points (highest first).
+
+    Args:
+        scores: Score table from summarise_selection
+        gender: 'Male/Open' or 'Female'
+    """
+    return scores[scores['Gender'] == gender].sort_values(['Age', 'Total_Points'], ascending=[True, False])
+
+
+def trophy_age(age: int) -> Optional[Union[int, str]]:
+    """Trophy age group for an age: the age itself for 9-15, '16+' from 16, None below 9."""
+    if age >= 16:
+        return '16+'
+    return age if age in TROPHY_AGES else None
+
+
+def age_group_winners(scores: pd.DataFrame,
+                      groups: Optional[Iterable[Tuple[Union[int, str], str]]] = None) -> pd.DataFrame:
+    """
+    Highest total per trophy age group and gender.
+
+    Args:
+        scores: Score table from summarise_selection (sorted by name, so equal
+            totals go to the first name alphabetically)
+        groups: Only decide these (trophy age, gender) pairs; all when None
+
+    Returns:
+        Dataframe with WINNER_COLUMNS in TROPHY_AGES, then TROPHY_GENDERS order
+    """
+    wanted = None if groups is None else set(groups)
+    winners = []
+    for age in TROPHY_AGES:
+        for gender in TROPHY_GENDERS:
+            if wanted is not None and (age, gender) not in wanted:
+                continue
+            in_age = scores['Age'] >= 16 if age == '16+' else scores['Age'] == age
+            age_gender = scores[in_age & (scores['Gender'] == gender)]
+            if len(age_gender) > 0:
+                winner = age_gender.nlargest(1, 'Total_Points').iloc[0]
+                winners.append({
+                    'Age': age,
+                    'Gender': gender,
+                    'Winner': winner['Name'],
+                    'Club': winner['Club'],
+                    'Total Points': winner['Total_Points'],
+                    'Events': winner['Events_Count'],
+                    'Categories': winner['Categories_Competed']
+                })
+    return pd.DataFrame(winners, columns=WINNER_COLUMNS)
+
+
+class IncrementalScorer:
+    """
+    Championship results for a meet, re-scored per event change.
+
+    The rules only ever compare a swimmer's own races, so when events change
+    only the swimmers with rows in them (before or after the change) need
+    their selection rebuilt. Their selection rows are spliced into the table,
+    their score and narrative rows replaced, the boys/girls scoreboards merged
+    and only the trophy groups they were or are now in re-decided. With the
+    selection's canonical row order this matches a full recompute over the
+    same events exactly.
+
+    Usage:
+        scorer = IncrementalScorer(df_all, event_gender_map, swimmers)
+        scorer.update_events(df_event_205)
+        scorer.scores, scorer.boys, scorer.girls, scorer.winners
+    """
+
+    def __init__(self, df_all: pd.DataFrame, event_gender_map: Dict[str, str],
+                 swimmers: Optional[SwimmerIndex] = None):
+        """
+        Score every swimmer once.
+
+        Args:
+            df_all: Dataframe with all events
+            event_gender_map: Mapping of event numbers to gender
+            swimmers: Swimmer index used to identify rows, here and in every
+                update (a fresh in-memory one when None)
+        """
+        self.event_gender_map = dict(event_gender_map)
+        self.swimmers = swimmers if swimmers is not None else SwimmerIndex()
+        self.df_all = df_all.reset_index(drop=True)
+        self.df_all[SWIMMER_ID] = self.swimmers.assign(self.df_all)
+        self.selection = build_selection_table(self.df_all, self.event_gender_map)
+        self.scores = summarise_selection(self.selection)
+        self.narratives = narrate_selection(self.selection)
+        self.boys = rank_scoreboard(self.scores, GENDER_MALE_OPEN).reset_index(drop=True)
+        self.girls = rank_scoreboard(self.scores, GENDER_FEMALE).reset_index(drop=True)
+        self.winners = age_group_winners(self.scores)
+
+    def update_events(self, df_events: pd.DataFrame, event_numbers: Optional[Iterable[str]] = None,
+                      event_gender_map: Optional[Dict[str, str]] = None) -> Set[int]:
+        """
+        Replace whole events and re-score only the swimmers they touch.
+
+        Args:
+            df_events: Complete new rows of the changed events (may be empty)
+            event_numbers: Every changed event, including deleted ones;
+                defaults to the events present in df_events
+            event_gender_map: Updated event -> gender map (e.g. with new events
+                added); the current map is kept when None
+
+        Returns:
+            Ids of the swimmers that were re-scored
+        """
+        events = set() if event_numbers is None else {str(n) for n in event_numbers}
+        if len(df_events):
+            events |= set(df_events['Event Number'].astype(str))
+        if event_gender_map is not None:
+            self.event_gender_map = dict(event_gender_map)
+
+        # New rows get fresh, increasing labels so label order stays file order
+        start = int(self.df_all.index.max()) + 1 if len(self.df_all) else 0
+        df_events = df_events.set_axis(pd.RangeIndex(start, start + len(df_events)))
+        df_events = df_events.assign(**{SWIMMER_ID: self.swimmers.assign(df_events)})
+
+        old_rows = self.df_all['Event Number'].astype(str).isin(events).to_numpy()
+        swimmer_ids = set(self.df_all.loc[old_rows, SWIMMER_ID].tolist()) | set(df_events[SWIMMER_ID].tolist())
+        swimmer_ids.discard(MISSING_ID)
+        in_swimmers = self.df_all[SWIMMER_ID].isin(swimmer_ids).to_numpy()
+        # Selection rows share df_all's labels: rebuild the changed events'
+        # rows and every other race of the swimmers in them
+        stale = self.df_all.index[old_rows | in_swimmers]
+        other_races = self.df_all[in_swimmers & ~old_rows]
+        self.df_all = pd.concat([self.df_all[~old_rows], df_events])
+
+        rescored = build_selection_table(pd.concat([other_races, df_events]), self.event_gender_map)
+        spliced = pd.concat([self.selection[~self.selection.index.isin(stale)], rescored]).sort_index()
+        event_codes, _ = _sorted_codes(spliced['Event Number'])
+        self.selection = spliced.take(np.argsort(event_codes, kind='stable'))
+        if not swimmer_ids:
+            return swimmer_ids
+
+        # Trophy groups the swimmers were in before the change...
+        touched = self._trophy_groups(swimmer_ids)
+        scores = summarise_selection(rescored)
+        name_order = (['Name', SWIMMER_ID], [True, True])
+        self.scores = _replace_swimmers(self.scores, swimmer_ids, scores, *name_order)
+        self.narratives = _replace_swimmers(self.narratives, swimmer_ids, narrate_selection(rescored), *name_order)
+        # Same order as rank_scoreboard over name-sorted scores
+        board_order = (['Age', 'Total_Points', 'Name', SWIMMER_ID], [True, False, True, True])
+        self.boys = _replace_swimmers(self.boys, swimmer_ids, rank_scoreboard(scores, GENDER_MALE_OPEN), *board_order)
+        self.girls = _replace_swimmers(self.girls, swimmer_ids, rank_scoreboard(scores, GENDER_FEMALE), *board_order)
+
+        # ...and after it; no other trophy can change hands
+        touched |= self._trophy_groups(swimmer_ids)
+        if touched:
+            kept = self.winners[[(age, gender) not in touched
+                                 for age, gender in zip(self.winners['Age'], self.winners['Gender'])]]
+            winners = pd.concat([kept, age_group_winners(self.scores, touched)], ignore_index=True)
+            group_order = [TROPHY_AGES.index(age) * len(TROPHY_GENDERS) + TROPHY_GENDERS.index(gender)
+                           for age, gender in zip(winners['Age'], winners['Gender'])]
+            self.winners = winners.take(np.argsort(group_order, kind='stable')).reset_index(drop=True)
+        return swimmer_ids
+
+    def _trophy_groups(self, swimmer_ids: Set[int]) -> Set[Tuple[Union[int, str], str]]:
+        """(trophy age, gender) pairs of the given swimmers in the current scores."""
+        rows = self.scores[self.scores[SWIMMER_ID].isin(swimmer_ids)]
+        return {(trophy_age(age), gender) for age, gender in zip(rows['Age'], rows['Gender'])
+                if trophy_age(age) is not None and gender in TROPHY_GENDERS}
+
+
+def _replace_swimmers(frame: pd.DataFrame, swimmer_ids: Set[int], rows: pd.DataFrame,
+                      by: List[str], ascending: List[bool]) -> pd.DataFrame:
+    """Swap the given swimmers' rows in frame for rows, keeping frame sorted by `by`."""
+    merged = pd.concat([frame[~frame[SWIMMER_ID].isin(swimmer_ids)], rows], ignore_index=True)
+    return merged.sort_values(by, ascending=ascending, kind='stable').reset_index(drop=True)
+
+
+def _join(items: List[str], max_items: int) -> str:
+    """Natural-language join: 'a, b and c', or 'a, b and 2 more' past max_items."""
+    items = [i for i in items if i]
+    if not items:
+        return ''
+    if len(items) > max_items:
+        return ", ".join(items[:max_items]) + f" and {len(items) - max_items} more"
+    if len(items) == 1:
+        return items[0]
+    return ", ".join(items[:-1]) + f" and {items[-1]}"
+
+
+def _sorted_codes(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Factorize with codes in sorted order of the values (-1 for missing)."""
+    codes, uniques = pd.factorize(values)
+    order = uniques.argsort()
+    rank = np.empty(len(uniques), dtype=np.int64)
+    rank[order] = np.arange(len(uniques))
+    codes = np.where(codes >= 0, rank[np.maximum(codes, 0)], -1)
+    return codes, uniques.take(order)
+
+
+def _swimmer_codes(swimmer_ids: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Dense codes for swimmer ids (-1 for rows without a swimmer) and the id of each code."""
+    ids = swimmer_ids.to_numpy(dtype=np.int64, na_value=MISSING_ID)
+    valid = ids != MISSING_ID
+    codes = np.full(len(ids), -1, dtype=np.int64)
+    if not valid.any():
+        return codes, np.empty(0, dtype=np.int32)
+    # Ids are small non-negative integers: a lookup table is much cheaper than hashing
+    present = np.zeros(ids[valid].max() + 1, dtype=bool)
+    present[ids[valid]] = True
+    codes[valid] = (np.cumsum(present) - 1)[ids[valid]]
+    return codes, np.flatnonzero(present).astype(np.int32)
+
+
+def _category_codes(values: pd.Series) -> np.ndarray:
+    """Position of each row's category in CATEGORIES (-1 for anything else)."""
+    codes, categories = pd.factorize(values)
+    cat_order = np.array([_CATEGORY_ORDER.get(c, -1) for c in categories] + [-1], dtype=np.int64)
+    return cat_order[codes]
+
+
+def _rank_in_sorted_groups(sorted_keys: np.ndarray) -> np.ndarray:
+    """0-based position of each element within its run of equal (sorted) keys."""
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    return np.arange(len(sorted_keys)) - np.repeat(starts, np.diff(np.r_[starts, len(sorted_keys)]))
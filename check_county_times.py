@@ -8,51 +8,9 @@ import pandas as pd
 import re
 from datetime import datetime
 
-def time_to_seconds(time_str):
-    """Convert time string to seconds for comparison"""
-    if pd.isna(time_str):
-        return float('inf')
-    
-    time_str = str(time_str).strip()
-    
-    # Handle HH:MM:SS.HH format (e.g., 00:02:31.75)
-    match = re.match(r'(\d{2}):(\d{2}):(\d{2})\.(\d{2})', time_str)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2))
-        seconds = int(match.group(3))
-        hundredths = int(match.group(4))
-        return hours * 3600 + minutes * 60 + seconds + hundredths / 100
-    
-    # Handle MM:SS.HH format (e.g., 02:31.75)
-    match = re.match(r'(\d+):(\d{2})\.(\d{2})', time_str)
-    if match:
-        minutes = int(match.group(1))
-        seconds = int(match.group(2))
-        hundredths = int(match.group(3))
-        return minutes * 60 + seconds + hundredths / 100
-    
-    # Handle SS.HH format (e.g., 31.75)
-    match = re.match(r'(\d+)\.(\d{2})', time_str)
-    if match:
-        seconds = int(match.group(1))
-        hundredths = int(match.group(2))
-        return seconds + hundredths / 100
-    
-    return float('inf')
-
-def seconds_to_time(seconds):
-    """Convert seconds back to time string"""
-    if seconds == float('inf') or pd.isna(seconds):
-        return ""
-    
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    
-    if minutes > 0:
-        return f"{minutes}:{secs:05.2f}"
-    else:
-        return f"{secs:.2f}"
+from event_descriptor import GENDER_FEMALE, GENDER_MALE_OPEN, describe_event
+from swimmer_identity import SWIMMER_ID, SWIMMER_INDEX_NAME, SwimmerIndex, with_swimmer_ids
+from time_codec import TIME_COLUMN, format_time, format_times, parse_times, with_time_hundredths
 
 def normalize_event_name(event_name):
     """Normalize event names for matching"""
@@ -92,38 +50,37 @@ def get_age_group(age):
         return '17+'
 
 def get_gender_from_event(event_name):
-    """Extract gender from event name"""
-    event_lower = event_name.lower()
-    if 'female' in event_lower:
+    """Extract gender from event name (county standards use 'Male' for Open/Male)"""
+    gender = describe_event(event_name).gender
+    if gender == GENDER_FEMALE:
         return 'Female'
-    elif 'male' in event_lower or 'open' in event_lower:
+    elif gender == GENDER_MALE_OPEN:
         return 'Male'
     return None
 
-def main():
-    # Load swimmer events data
-    print("Loading swimmer data...")
-    events_file = 'WSC_Club_Champs_2025/championship_results/events_all.parquet'
-    df_events = pd.read_parquet(events_file)
-    
-    print(f"✓ Loaded {len(df_events)} swimmer performances")
-    
-    # Load county qualifying times
-    print("\nLoading county qualifying times...")
-    county_file = 'county_times_2026/county_qualifying_times_2026.csv'
-    df_county = pd.read_csv(county_file)
-    
-    print(f"✓ Loaded {len(df_county)} county qualifying standards")
-    
+def compare_with_county_times(df_events, df_county):
+    """
+    Compare every performance with the county standard for its event, gender
+    and 2026 age group.
+
+    Args:
+        df_events: Events with Name, swimmer_id, Event Name, Age, Time and
+            Time_Hundredths columns
+        df_county: County standards with EVENT, GENDER, AGE, TIME and
+            TIME_HUNDREDTHS columns
+
+    Returns:
+        One row per performance with a known gender, sorted by name and event
+    """
     # Prepare data
     results = []
     
-    print("\nAnalyzing performances...")
-    
     for idx, row in df_events.iterrows():
         swimmer_name = row['Name']
+        swimmer_id = row[SWIMMER_ID]
         event_name_full = row['Event Name']
         swimmer_time = row['Time']
+        swimmer_hundredths = row[TIME_COLUMN]
         swimmer_age_2025 = row['Age']
         
         # Age up by 1 year since county times are based on age as of Dec 31, 2026
@@ -161,25 +118,28 @@ def main():
                 'Achieved_County_Time': 'N/A',
                 'Time_Difference': 'N/A',
                 'Percentage_Difference': 'N/A',
-                'Status': 'No standard'
+                'Status': 'No standard',
+                SWIMMER_ID: swimmer_id
             })
         else:
             county_time = county_match.iloc[0]['TIME']
+            county_hundredths = county_match.iloc[0]['TIME_HUNDREDTHS']
             
-            # Convert times to seconds for comparison
-            swimmer_seconds = time_to_seconds(swimmer_time)
-            county_seconds = time_to_seconds(county_time)
-            
-            # Check if achieved (swimmer time must be <= county time)
-            achieved = swimmer_seconds <= county_seconds
-            
-            # Calculate difference (positive = faster than standard, negative = slower)
-            diff_seconds = county_seconds - swimmer_seconds
-            diff_str = seconds_to_time(abs(diff_seconds))
+            # Exact integer comparison (swimmer time must be <= county time);
+            # a missing time never achieves the standard
+            if pd.isna(swimmer_hundredths) or pd.isna(county_hundredths):
+                achieved = False
+                diff_hundredths = None
+                diff_str = ''
+            else:
+                achieved = swimmer_hundredths <= county_hundredths
+                # Difference (positive = faster than standard, negative = slower)
+                diff_hundredths = int(county_hundredths) - int(swimmer_hundredths)
+                diff_str = format_time(abs(diff_hundredths), compact=True)
             
             # Calculate percentage difference
-            if county_seconds > 0:
-                percent_diff = (diff_seconds / county_seconds) * 100
+            if diff_hundredths is not None and county_hundredths > 0:
+                percent_diff = (diff_hundredths / county_hundredths) * 100
             else:
                 percent_diff = 0
             
@@ -201,14 +161,41 @@ def main():
                 'Achieved_County_Time': 'Yes' if achieved else 'No',
                 'Time_Difference': diff_str,
                 'Percentage_Difference': percent_str,
-                'Status': status
+                'Status': status,
+                SWIMMER_ID: swimmer_id
             })
     
     # Create results DataFrame
     df_results = pd.DataFrame(results)
     
     # Sort by name, then event
-    df_results = df_results.sort_values(['Name', 'Event'])
+    df_results = df_results.sort_values(['Name', SWIMMER_ID, 'Event'])
+    
+    return df_results
+
+def main():
+    # Load swimmer events data
+    print("Loading swimmer data...")
+    events_file = 'WSC_Club_Champs_2025/championship_results/events_all.parquet'
+    df_events = with_time_hundredths(pd.read_parquet(events_file))
+    # Display strings are only needed for the output file
+    df_events['Time'] = format_times(df_events[TIME_COLUMN])
+    # Older union files have no swimmer ids; take them from the saved swimmer index
+    df_events = with_swimmer_ids(df_events, SwimmerIndex.load(
+        f'WSC_Club_Champs_2025/championship_results/{SWIMMER_INDEX_NAME}', 2025))
+    
+    print(f"✓ Loaded {len(df_events)} swimmer performances")
+    
+    # Load county qualifying times
+    print("\nLoading county qualifying times...")
+    county_file = 'county_times_2026/county_qualifying_times_2026.csv'
+    df_county = pd.read_csv(county_file)
+    df_county['TIME_HUNDREDTHS'] = parse_times(df_county['TIME'])
+    
+    print(f"✓ Loaded {len(df_county)} county qualifying standards")
+    
+    print("\nAnalyzing performances...")
+    df_results = compare_with_county_times(df_events, df_county)
     
     # Save to CSV
     output_file = 'county_times_2026/county_times_comparison.csv'
@@ -227,14 +214,14 @@ def main():
     print(f"Percentage achieved: {len(achieved)/len(df_results)*100:.1f}%")
     
     # By swimmer
-    swimmers_with_county = achieved['Name'].nunique()
-    total_swimmers = df_results['Name'].nunique()
+    swimmers_with_county = achieved[SWIMMER_ID].nunique()
+    total_swimmers = df_results[SWIMMER_ID].nunique()
     print(f"\nSwimmers with at least one county time: {swimmers_with_county}/{total_swimmers}")
     
     # Top performers (most county times)
     print("\nTop performers by county times achieved:")
-    top_performers = achieved.groupby('Name').size().sort_values(ascending=False).head(10)
-    for i, (name, count) in enumerate(top_performers.items(), 1):
+    top_performers = achieved.groupby(['Name', SWIMMER_ID]).size().sort_values(ascending=False).head(10)
+    for i, ((name, _), count) in enumerate(top_performers.items(), 1):
         print(f"  {i}. {name}: {count} county times")
     
     # Display sample
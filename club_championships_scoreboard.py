@@ -12,49 +12,105 @@ Usage:
     python club_championships_scoreboard.py 2025         # Use WSC_Club_Champs_2025
     python club_championships_scoreboard.py 2026         # Use WSC_Club_Champs_2026
     python club_championships_scoreboard.py my_folder    # Use custom folder path
+    python club_championships_scoreboard.py 2025 --no-cache  # Run every stage
+
+Profiling (add --no-cache to time every stage rather than cache hits):
+    --profile                  Print wall/CPU time, peak RSS and tracemalloc peak per stage
+    --profile=scoreboard.prof  ...and write a cProfile dump (open with pstats/snakeviz)
+    --timings-json FILE        Write the per-stage figures and machine details as JSON
+
+Stages whose inputs are unchanged since the last run are skipped and their
+cached results reused (championship_results/.pipeline_cache/).
 """
 
-import pandas as pd
-import os
-from typing import Dict, List
 import glob
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from championship_scoring import (
+    SCOREBOARD_COLUMNS,
+    age_group_winners,
+    build_selection_table,
+    narrate_selection,
+    rank_scoreboard,
+    scoring_rules,
+    summarise_selection,
+)
+from event_index import EVENT_INDEX_NAME, event_gender, load_event_gender_map
+from event_loader import read_event_csvs
+from pipeline_cache import PIPELINE_CACHE_DIR, PipelineRunner
+from score_artifact import SCORE_ARTIFACT_NAME, SELECTION_ARTIFACT_NAME, write_score_artifact, write_selection_artifact
+from stage_profiler import StageProfiler
+from swimmer_identity import SWIMMER_ID, SWIMMER_INDEX_NAME, SwimmerIndex, meet_year_from_folder
+from time_codec import TIME_COLUMN, TIME_DTYPE, with_time_hundredths
+
+
+# Partitioned Parquet dataset written by `swim_event_extractor.py --format parquet`
+PARQUET_DATASET = 'events_parquet'
+
+
+def _read_parquet_dataset(search_folder: str, columns: List[str] = None,
+                          event_numbers: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+    """Read cleaned_files/events_parquet/ if present, with categoricals decoded to strings.
+
+    Only the given events are read when event_numbers is set. Returns None when
+    the dataset is missing or pyarrow is unavailable.
+    """
+    dataset_dir = os.path.join(search_folder, PARQUET_DATASET)
+    if not os.path.isdir(dataset_dir):
+        return None
+    try:
+        import pyarrow.parquet as pq
+        filters = [('Event Number', 'in', sorted(event_numbers))] if event_numbers is not None else None
+        table = pq.read_table(dataset_dir, columns=columns, partitioning=None, filters=filters)
+    except Exception as e:
+        print(f"⚠️ Could not read Parquet dataset {dataset_dir} ({e}); using CSVs only")
+        return None
+    df = table.to_pandas()
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(str)
+    return df
 
 
 def get_event_gender_map_from_csvs(folder: str) -> Dict[str, str]:
-    """Infer event gender by reading event CSV filenames and header text.
+    """Map event number -> gender for every extracted event.
 
-    Looks under cleaned_files/ if present, otherwise the folder itself.
+    Looks under cleaned_files/ if present, otherwise the folder itself. Reads
+    the extractor's event index (_event_index.csv); only event CSVs or
+    events_parquet/ partitions the index does not list are opened.
     """
     cleaned_folder = os.path.join(folder, 'cleaned_files')
     search_folder = cleaned_folder if os.path.exists(cleaned_folder) else folder
 
-    csv_files = glob.glob(os.path.join(search_folder, 'event_*.csv'))
-    event_gender_map: Dict[str, str] = {}
-    for csv_file in csv_files:
-        try:
-            basename = os.path.basename(csv_file)
-            event_number = os.path.splitext(basename)[0].split('_')[-1]
-            df = pd.read_csv(csv_file)
-            if 'Event Name' in df.columns and len(df) > 0:
-                event_name = str(df['Event Name'].iloc[0]).lower()
-                if 'female' in event_name or 'girl' in event_name:
-                    event_gender_map[event_number] = 'Female'
-                elif 'male' in event_name or 'open/male' in event_name or 'boy' in event_name or 'open' in event_name:
-                    event_gender_map[event_number] = 'Male/Open'
-                else:
-                    event_gender_map[event_number] = 'Male/Open'
-            else:
-                event_gender_map[event_number] = 'Unknown'
-        except Exception:
-            event_gender_map[event_number] = 'Unknown'
+    event_gender_map = load_event_gender_map(search_folder)
+
+    dataset_dir = os.path.join(search_folder, PARQUET_DATASET)
+    if os.path.isdir(dataset_dir):
+        pq_events = {d.split('=', 1)[1] for d in os.listdir(dataset_dir) if d.startswith('event_number=')}
+        if pq_events - event_gender_map.keys():
+            df_pq = _read_parquet_dataset(search_folder, columns=['Event Number', 'Event Name'])
+            if df_pq is not None:
+                for event_number, event_name in df_pq.drop_duplicates('Event Number').itertuples(index=False):
+                    event_gender_map.setdefault(str(event_number), event_gender(event_name))
     return event_gender_map
 
-def load_all_events(folder: str) -> pd.DataFrame:
+
+def load_all_events(folder: str, event_numbers: Optional[Iterable[str]] = None) -> pd.DataFrame:
     """
     Load all event CSV files into a single dataframe.
+
+    If the extractor wrote a Parquet dataset (cleaned_files/events_parquet/),
+    it is read directly and only events missing from it are read from CSV
+    (in parallel, see event_loader). Times are returned as Int32 hundredths
+    in 'Time_Hundredths' (see time_codec).
     
     Args:
         folder: Path to folder containing event CSV files
+        event_numbers: Only load these events (e.g. {'101', '205'}); all when None
         
     Returns:
         Combined dataframe with all events
@@ -67,81 +123,64 @@ def load_all_events(folder: str) -> pd.DataFrame:
         search_folder = folder
     
     csv_files = [f for f in os.listdir(search_folder) if f.startswith('event_') and f.endswith('.csv')]
+    if event_numbers is not None:
+        event_numbers = {str(n) for n in event_numbers}
+        csv_files = [f for f in csv_files if f[len('event_'):-len('.csv')] in event_numbers]
     
-    def _norm_time_str(val: str) -> str:
-        """Normalize time to HH:MM:SS.HS (hours:minutes:seconds.hundredths).
-
-        Accepted inputs:
-        - SS.HS (e.g., '31.95')
-        - MM:SS.HS (e.g., '1:57.04') or MM:SS (e.g., '4:17')
-        - HH:MM:SS.HS or HH:MM:SS
-        - Numeric seconds (e.g., '31')
-        Returns '-' for blanks or unparsable values.
-        """
-        import re
-        try:
-            if pd.isna(val):
-                return '-'
-            s = str(val).strip()
-            if not s or s == '-':
-                return '-'
-
-            # HH:MM:SS(.H+)? - accept any decimals, trim to 2
-            m = re.match(r"^(\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d+))?$", s)
-            if m:
-                hh = int(m.group(1))
-                mm = int(m.group(2))
-                ss = int(m.group(3))
-                dec = m.group(4) or "0"
-                hs = (dec[:2]).ljust(2, '0')
-                return f"{hh:02d}:{mm:02d}:{ss:02d}.{hs}"
-
-            # MM:SS(.H+)?
-            m = re.match(r"^(\d{1,2}):(\d{1,2})(?:\.(\d+))?$", s)
-            if m:
-                mm = int(m.group(1))
-                ss = int(m.group(2))
-                dec = m.group(3) or "0"
-                hs = (dec[:2]).ljust(2, '0')
-                return f"00:{mm:02d}:{ss:02d}.{hs}"
-
-            # SS.H+ (any decimals)
-            m = re.match(r"^(\d{1,2})\.(\d+)$", s)
-            if m:
-                ss = int(m.group(1))
-                dec = m.group(2)
-                hs = (dec[:2]).ljust(2, '0')
-                return f"00:00:{ss:02d}.{hs}"
-
-            # MM:SS with single-digit seconds etc. already covered; if only digits or digits.decimals treat as seconds
-            if re.match(r"^\d+$", s):
-                ss = int(s)
-                return f"00:00:{ss:02d}.00"
-            if re.match(r"^\d+\.\d+$", s):
-                parts = s.split('.')
-                ss = int(parts[0])
-                hs = int(parts[1])
-                return f"00:00:{ss:02d}.{hs:02d}"
-
-            # Already normalized
-            if re.match(r"^\d{2}:\d{2}:\d{2}\.\d{2}$", s):
-                return s
-
-            return '-'
-        except Exception:
-            return '-'
-
     dfs = []
-    for csv_file in csv_files:
-        file_path = os.path.join(search_folder, csv_file)
-        df = pd.read_csv(file_path)
-        if 'Time' in df.columns:
-            df['Time'] = df['Time'].apply(_norm_time_str)
-        dfs.append(df)
-    
+
+    # Typed Parquet dataset from the extractor: no CSV round trip and no
+    # time parsing (times are already integer hundredths)
+    df_pq = _read_parquet_dataset(search_folder, event_numbers=event_numbers)
+    pq_events = set()
+    if df_pq is not None and len(df_pq) > 0:
+        df_pq[TIME_COLUMN] = df_pq[TIME_COLUMN].astype(TIME_DTYPE)
+        df_pq = df_pq.drop(columns=['Age Group'], errors='ignore')
+        pq_events = set(df_pq['Event Number'])
+        dfs.append(df_pq)
+
+    # Events present in the Parquet dataset take precedence over stale CSVs
+    csv_paths = [os.path.join(search_folder, f) for f in csv_files
+                 if f[len('event_'):-len('.csv')] not in pq_events]
+    if csv_paths:
+        # Times become integer hundredths here, in one pass, for every later stage
+        dfs.append(with_time_hundredths(read_event_csvs(csv_paths)))
+
+    if not dfs and event_numbers is not None:
+        return pd.DataFrame()
     return pd.concat(dfs, ignore_index=True)
 
 
+def identify_swimmers(base_folder: str, df_all: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give every result row its swimmer_id, updating the meet's swimmer index.
+
+    Ids come from championship_results/swimmer_index.csv, so a swimmer keeps
+    the same id across runs; swimmers not seen before are added and the index
+    is saved back.
+
+    Args:
+        base_folder: Championship folder
+        df_all: Dataframe with all events
+
+    Returns:
+        df_all with a SWIMMER_ID column (int32, -1 where the name is blank)
+    """
+    out_dir = os.path.join(base_folder, 'championship_results')
+    index_path = os.path.join(out_dir, SWIMMER_INDEX_NAME)
+    swimmers = SwimmerIndex.load(index_path, meet_year_from_folder(base_folder))
+    known = len(swimmers)
+    df_all = df_all.assign(**{SWIMMER_ID: swimmers.assign(df_all)})
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+        swimmers.save(index_path)
+    except OSError as e:
+        print(f"⚠️ Could not save swimmer index {index_path} ({e})")
+    identified = df_all.loc[df_all[SWIMMER_ID] >= 0, SWIMMER_ID].nunique()
+    print(f"✓ Identified {identified} swimmers ({len(swimmers) - known} new to the swimmer index)")
+    return df_all
+
+
 def export_all_events_union(base_folder: str, df_all: pd.DataFrame) -> None:
     """Write a single unioned events file to championship_results/.
 
@@ -184,6 +223,9 @@ def calculate_championship_scores(df_all: pd.DataFrame, event_gender_map: Dict[s
     Calculate championship scores based on the rules:
     - Count up to 8 scoring events total
     - Maximum 2 races per category (all ages)
+
+    Convenience wrapper around championship_scoring; callers that also need
+    narratives or per-race detail should build the selection table once.
     
     Args:
         df_all: Dataframe with all events
@@ -192,90 +234,7 @@ def calculate_championship_scores(df_all: pd.DataFrame, event_gender_map: Dict[s
     Returns:
         Dataframe with championship scores
     """
-    # Add gender column and ensure numeric types for scoring
-    df_all['Event Number'] = df_all['Event Number'].astype(str)
-    df_all['Gender'] = df_all['Event Number'].map(event_gender_map)
-    if 'WA Points' in df_all.columns:
-        df_all['WA Points'] = pd.to_numeric(df_all['WA Points'], errors='coerce').fillna(0).astype(int)
-    if 'Age' in df_all.columns:
-        df_all['Age'] = pd.to_numeric(df_all['Age'], errors='coerce').fillna(0).astype(int)
-    
-    # Remove Unknown gender entries
-    df_all = df_all[df_all['Gender'] != 'Unknown'].copy()
-    
-    # Filter for Worcester/WORM swimmers only
-    df_all = df_all[df_all['Club'].isin(['Worcester', 'WORM'])].copy()
-    
-    championship_results = []
-    
-    # Group by swimmer name
-    for name, swimmer_events in df_all.groupby('Name'):
-        # Get swimmer info
-        age = swimmer_events['Age'].iloc[0]
-        club = swimmer_events['Club'].iloc[0]
-        gender = swimmer_events['Gender'].mode()[0] if len(swimmer_events['Gender'].mode()) > 0 else swimmer_events['Gender'].iloc[0]
-        
-        # Max 2 races per category for all ages (updated rule)
-        max_per_category = 2
-        
-        # Sort by WA Points descending
-        swimmer_events_sorted = swimmer_events.sort_values('WA Points', ascending=False)
-        
-        # For each category, take top N races
-        category_events = {}
-        for category in ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']:
-            cat_events = swimmer_events_sorted[swimmer_events_sorted['Event Category'] == category]
-            # Remove duplicates - keep only best score per unique event
-            cat_events = cat_events.drop_duplicates(subset=['Event Number'], keep='first')
-            # Take top N for this category
-            top_n = cat_events.head(max_per_category)
-            if len(top_n) > 0:
-                category_events[category] = top_n
-        
-        # Number of categories competed (informational only)
-        num_categories = len(category_events)
-
-        # Combine all category events and take top 8
-        all_category_events = pd.concat(category_events.values(), ignore_index=True)
-        top_8_events = all_category_events.nlargest(8, 'WA Points')
-        
-        # Calculate totals
-        total_points = top_8_events['WA Points'].sum()
-        avg_points = top_8_events['WA Points'].mean()
-        best_event_points = top_8_events['WA Points'].max()
-        num_events = len(top_8_events)
-        
-        # Count events per category
-        category_counts = top_8_events['Event Category'].value_counts().to_dict()
-        
-        championship_results.append({
-            'Name': name,
-            'Age': age,
-            'Gender': gender,
-            'Club': club,
-            'Total_Points': total_points,
-            'Average_Points': avg_points,
-            'Best_Event_Points': best_event_points,
-            'Events_Count': num_events,
-            'Categories_Competed': num_categories,
-            'Sprint_Events': category_counts.get('Sprint', 0),
-            'Free_Events': category_counts.get('Free', 0),
-            'Form_100_Events': category_counts.get('100 Form', 0),
-            'Form_200_Events': category_counts.get('200 Form', 0),
-            'IM_Events': category_counts.get('IM', 0),
-            'Distance_Events': category_counts.get('Distance', 0)
-        })
-    
-    # If no swimmers qualified, return an empty DataFrame with expected columns
-    if len(championship_results) == 0:
-        return pd.DataFrame(columns=[
-            'Name', 'Age', 'Gender', 'Club',
-            'Total_Points', 'Average_Points', 'Best_Event_Points', 'Events_Count',
-            'Categories_Competed', 'Sprint_Events', 'Free_Events',
-            'Form_100_Events', 'Form_200_Events', 'IM_Events', 'Distance_Events'
-        ])
-
-    return pd.DataFrame(championship_results)
+    return summarise_selection(build_selection_table(df_all, event_gender_map))
 
 
 def display_scoreboard(df_champs: pd.DataFrame, gender: str, title: str):
@@ -325,12 +284,69 @@ def display_scoreboard(df_champs: pd.DataFrame, gender: str, title: str):
 
 def export_scoreboard(df_champs: pd.DataFrame, output_folder: str):
     """
-    Export championship scoreboards to CSV files.
+    Export championship scoreboards to CSV files, plus every swimmer's scores
+    for the dashboard (see export_all_swimmer_scores).
     
     Args:
         df_champs: Championship results dataframe
         output_folder: Folder to save results
     """
+    # Boys/girls sorted by Age (not Age Group), then Total_Points
+    export_scoreboard_tables(output_folder,
+                             rank_scoreboard(df_champs, 'Male/Open'),
+                             rank_scoreboard(df_champs, 'Female'),
+                             age_group_winners(df_champs))
+    export_all_swimmer_scores(output_folder, df_champs)
+
+
+def export_all_swimmer_scores(output_folder: str, df_champs: pd.DataFrame) -> None:
+    """
+    Write every swimmer's scores to championship_results/championship_scores_all.parquet.
+
+    The dashboard loads this instead of re-scoring; it records the events
+    union it was computed from, so export the union first.
+
+    Args:
+        output_folder: Championship folder
+        df_champs: Championship scores for all swimmers (summarise_selection output)
+    """
+    try:
+        path = write_score_artifact(os.path.join(output_folder, 'championship_results'), df_champs)
+        print(f"✓ Saved: {path} ({len(df_champs)} swimmers)")
+    except Exception as e:
+        print(f"⚠️ Failed to export all-swimmer scores: {e}")
+
+
+def export_selection_table(output_folder: str, selection: pd.DataFrame) -> None:
+    """
+    Write every race's selection outcome to championship_results/championship_selection.parquet.
+
+    Each row keeps whether it counts (Included), why or why not (Reason) and
+    its Category_Rank and Scoring_Rank, so the dashboard's swimmer details
+    read them instead of re-applying the rules. Export the union first.
+
+    Args:
+        output_folder: Championship folder
+        selection: Selection table (build_selection_table output)
+    """
+    try:
+        path = write_selection_artifact(os.path.join(output_folder, 'championship_results'), selection)
+        print(f"✓ Saved: {path} ({len(selection)} races)")
+    except Exception as e:
+        print(f"⚠️ Failed to export selection table: {e}")
+
+
+def export_scoreboard_tables(output_folder: str, df_boys: pd.DataFrame, df_girls: pd.DataFrame,
+                             df_winners: pd.DataFrame):
+    """
+    Write already-ranked scoreboards and age winners to CSV files.
+
+    Args:
+        output_folder: Folder to save results
+        df_boys: Boys/open scoreboard rows (see championship_scoring.rank_scoreboard)
+        df_girls: Girls scoreboard rows
+        df_winners: Age group winners (see championship_scoring.age_group_winners)
+    """
     # Create championship_results subfolder
     results_folder = os.path.join(output_folder, 'championship_results')
     os.makedirs(results_folder, exist_ok=True)
@@ -343,151 +359,31 @@ def export_scoreboard(df_champs: pd.DataFrame, output_folder: str):
         f.write(timestamp)
     print(f"✓ Saved last updated timestamp: {timestamp}")
     
-    # Export boys/open results - sorted by Age (not Age Group), then Total_Points
-    df_boys = df_champs[df_champs['Gender'] == 'Male/Open'].sort_values(['Age', 'Total_Points'], 
-                                                                      ascending=[True, False])
     output_file = os.path.join(results_folder, 'championship_scoreboard_boys.csv')
-    df_boys_export = df_boys[['Age', 'Name', 'Club', 'Total_Points', 'Average_Points',
-                               'Best_Event_Points', 'Events_Count', 'Categories_Competed',
-                               'Sprint_Events', 'Free_Events', 'Form_100_Events', 'Form_200_Events',
-                               'IM_Events', 'Distance_Events']]
-    df_boys_export.to_csv(output_file, index=False)
+    df_boys[SCOREBOARD_COLUMNS].to_csv(output_file, index=False)
     print(f"\n✓ Saved: {output_file} ({len(df_boys)} boys)")
     
-    # Export girls results - sorted by Age (not Age Group), then Total_Points
-    df_girls = df_champs[df_champs['Gender'] == 'Female'].sort_values(['Age', 'Total_Points'], 
-                                                                         ascending=[True, False])
     output_file = os.path.join(results_folder, 'championship_scoreboard_girls.csv')
-    df_girls_export = df_girls[['Age', 'Name', 'Club', 'Total_Points', 'Average_Points',
-                                 'Best_Event_Points', 'Events_Count', 'Categories_Competed',
-                                 'Sprint_Events', 'Free_Events', 'Form_100_Events', 'Form_200_Events',
-                                 'IM_Events', 'Distance_Events']]
-    df_girls_export.to_csv(output_file, index=False)
+    df_girls[SCOREBOARD_COLUMNS].to_csv(output_file, index=False)
     print(f"✓ Saved: {output_file} ({len(df_girls)} girls)")
     
-    # Export age winners (individual ages: 9, 10, 11, 12, 13, 14, 15, 16+)
-    winners = []
-    for age in [9, 10, 11, 12, 13, 14, 15]:
-        for gender in ['Male/Open', 'Female']:
-            age_gender = df_champs[(df_champs['Age'] == age) & 
-                                   (df_champs['Gender'] == gender)]
-            if len(age_gender) > 0:
-                winner = age_gender.nlargest(1, 'Total_Points').iloc[0]
-                winners.append({
-                    'Age': age,
-                    'Gender': gender,
-                    'Winner': winner['Name'],
-                    'Club': winner['Club'],
-                    'Total Points': winner['Total_Points'],
-                    'Events': winner['Events_Count'],
-                    'Categories': winner['Categories_Competed']
-                })
-    
-    # Handle 16+ separately
-    for gender in ['Male/Open', 'Female']:
-        age_gender = df_champs[(df_champs['Age'] >= 16) & 
-                               (df_champs['Gender'] == gender)]
-        if len(age_gender) > 0:
-            winner = age_gender.nlargest(1, 'Total_Points').iloc[0]
-            winners.append({
-                'Age': '16+',
-                'Gender': gender,
-                'Winner': winner['Name'],
-                'Club': winner['Club'],
-                'Total Points': winner['Total_Points'],
-                'Events': winner['Events_Count'],
-                'Categories': winner['Categories_Competed']
-            })
-    
-    df_winners = pd.DataFrame(winners)
+    # Age winners (individual ages: 9, 10, 11, 12, 13, 14, 15, 16+)
     output_file = os.path.join(results_folder, 'championship_age_group_winners.csv')
     df_winners.to_csv(output_file, index=False)
     print(f"✓ Saved: {output_file} ({len(df_winners)} age winners)")
 
 
-def export_swimmer_narratives(base_folder: str, df_all: pd.DataFrame, event_gender_map: Dict[str, str]) -> None:
+def export_swimmer_narratives(base_folder: str, selection: pd.DataFrame) -> None:
     """Create per-swimmer natural-language narratives and write CSV.
 
+    Args:
+        base_folder: Championship folder
+        selection: Selection table from championship_scoring.build_selection_table
+
     Output: championship_results/championship_swimmer_narratives.csv
     """
     try:
-        events = df_all.copy()
-        events['Event Number'] = events['Event Number'].astype(str)
-        events['Gender'] = events['Event Number'].map(event_gender_map)
-        # Ensure numeric type for points for robust ranking
-        if 'WA Points' in events.columns:
-            events['WA Points'] = pd.to_numeric(events['WA Points'], errors='coerce').fillna(0).astype(int)
-        
-        # Filter for Worcester/WORM swimmers only
-        events = events[events['Club'].isin(['Worcester', 'WORM'])].copy()
-        
-        out_rows: List[Dict] = []
-
-        categories = ['Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance']
-
-        for swimmer, swimmer_events in events.groupby('Name'):
-            swimmer_events = swimmer_events.sort_values('WA Points', ascending=False)
-            age = int(swimmer_events['Age'].iloc[0])
-            gender = swimmer_events['Gender'].iloc[0]
-
-            # Deduplicate per event, then keep per-category top N
-            dedup = swimmer_events.drop_duplicates(subset=['Event Number'], keep='first')
-            limit_per_category = 2  # Max 2 races per category for all ages
-            selected = []
-            for cat in categories:
-                cat_df = dedup[dedup['Event Category'] == cat]
-                if len(cat_df) > 0:
-                    selected.append(cat_df.head(limit_per_category))
-            included_numbers: List[str] = []
-            top8 = None
-            if selected:
-                all_cand = pd.concat(selected, ignore_index=True)
-                # Guard when WA Points may still be missing
-                if 'WA Points' in all_cand.columns:
-                    top8 = all_cand.nlargest(8, 'WA Points')
-                else:
-                    top8 = all_cand.head(8)
-                included_numbers = top8['Event Number'].astype(str).tolist()
-
-            total_pts = int(top8['WA Points'].sum()) if top8 is not None and len(top8) else 0
-            avg_pts = float(top8['WA Points'].mean()) if top8 is not None and len(top8) else 0.0
-            best_pts = int(top8['WA Points'].max()) if top8 is not None and len(top8) else 0
-
-            # Included list by category
-            included_by_cat: Dict[str, List[str]] = {}
-            if top8 is not None:
-                for _, row in top8.iterrows():
-                    included_by_cat.setdefault(row['Event Category'], []).append(
-                        f"{row['Event Name']} – {int(row['WA Points'])} pts"
-                    )
-
-            def _join(items: List[str], max_items: int = 2) -> str:
-                items = [i for i in items if i]
-                if not items:
-                    return ''
-                if len(items) > max_items:
-                    return ", ".join(items[:max_items]) + f" and {len(items)-max_items} more"
-                if len(items) == 1:
-                    return items[0]
-                return ", ".join(items[:-1]) + f" and {items[-1]}"
-
-            parts = []
-            for cat in categories:
-                if cat in included_by_cat:
-                    parts.append(f"{cat} (" + _join(included_by_cat[cat], 2) + ")")
-            included_short = _join(parts, 4) if parts else "no events yet counted"
-
-            out_rows.append({
-                'Name': swimmer,
-                'Age': age,
-                'Gender': gender,
-                'Total_Points': total_pts,
-                'IncludedShort': included_short,
-                'Average_Points': avg_pts,
-                'Best_Event_Points': best_pts,
-            })
-
-        df_narr = pd.DataFrame(out_rows)
+        df_narr = narrate_selection(selection)
         out_dir = os.path.join(base_folder, 'championship_results')
         os.makedirs(out_dir, exist_ok=True)
         out_path = os.path.join(out_dir, 'championship_swimmer_narratives.csv')
@@ -497,27 +393,143 @@ def export_swimmer_narratives(base_folder: str, df_all: pd.DataFrame, event_gend
         print(f"⚠️ Failed to export swimmer narratives: {e}")
 
 
+def _event_source_files(folder: str) -> List[str]:
+    """Every extracted file load_all_events and the gender map read (the pipeline's inputs)."""
+    cleaned_folder = os.path.join(folder, 'cleaned_files')
+    search_folder = cleaned_folder if os.path.exists(cleaned_folder) else folder
+    paths = glob.glob(os.path.join(search_folder, 'event_*.csv'))
+    paths.append(os.path.join(search_folder, EVENT_INDEX_NAME))
+    paths += [p for p in glob.glob(os.path.join(search_folder, PARQUET_DATASET, '**', '*'), recursive=True)
+              if os.path.isfile(p)]
+    return sorted(paths)
+
+
+def run_pipeline(base_folder: str, use_cache: bool = True,
+                 profiler: Optional[StageProfiler] = None) -> pd.DataFrame:
+    """
+    Run the scoreboard stages, skipping any whose inputs are unchanged.
+
+    Stages: gender map, load (with swimmer ids), union export, selection,
+    scores, selection export, scoreboard export and narratives. Each is fingerprinted on its input
+    files, the championship rules and the pipeline's source code (see
+    pipeline_cache); a re-run with nothing changed reuses every result.
+
+    Args:
+        base_folder: Championship folder
+        use_cache: When False every stage runs
+        profiler: Records time and memory for each stage (and the display)
+
+    Returns:
+        Championship scores (summarise_selection output)
+    """
+    results_dir = os.path.join(base_folder, 'championship_results')
+    module_names = ('championship_scoring', 'event_descriptor', 'event_index', 'event_loader',
+                    'swimmer_identity', 'time_codec', __name__)
+    code_files = [sys.modules[name].__file__ for name in module_names if getattr(sys.modules.get(name), '__file__', None)]
+    runner = PipelineRunner(os.path.join(results_dir, PIPELINE_CACHE_DIR), use_cache=use_cache, code_files=code_files,
+                            profiler=profiler)
+    sources = _event_source_files(base_folder)
+
+    def map_genders():
+        event_gender_map = get_event_gender_map_from_csvs(base_folder)
+        print(f"✓ Mapped {len(event_gender_map)} events to gender (from CSVs)")
+        return event_gender_map
+
+    def load_events():
+        df_all = load_all_events(base_folder)
+        print(f"✓ Loaded {len(df_all)} total entries from {df_all['Event Number'].nunique()} events")
+        # Stable integer swimmer ids; every later stage groups on these, not names
+        return identify_swimmers(base_folder, df_all)
+
+    def select():
+        print("\n🏊 Calculating championship scores...")
+        print("Rules:")
+        print("  • Count up to 8 scoring events total")
+        print("  • Maximum 2 races per category (all ages)")
+        return build_selection_table(events.value, gender_map.value)
+
+    print("📊 Loading event data...")
+    gender_map = runner.stage('gender map', map_genders, files=sources)
+    events = runner.stage('load', load_events, files=sources + [os.path.join(results_dir, SWIMMER_INDEX_NAME)])
+
+    # Export a single unioned file for the dashboard to load efficiently
+    runner.stage('union export', lambda: export_all_events_union(base_folder, events.value), deps=[events],
+                 outputs=[os.path.join(results_dir, 'events_all.parquet')])
+
+    rules = scoring_rules()
+    # One selection table per run; scores and narratives are both read from it
+    selection = runner.stage('selection', select, deps=[events, gender_map], params=rules)
+    scores = runner.stage('scores', lambda: summarise_selection(selection.value), deps=[selection])
+    # Per-race Included/Reason/ranks for the dashboard's swimmer details
+    runner.stage('selection export', lambda: export_selection_table(base_folder, selection.value),
+                 deps=[selection], outputs=[os.path.join(results_dir, SELECTION_ARTIFACT_NAME)])
+
+    # Display scoreboards
+    with runner.measure('display'):
+        df_champs = scores.value
+        print(f"✓ {len(df_champs)} swimmers eligible for championship")
+        display_scoreboard(df_champs, 'Male', '🏊‍♂️ BOYS CHAMPIONSHIP SCOREBOARD')
+        display_scoreboard(df_champs, 'Female', '🏊‍♀️ GIRLS CHAMPIONSHIP SCOREBOARD')
+
+    # Export results
+    print("\n" + "=" * 100)
+    print("📁 EXPORTING RESULTS")
+    print("=" * 100)
+    runner.stage('scoreboard', lambda: export_scoreboard(scores.value, base_folder), deps=[scores],
+                 outputs=[os.path.join(results_dir, name) for name in (
+                     'championship_scoreboard_boys.csv', 'championship_scoreboard_girls.csv',
+                     'championship_age_group_winners.csv', 'last_updated.txt', SCORE_ARTIFACT_NAME)])
+
+    # Export narratives for dashboard tooltips
+    runner.stage('narratives', lambda: export_swimmer_narratives(base_folder, selection.value),
+                 deps=[selection], outputs=[os.path.join(results_dir, 'championship_swimmer_narratives.csv')])
+
+    if profiler is None:
+        runner.print_report()
+    else:
+        profiler.print_report()
+    runner.save()
+    return df_champs
+
+
 def main():
     """Main function to run championship scoreboard calculation."""
-    import sys
-    
     print("=" * 100)
     print("🏆 CLUB CHAMPIONSHIPS SCOREBOARD")
     print("=" * 100)
     
-    # Configuration - accept year from command line or use current year
-    if len(sys.argv) > 1:
-        # User provided a year or folder path
-        arg = sys.argv[1]
-        if arg.isdigit():
+    # Configuration - accept year or folder from command line, plus flags
+    base_folder = None
+    use_cache = True
+    profile = False
+    profile_path = None
+    timings_path = None
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == '--no-cache':
+            # Run every stage even if its inputs are unchanged
+            use_cache = False
+        elif arg == '--profile' or arg.startswith('--profile='):
+            # Per-stage timing/memory table, plus a cProfile dump if a path is given
+            profile = True
+            profile_path = arg.partition('=')[2] or None
+        elif arg == '--timings-json' or arg.startswith('--timings-json='):
+            timings_path = arg.partition('=')[2] or next(args, None)
+            if not timings_path:
+                print("❌ --timings-json needs a file path")
+                return
+        elif arg in ('-h', '--help'):
+            print(__doc__)
+            return
+        elif arg.isdigit():
             # Year provided (e.g., 2025)
             base_folder = f'WSC_Club_Champs_{arg}'
         else:
             # Full folder path provided
             base_folder = arg
-    else:
+
+    if base_folder is None:
         # Auto-detect: look for WSC_Club_Champs_* folders in current directory
-        import glob
         folders = sorted(glob.glob('WSC_Club_Champs_*'))
         if folders:
             # Use most recent folder (sorted alphabetically, which works for years)
@@ -530,44 +542,18 @@ def main():
             base_folder = f'WSC_Club_Champs_{current_year}'
             print(f"⚠️  No existing folders found, using: {base_folder}")
     
-    events_folder = base_folder  # load_all_events will pick cleaned_files/ automatically
-    output_folder = base_folder
-    
     print(f"📂 Working with: {base_folder}\n")
-    print("📊 Loading event data...")
-    
-    # Get gender mapping from cleaned CSV files
-    event_gender_map = get_event_gender_map_from_csvs(base_folder)
-    print(f"✓ Mapped {len(event_gender_map)} events to gender (from CSVs)")
-    
-    # Load all events
-    df_all = load_all_events(events_folder)
-    print(f"✓ Loaded {len(df_all)} total entries from {df_all['Event Number'].nunique()} events")
-
-    # Export a single unioned file for the dashboard to load efficiently
-    export_all_events_union(base_folder, df_all)
-    
-    # Calculate championship scores
-    print("\n🏊 Calculating championship scores...")
-    print("Rules:")
-    print("  • Count up to 8 scoring events total")
-    print("  • Maximum 2 races per category (all ages)")
-    
-    df_champs = calculate_championship_scores(df_all, event_gender_map)
-    print(f"✓ {len(df_champs)} swimmers eligible for championship")
-    
-    # Display scoreboards
-    display_scoreboard(df_champs, 'Male', '🏊‍♂️ BOYS CHAMPIONSHIP SCOREBOARD')
-    display_scoreboard(df_champs, 'Female', '🏊‍♀️ GIRLS CHAMPIONSHIP SCOREBOARD')
-    
-    # Export results
-    print("\n" + "=" * 100)
-    print("📁 EXPORTING RESULTS")
-    print("=" * 100)
-    export_scoreboard(df_champs, output_folder)
-
-    # Export narratives for dashboard tooltips
-    export_swimmer_narratives(base_folder, df_all, event_gender_map)
+    profiler = None
+    if profile or timings_path:
+        profiler = StageProfiler(cprofile=profile_path is not None)
+    df_champs = run_pipeline(base_folder, use_cache=use_cache, profiler=profiler)
+
+    if profile_path:
+        profiler.dump_stats(profile_path)
+        print(f"✓ Saved cProfile statistics to: {profile_path}")
+    if timings_path:
+        profiler.write_json(timings_path, folder=base_folder, use_cache=use_cache, swimmers=len(df_champs))
+        print(f"✓ Saved stage timings to: {timings_path}")
     
     # Summary statistics
     print("\n" + "=" * 100)
@@ -6,20 +6,25 @@ Breaks down by number of county times: 1-3, 4-10, 11+
 
 import pandas as pd
 
+from swimmer_identity import SWIMMER_ID
+
 def main():
     # Load the comparison data
     df = pd.read_csv('county_times_2026/county_times_comparison.csv')
+    if SWIMMER_ID not in df.columns:
+        # Comparison files from before swimmer ids: one swimmer per name
+        df[SWIMMER_ID] = pd.factorize(df['Name'])[0]
     
     # Use Age_2026 for grouping (county comparison age)
     # But keep Age_2025 for display purposes
     achieved = df[df['Achieved_County_Time'] == 'Yes'].copy()
-    ct_per_swimmer = achieved.groupby(['Name', 'Age_2026']).size().reset_index(name='County_Times_Count')
+    ct_per_swimmer = achieved.groupby([SWIMMER_ID, 'Age_2026']).size().reset_index(name='County_Times_Count')
     
     # Get total swimmers by age (using 2026 age for county comparison)
-    all_swimmers = df.groupby(['Name', 'Age_2026']).size().reset_index(name='Events')[['Name', 'Age_2026']]
+    all_swimmers = df.groupby([SWIMMER_ID, 'Age_2026']).size().reset_index(name='Events')[[SWIMMER_ID, 'Age_2026']]
     
     # Merge to get swimmers with 0 county times
-    swimmer_stats = all_swimmers.merge(ct_per_swimmer, on=['Name', 'Age_2026'], how='left')
+    swimmer_stats = all_swimmers.merge(ct_per_swimmer, on=[SWIMMER_ID, 'Age_2026'], how='left')
     swimmer_stats['County_Times_Count'] = swimmer_stats['County_Times_Count'].fillna(0).astype(int)
     
     # Categorize county times
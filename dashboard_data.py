@@ -0,0 +1,392 @@
+"""
+Dashboard Data
+==============
+
+Data preparation behind championship_dashboard_2025.py: loading events,
+scoring every swimmer, narratives, the ranking views and the row index
+behind the detail views.
+
+Nothing here depends on Streamlit, so it can be benchmarked and reused
+outside the app; the dashboard wraps each loader in its cache decorator.
+
+Usage:
+    from dashboard_data import DatasetIndex, ScoreboardViews, build_championship_selection, load_dashboard_data
+
+    df_all, df_all_swimmers, df_narratives = load_dashboard_data('WSC_Club_Champs_2025')
+    views = ScoreboardViews(df_all_swimmers)
+    df_display = views.get('Female', '12')
+    index = DatasetIndex(build_championship_selection(df_all))
+    event_rankings = index.event_rows('101', 'Female')
+
+    # Changes exactly when new results are published; the app keys its caches on it
+    fingerprint = results_fingerprint('WSC_Club_Champs_2025')
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from championship_scoring import build_selection_table, narrate_selection, summarise_selection
+from event_index import EVENT_INDEX_NAME, load_event_gender_map
+from event_loader import read_event_csvs
+from score_artifact import load_score_artifact, load_selection_artifact
+from swimmer_identity import SWIMMER_ID, SWIMMER_INDEX_NAME, SwimmerIndex, meet_year_from_folder, with_swimmer_ids
+from time_codec import with_time_hundredths
+
+# Memory optimization settings
+MEMORY_OPTIMIZATION = True
+# Age filter value for every swimmer aged 16 and over
+AGE_16_PLUS = '16+'
+# Positions for a DatasetIndex lookup with no rows
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+def results_fingerprint(base_folder: str) -> str:
+    """
+    Cheap fingerprint of the published results, for keying the dashboard's caches.
+
+    Built from the name, size and mtime of every file in championship_results/
+    plus the extractor's event index (read when there is no events union).
+    Publishing rewrites these files, so the fingerprint changes exactly when
+    new results land. Only stat() is used; nothing is read or hashed.
+
+    Args:
+        base_folder: Championship folder
+
+    Returns:
+        Short hex digest
+    """
+    entries = []
+    results_dir = os.path.join(base_folder, 'championship_results')
+    try:
+        with os.scandir(results_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    st = entry.stat()
+                    entries.append((entry.name, st.st_size, st.st_mtime_ns))
+    except FileNotFoundError:
+        pass
+    try:
+        st = os.stat(os.path.join(base_folder, 'cleaned_files', EVENT_INDEX_NAME))
+        entries.append((EVENT_INDEX_NAME, st.st_size, st.st_mtime_ns))
+    except FileNotFoundError:
+        pass
+    payload = json.dumps([os.path.abspath(base_folder), sorted(entries)])
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def load_all_events(folder: str) -> pd.DataFrame:
+    """Load all event CSV files into a single dataframe with memory optimization."""
+    # Look for event files in cleaned_files subfolder
+    cleaned_folder = os.path.join(folder, 'cleaned_files')
+    if os.path.exists(cleaned_folder):
+        search_folder = cleaned_folder
+    else:
+        search_folder = folder
+
+    csv_files = [f for f in os.listdir(search_folder) if f.startswith('event_') and f.endswith('.csv')]
+
+    if not csv_files:
+        print(f"No CSV files found in {search_folder}")
+        return pd.DataFrame()
+
+    # All files are parsed in parallel with a fixed schema (see event_loader)
+    combined_df = read_event_csvs(os.path.join(search_folder, f) for f in csv_files)
+    if len(combined_df.columns) == 0:
+        return pd.DataFrame()
+
+    # Optimized data types for memory efficiency
+    for col, dtype in {
+        'Event Number': 'category',  # Use category for repeated values
+        'Event Name': 'category',    # Use category for repeated values
+        'Event Category': 'category', # Use category for repeated values
+        'Age': 'int8',              # Use smallest int type
+        'Club': 'category',          # Use category for repeated values
+    }.items():
+        if col in combined_df.columns:
+            try:
+                combined_df[col] = combined_df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass  # e.g. missing ages cannot be int8
+
+    # Times become Int32 hundredths
+    combined_df = with_time_hundredths(combined_df)
+
+    # Additional memory optimizations
+    if MEMORY_OPTIMIZATION:
+        # Convert string columns to category where beneficial
+        for col in combined_df.columns:
+            if combined_df[col].dtype == 'object':
+                # Convert to category if it has many repeated values
+                if combined_df[col].nunique() / len(combined_df) < 0.5:
+                    combined_df[col] = combined_df[col].astype('category')
+
+    return combined_df
+
+
+def get_event_gender_map_from_csvs(folder: str) -> Dict[str, str]:
+    """Build a mapping of event number -> gender from the extractor's event index.
+
+    Event CSVs missing from the index are inspected directly. This is used as
+    a fallback when input data lacks a Gender column.
+    """
+    # Prefer cleaned_files subfolder if present
+    cleaned_folder = os.path.join(folder, 'cleaned_files')
+    search_folder = cleaned_folder if os.path.exists(cleaned_folder) else folder
+    return load_event_gender_map(search_folder)
+
+
+def age_bucket(age: int) -> str:
+    """The dashboard's age filter value for an age: the age itself under 16, '16+' from 16."""
+    return AGE_16_PLUS if age >= 16 else str(age)
+
+
+class ScoreboardViews:
+    """
+    Every (gender, age) ranking the dashboard offers, sorted and ranked once.
+
+    The scores are sorted once, by gender, age bucket and points. Each age
+    view is a slice of that frame, reindexed from 1 so the index is the rank;
+    a lookup is a dict access and copies nothing. A gender's 'All' view is
+    held as row positions within its gender's slice, ordered by points, and
+    taken on lookup, so memory stays at one sorted copy of the scores however
+    many views are shown. Views share data: treat them as read-only.
+    """
+
+    def __init__(self, df_scores: pd.DataFrame):
+        """
+        Args:
+            df_scores: Scores for every swimmer (calculate_all_championship_scores)
+        """
+        df = df_scores.assign(Age_Bucket=df_scores['Age'].map(age_bucket))
+        buckets = df['Age_Bucket'].unique().tolist()
+        # Ages in order, 16+ last
+        self.age_options: List[str] = ['All'] + sorted(buckets, key=lambda bucket: (len(bucket), bucket))
+        self._empty = df.iloc[:0]
+        self._views: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._all_positions: Dict[str, np.ndarray] = {}
+        # Sorted by the grouping keys first, so each group's rows are contiguous
+        keys = df[['Gender', 'Age_Bucket', 'Total_Points']].reset_index(drop=True)
+        order = keys.sort_values(['Gender', 'Age_Bucket', 'Total_Points'], ascending=[True, True, False],
+                                 kind='stable').index.to_numpy()
+        self._ranked = df.take(order)
+        for (gender, age), positions in self._ranked.groupby(['Gender', 'Age_Bucket'], sort=False).indices.items():
+            view = self._ranked.iloc[positions[0]:positions[-1] + 1]
+            self._views[(gender, age)] = view.set_axis(pd.RangeIndex(1, len(view) + 1))
+        # All ages of a gender: its slice by points, ties in the scores' own order
+        points = self._ranked['Total_Points'].to_numpy()
+        for gender, positions in self._ranked.groupby('Gender', sort=False).indices.items():
+            start, stop = positions[0], positions[-1] + 1
+            self._all_positions[gender] = start + np.lexsort((order[start:stop], -points[start:stop]))
+
+    def get(self, gender: str, age: str) -> pd.DataFrame:
+        """
+        Swimmers of one gender and age filter value ('All', '12', '16+'), best first.
+
+        Returns:
+            Scores indexed by rank from 1 (empty when nobody matches)
+        """
+        if age == 'All' and gender in self._all_positions:
+            positions = self._all_positions[gender]
+            return self._ranked.take(positions).set_axis(pd.RangeIndex(1, len(positions) + 1))
+        return self._views.get((gender, age), self._empty)
+
+
+class DatasetIndex:
+    """
+    Row positions of a results table by swimmer and by (event, gender).
+
+    Both lookups hold positions ordered by WA Points, best first (ties keep
+    the table's order). The swimmer-detail and event-ranking views slice the
+    table with them instead of scanning every row with a boolean mask.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Args:
+            df: Results with SWIMMER_ID, Event Number, Event Name, Gender and
+                WA Points, e.g. the selection table (not copied; treat as read-only)
+        """
+        self.df = df
+        by_points = np.argsort(-df['WA Points'].to_numpy(dtype=np.int64), kind='stable')
+        keys = pd.DataFrame({
+            SWIMMER_ID: df[SWIMMER_ID].to_numpy()[by_points],
+            'Event Number': df['Event Number'].astype(str).to_numpy()[by_points],
+            'Gender': df['Gender'].to_numpy()[by_points],
+        })
+        # Positions within by_points increase, so each group stays best first
+        self._swimmer_rows: Dict[int, np.ndarray] = {
+            swimmer_id: by_points[positions]
+            for swimmer_id, positions in keys.groupby(SWIMMER_ID, sort=False).indices.items()}
+        self._event_rows: Dict[Tuple[str, str], np.ndarray] = {
+            key: by_points[positions]
+            for key, positions in keys.groupby(['Event Number', 'Gender'], sort=False).indices.items()}
+        events = df[['Event Number', 'Event Name', 'Gender']].drop_duplicates().sort_values('Event Number')
+        self._event_options: Dict[str, List[Tuple[str, str]]] = {
+            gender: list(zip(group['Event Number'].astype(str), group['Event Name'].astype(str)))
+            for gender, group in events.groupby('Gender', sort=False)}
+
+    def swimmer_rows(self, swimmer_id: int) -> pd.DataFrame:
+        """Every row for one swimmer, best WA Points first."""
+        return self.df.take(self._swimmer_rows.get(swimmer_id, _NO_ROWS))
+
+    def event_rows(self, event_number: str, gender: str) -> pd.DataFrame:
+        """Every row for one event and gender, best WA Points first."""
+        return self.df.take(self._event_rows.get((str(event_number), gender), _NO_ROWS))
+
+    def event_options(self, gender: str) -> List[Tuple[str, str]]:
+        """(event number, event name) of every event swum by a gender, in event-number order."""
+        return self._event_options.get(gender, [])
+
+
+def build_championship_selection(df_all: pd.DataFrame) -> pd.DataFrame:
+    """Apply the championship rules once; scores, narratives and the swimmer
+    detail view are all read from this per-race table."""
+    return build_selection_table(df_all)
+
+
+def calculate_all_championship_scores(selection: pd.DataFrame,
+                                      min_categories: int = 0) -> pd.DataFrame:
+    """
+    Calculate championship scores for ALL swimmers (no minimum category requirement).
+
+    Args:
+        selection: Selection table from build_championship_selection
+        min_categories: Minimum categories required (0 = show all)
+    """
+    df = summarise_selection(selection)
+    return df[df['Categories_Competed'] >= min_categories].reset_index(drop=True)
+
+
+def build_swimmer_narratives(selection: pd.DataFrame) -> pd.DataFrame:
+    """Build per-swimmer narratives describing included/excluded events.
+
+    Returns a dataframe with columns:
+      Name, Age, Gender, Total_Points, IncludedShort, Average_Points,
+      Best_Event_Points, Narrative
+    """
+    return narrate_selection(selection)
+
+
+def load_all_swimmer_scores(base_folder: str) -> pd.DataFrame | None:
+    """Load every swimmer's scores as saved by the scoreboard.
+
+    Returns None when the file is missing or stale (older schema, changed
+    rules, or events rewritten since); callers then score live.
+    """
+    return load_score_artifact(os.path.join(base_folder, 'championship_results'))
+
+
+def load_saved_selection(base_folder: str) -> pd.DataFrame | None:
+    """Load every race's selection outcome (Included, Reason, ranks) as saved by the scoreboard.
+
+    Returns None when the file is missing or stale; callers then build the
+    selection table live.
+    """
+    return load_selection_artifact(os.path.join(base_folder, 'championship_results'))
+
+
+def load_swimmer_narratives_csv(base_folder: str) -> pd.DataFrame | None:
+    """Load prebuilt swimmer narratives if present."""
+    try:
+        csv_path = os.path.join(base_folder, 'championship_results', 'championship_swimmer_narratives.csv')
+        if not os.path.exists(csv_path):
+            return None
+        return pd.read_csv(csv_path)
+    except Exception:
+        return None
+
+
+def load_events_prefer_union(base_folder: str) -> pd.DataFrame:
+    """Load all events, preferring a single union file if present.
+
+    Order of preference:
+      1) championship_results/events_all.parquet (fastest)
+      2) championship_results/events_all.csv
+      3) Fall back to concatenating cleaned_files/event_*.csv
+
+    Rows without swimmer ids (older union files, the CSV fallback) get them
+    from the saved swimmer index, which the dashboard never writes.
+    """
+    # Require Parquet (preferred); fall back to per-file loader only if missing
+    results_dir = os.path.join(base_folder, 'championship_results')
+    pq_path = os.path.join(results_dir, 'events_all.parquet')
+    df = None
+    if os.path.exists(pq_path):
+        try:
+            # Older union files store text times
+            df = with_time_hundredths(pd.read_parquet(pq_path))
+        except Exception:
+            pass
+    if df is None:
+        # Fallback to per-file loader
+        df = load_all_events(base_folder)
+    if SWIMMER_ID not in df.columns and 'Name' in df.columns:
+        swimmers = SwimmerIndex.load(os.path.join(results_dir, SWIMMER_INDEX_NAME), meet_year_from_folder(base_folder))
+        df = with_swimmer_ids(df, swimmers)
+    return df
+
+
+def with_event_genders(df_all: pd.DataFrame, events_folder: str) -> pd.DataFrame:
+    """Ensure the events have a Gender column, deriving it from the event CSVs if needed."""
+    if 'Gender' not in df_all.columns:
+        df_all['Event Number'] = df_all['Event Number'].astype(str)
+        event_gender_map = get_event_gender_map_from_csvs(events_folder)
+        df_all['Gender'] = df_all['Event Number'].map(event_gender_map)
+        df_all = df_all[df_all['Gender'] != 'Unknown'].copy()
+    else:
+        # Ensure Event Number is string for consistency
+        df_all['Event Number'] = df_all['Event Number'].astype(str)
+        # Normalize legacy gender labels to new scheme
+        df_all['Gender'] = df_all['Gender'].replace({'Male': 'Male/Open'})
+    return df_all
+
+
+def load_dashboard_data(events_folder: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Everything the dashboard's views are built from, uncached.
+
+    Scores and the selection table come from the scoreboard's saved files
+    when they are current; the championship rules only run when one is
+    missing or stale, or when there are no saved narratives.
+
+    Args:
+        events_folder: Championship folder
+
+    Returns:
+        (events with Gender, scores for every swimmer, narratives)
+    """
+    df_all = with_event_genders(load_events_prefer_union(events_folder), events_folder)
+    df_all_swimmers = load_all_swimmer_scores(events_folder)
+    selection = load_saved_selection(events_folder)
+    if df_all_swimmers is None:
+        if selection is None:
+            selection = build_championship_selection(df_all)
+        df_all_swimmers = calculate_all_championship_scores(selection, min_categories=0)
+    # Prefer prebuilt narratives; if missing, build on the fly
+    df_narratives = load_swimmer_narratives_csv(events_folder)
+    if df_narratives is None or len(df_narratives) == 0:
+        if selection is None:
+            selection = build_championship_selection(df_all)
+        df_narratives = build_swimmer_narratives(selection)
+    return df_all, df_all_swimmers, df_narratives
+
+
+def load_last_updated_timestamp(base_folder: str) -> str | None:
+    """Load the last updated timestamp from the championship results folder.
+
+    Returns:
+        Timestamp string in format 'YYYY-MM-DD HH:MM:SS' or None if not available
+    """
+    try:
+        timestamp_file = os.path.join(base_folder, 'championship_results', 'last_updated.txt')
+        if os.path.exists(timestamp_file):
+            with open(timestamp_file, 'r') as f:
+                return f.read().strip()
+    except Exception:
+        pass
+    return None
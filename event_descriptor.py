@@ -0,0 +1,114 @@
+"""
+Event Descriptor
+================
+
+Single source of truth for classifying an event title such as
+"Open/Male 200m Breaststroke" into gender, distance, stroke and championship
+category. Every distinct title is parsed once (results are memoised), so
+callers can classify per row without repeating the string work.
+
+Usage:
+    from event_descriptor import describe_event
+
+    describe_event('Female 100m Butterfly')
+    # -> EventDescriptor(gender='Female', distance=100, stroke='Butterfly', category='100 Form')
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+GENDER_FEMALE = 'Female'
+GENDER_MALE_OPEN = 'Male/Open'
+GENDER_UNKNOWN = 'Unknown'
+
+# Championship categories, in the order the scoring rules list them
+CATEGORIES = ('Sprint', 'Free', '100 Form', '200 Form', 'IM', 'Distance')
+FORM_STROKES = frozenset({'Backstroke', 'Breaststroke', 'Butterfly'})
+
+# Checked in order: 'female' must win over the 'male' it contains
+_GENDER_MARKERS = (
+    (('female', 'girl'), GENDER_FEMALE),
+    (('male', 'open', 'boy'), GENDER_MALE_OPEN),
+)
+
+_STROKE_NAMES = {
+    'freestyle': 'Freestyle', 'free': 'Freestyle',
+    'backstroke': 'Backstroke', 'back': 'Backstroke',
+    'breaststroke': 'Breaststroke', 'breast': 'Breaststroke',
+    'butterfly': 'Butterfly', 'fly': 'Butterfly',
+    'individual medley': 'IM', 'medley': 'IM', 'im': 'IM',
+}
+_STROKE_RE = re.compile(
+    r'\b(' + '|'.join(sorted(_STROKE_NAMES, key=len, reverse=True)) + r')\b', re.IGNORECASE)
+_DISTANCE_RE = re.compile(r'(?<!\d)(\d{2,4})\s?m\b', re.IGNORECASE)
+_EVENT_PREFIX_RE = re.compile(r'^EVENT\s+\d+\s+', re.IGNORECASE)
+_RACE_SUFFIX_RE = re.compile(r'(\d+m?\s+[\w\s]+)$', re.IGNORECASE)
+
+
+class EventDescriptor(NamedTuple):
+    """Immutable classification of one event title."""
+
+    gender: str               # 'Female', 'Male/Open' or 'Unknown'
+    distance: Optional[int]   # metres, e.g. 200
+    stroke: Optional[str]     # 'Freestyle', 'Backstroke', 'Breaststroke', 'Butterfly' or 'IM'
+    category: str             # one of CATEGORIES, or 'Other'
+
+
+def _category(distance: Optional[int], stroke: Optional[str]) -> str:
+    """Championship category for a distance/stroke pair."""
+    if distance == 50:
+        return 'Sprint'
+    if distance in (800, 1500):
+        return 'Distance'
+    if stroke == 'IM':
+        return 'IM'
+    if stroke == 'Freestyle':
+        return 'Free'
+    if stroke in FORM_STROKES:
+        # Default to 100 Form if distance unclear
+        return '200 Form' if distance == 200 else '100 Form'
+    return 'Other'
+
+
+@lru_cache(maxsize=None)
+def describe_event(title: str) -> EventDescriptor:
+    """
+    Classify an event title (memoised per distinct title).
+
+    Args:
+        title: Event title, with or without the "EVENT 302" prefix
+
+    Returns:
+        EventDescriptor(gender, distance, stroke, category)
+    """
+    lower = str(title).lower()
+
+    gender = GENDER_UNKNOWN
+    for markers, value in _GENDER_MARKERS:
+        if any(marker in lower for marker in markers):
+            gender = value
+            break
+
+    m = _DISTANCE_RE.search(_EVENT_PREFIX_RE.sub('', lower))
+    distance = int(m.group(1)) if m else None
+
+    m = _STROKE_RE.search(lower)
+    stroke = _STROKE_NAMES[m.group(1)] if m else None
+
+    return EventDescriptor(gender, distance, stroke, _category(distance, stroke))
+
+
+@lru_cache(maxsize=None)
+def clean_event_title(title: str) -> str:
+    """
+    Strip the "EVENT XXX" prefix from a title, keeping the gender marker.
+
+    "EVENT 103 Open/Male 400m Freestyle" -> "Open/Male 400m Freestyle"
+    """
+    clean_name = _EVENT_PREFIX_RE.sub('', title)
+    # If nothing left or looks wrong, fall back to the race description
+    if not clean_name or len(clean_name.strip()) < 3:
+        match = _RACE_SUFFIX_RE.search(title)
+        clean_name = match.group(1) if match else title
+    return clean_name.strip()
@@ -0,0 +1,109 @@
+"""
+Event Index
+===========
+
+One small CSV (cleaned_files/_event_index.csv) describing every extracted
+event: number, name, gender, category, row count and the RES source it came
+from. The extractor rewrites it on every run from its manifest, so readers can
+build the event -> gender map without opening each event file.
+
+Usage:
+    from event_index import load_event_gender_map
+
+    load_event_gender_map('WSC_Club_Champs_2025/cleaned_files')
+    # -> {'101': 'Female', '102': 'Male/Open', ...}
+"""
+
+import csv
+import glob
+import os
+from typing import Dict, Iterable, Optional, Tuple
+
+from event_descriptor import GENDER_MALE_OPEN, GENDER_UNKNOWN, describe_event
+
+EVENT_INDEX_NAME = '_event_index.csv'
+INDEX_COLUMNS = ('Event Number', 'Event Name', 'Gender', 'Event Category', 'Rows', 'Source', 'Source Hash')
+
+
+def event_gender(event_name: str) -> str:
+    """Map an event title to 'Female' or 'Male/Open' (the default when unspecified)."""
+    gender = describe_event(event_name).gender
+    return GENDER_MALE_OPEN if gender == GENDER_UNKNOWN else gender
+
+
+def write_event_index(cleaned_dir: str, entries: Iterable[Tuple[str, Dict]]) -> str:
+    """
+    Atomically write the event index from extractor manifest entries.
+
+    Args:
+        cleaned_dir: The cleaned_files/ folder
+        entries: (source key, manifest entry) pairs; when several sources
+            produce the same event number the last one wins, as in the
+            extractor's results
+
+    Returns:
+        Path of the index file
+    """
+    events: Dict[str, Tuple] = {}
+    for key, entry in entries:
+        event_number = entry.get('event_number')
+        if not event_number:
+            continue
+        event_name = entry.get('event_name', '')
+        events.pop(event_number, None)
+        events[event_number] = (event_number, event_name, event_gender(event_name),
+                                describe_event(event_name).category, entry.get('rows', 0),
+                                key, entry.get('hash', ''))
+
+    path = os.path.join(cleaned_dir, EVENT_INDEX_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(INDEX_COLUMNS)
+        writer.writerows(sorted(events.values()))
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_event_index(search_folder: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    Read the event index from a cleaned_files/ folder.
+
+    Returns:
+        Mapping of event number -> index row, or None if there is no readable index
+    """
+    path = os.path.join(search_folder, EVENT_INDEX_NAME)
+    try:
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or not set(INDEX_COLUMNS) <= set(reader.fieldnames):
+                return None
+            return {row['Event Number']: row for row in reader}
+    except OSError:
+        return None
+
+
+def load_event_gender_map(search_folder: str) -> Dict[str, str]:
+    """
+    Map event number -> gender for every event_*.csv in a folder.
+
+    Genders come from the event index; only CSVs the index does not list
+    (e.g. placed by hand) have their first row read.
+    """
+    index = read_event_index(search_folder) or {}
+    event_gender_map = {number: row['Gender'] for number, row in index.items()}
+
+    for csv_file in glob.glob(os.path.join(search_folder, 'event_*.csv')):
+        event_number = os.path.splitext(os.path.basename(csv_file))[0].split('_')[-1]
+        if event_number in event_gender_map:
+            continue
+        try:
+            with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+                first = next(csv.DictReader(f), None)
+            if first and first.get('Event Name'):
+                event_gender_map[event_number] = event_gender(first['Event Name'])
+            else:
+                event_gender_map[event_number] = GENDER_UNKNOWN
+        except (OSError, UnicodeDecodeError, csv.Error):
+            event_gender_map[event_number] = GENDER_UNKNOWN
+    return event_gender_map
@@ -0,0 +1,95 @@
+"""
+Event CSV Loader
+================
+
+Reads many cleaned event CSVs (cleaned_files/event_*.csv) into one DataFrame.
+Files are parsed in parallel on a thread pool by pyarrow's CSV reader, which
+releases the GIL, with an explicit schema so no types are inferred per file.
+The Arrow tables are concatenated without copying and converted to pandas once.
+
+Without pyarrow it falls back to pd.read_csv per file.
+
+Usage:
+    from event_loader import read_event_csvs
+
+    df = read_event_csvs(glob.glob('WSC_Club_Champs_2025/cleaned_files/event_*.csv'))
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# Explicit types for res_records.CSV_COLUMNS, matching the extractor's Parquet
+# dataset. Times stay text here; callers turn them into hundredths with time_codec.
+EVENT_CSV_TYPES: Dict[str, str] = {
+    'Event Number': 'string',
+    'Event Name': 'string',
+    'Event Category': 'string',
+    'Gender': 'string',
+    'Name': 'string',
+    'Age': 'int16',
+    'Club': 'string',
+    'Time': 'string',
+    'WA Points': 'int16',
+}
+
+
+def read_event_csvs(paths: Iterable[str], jobs: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read event CSV files into a single dataframe, rows in the order given.
+
+    Unreadable files are reported and skipped.
+
+    Args:
+        paths: Event CSV file paths
+        jobs: Reader threads (None = one per CPU, 1 = read in this thread)
+
+    Returns:
+        Combined dataframe (empty if no file could be read)
+    """
+    paths = list(paths)
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return _read_with_pandas(paths)
+
+    read_options = pacsv.ReadOptions(use_threads=False)
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.type_for_alias(alias) for name, alias in EVENT_CSV_TYPES.items()},
+        strings_can_be_null=True,
+    )
+
+    def read_one(path: str):
+        try:
+            return pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+        except (OSError, pa.ArrowInvalid) as e:
+            print(f"Error reading {path}: {e}")
+            return None
+
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs <= 1:
+        tables = [read_one(path) for path in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            # map() keeps input order, so the result does not depend on thread timing
+            tables = list(pool.map(read_one, paths))
+
+    tables = [t for t in tables if t is not None]
+    if not tables:
+        return pd.DataFrame()
+    # Files missing a column get it filled with nulls
+    return pa.concat_tables(tables, promote_options='default').to_pandas()
+
+
+def _read_with_pandas(paths: List[str]) -> pd.DataFrame:
+    """Sequential fallback used when pyarrow is not installed."""
+    dfs = []
+    for path in paths:
+        try:
+            dfs.append(pd.read_csv(path, dtype={'Event Number': 'string', 'Time': 'string'}))
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}")
+    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Synthetic RES Meet Generator
+============================
+
+Writes realistic MeetManager-style .RES files (same layout as
+WSC_Club_Champs_2025/raw_files) for scale and benchmark testing. Output is
+fully determined by the seed, so runs are reproducible.
+
+Each event file has the usual title/session preamble, an ``EVENT NNN`` header
+and one block per age group with places, tab-separated result rows, and
+non-scoring DNC/DNF/DQ rows at the end of the block. Malformed lines come in
+two kinds: space-aligned rows (recovered by the extractor's fallback
+tokenizer) and truncated rows (rejected).
+
+Usage:
+    python generate_synthetic_meet.py --output-dir synthetic_meet/raw_files [--scale 10] [--seed 1]
+    python generate_synthetic_meet.py --output-dir big/raw_files --scale 1000 --events 72 --zip
+
+Or from Python:
+    from generate_synthetic_meet import generate_meet
+    summary = generate_meet('synthetic_meet/raw_files', swimmers=2000, seed=1)
+"""
+
+import argparse
+import os
+import random
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+# Default meet size, matching the 2025 club championships (~200 swimmers)
+BASE_SWIMMERS = 200
+BASE_EVENTS = 36
+
+HOME_CLUB = 'WORM'
+VISITING_CLUBS = ['Pershore', 'Royal Wolv', 'Malvern', 'Kiddermins', 'Droitwich', 'Evesham',
+                  'Bromsgrove', 'Redditch', 'Stourport', 'Tewkesbury', 'Ledbury', 'Hereford']
+
+# (distance, stroke) of the club championship programme, each swum by both genders
+PROGRAMME = [
+    (800, 'Freestyle'), (1500, 'Freestyle'), (400, 'IM'), (400, 'Freestyle'),
+    (200, 'Butterfly'), (50, 'Backstroke'), (100, 'IM'), (100, 'Breaststroke'),
+    (200, 'Backstroke'), (50, 'Breaststroke'), (100, 'Freestyle'), (50, 'Butterfly'),
+    (200, 'Freestyle'), (100, 'Backstroke'), (200, 'Breaststroke'), (200, 'IM'),
+    (50, 'Freestyle'), (100, 'Butterfly'),
+]
+
+# Approximate 1000-point base times in seconds: (male, female)
+BASE_TIMES = {
+    (50, 'Freestyle'): (20.16, 22.93), (100, 'Freestyle'): (44.84, 50.25),
+    (200, 'Freestyle'): (99.37, 110.31), (400, 'Freestyle'): (212.25, 231.30),
+    (800, 'Freestyle'): (443.42, 477.42), (1500, 'Freestyle'): (846.88, 908.24),
+    (50, 'Backstroke'): (22.11, 25.23), (100, 'Backstroke'): (48.33, 54.89),
+    (200, 'Backstroke'): (105.63, 118.04),
+    (50, 'Breaststroke'): (24.95, 28.37), (100, 'Breaststroke'): (55.28, 62.36),
+    (200, 'Breaststroke'): (120.16, 132.50),
+    (50, 'Butterfly'): (21.75, 24.38), (100, 'Butterfly'): (47.78, 54.05),
+    (200, 'Butterfly'): (106.85, 119.32),
+    (100, 'IM'): (49.28, 56.51), (200, 'IM'): (109.63, 121.86), (400, 'IM'): (234.81, 255.48),
+}
+
+FIRST_NAMES = {
+    'Female': ['Amelia', 'Ava', 'Chloe', 'Daisy', 'Ella', 'Emily', 'Evie', 'Freya', 'Grace', 'Hannah',
+               'Isla', 'Ivy', 'Lily', 'Lucy', 'Maisie', 'Mia', 'Millie', 'Olivia', 'Phoebe', 'Poppy',
+               'Rosie', 'Ruby', 'Sienna', 'Sophie', 'Willow', 'Zara'],
+    'Male/Open': ['Alfie', 'Archie', 'Arthur', 'Charlie', 'Ethan', 'Finley', 'Freddie', 'George', 'Harry',
+                  'Henry', 'Isaac', 'Jack', 'Jacob', 'James', 'Joseph', 'Leo', 'Louis', 'Noah', 'Oliver',
+                  'Oscar', 'Reuben', 'Samuel', 'Theo', 'Thomas', 'Toby', 'William'],
+}
+# Surnames are built from syllables; chosen so no name spells a status token or header word
+SURNAME_PARTS = (
+    ['AB', 'BAR', 'BEN', 'BRO', 'CAR', 'CHIL', 'DAV', 'ED', 'FAR', 'GOOD', 'GRAN', 'HAR', 'HIG', 'KIL',
+     'LAT', 'MAN', 'MOR', 'PIP', 'PUL', 'RICH', 'SAD', 'SHER', 'STAN', 'SUR', 'TAY', 'WAL', 'WIL', 'WRIGHT'],
+    ['', '', 'DER', 'FORD', 'GOR', 'HAM', 'KIN', 'LEY', 'LING', 'MER', 'RIS', 'SON', 'TON', 'WOOD'],
+    ['', '', '', 'BY', 'ER', 'LOW', 'RY', 'SELL', 'TEN'],
+)
+
+STATUS_TIMES = ('DNC', 'DNF', 'DQ T     ')
+
+# Event numbers are three digits: session digit + two-digit event index
+MAX_EVENTS = 9 * 99
+
+
+def _event_number(index: int) -> str:
+    """Three-digit event number for the index-th event (0 -> '101')."""
+    return f"{index // 99 + 1}{index % 99 + 1:02d}"
+
+
+def _format_time(seconds: float) -> str:
+    """Format a race time the way RES files do ('   40.97', ' 9:30.08', '11:09.31')."""
+    hundredths = int(round(seconds * 100))
+    minutes, rem = divmod(hundredths, 6000)
+    if minutes:
+        text = f"{minutes}:{rem // 100:02d}.{rem % 100:02d}"
+    else:
+        text = f"{rem // 100}.{rem % 100:02d}"
+    return text.rjust(8)
+
+
+def _unique_names(rng: random.Random, count: int, gender: str, taken: set) -> List[str]:
+    """Draw count distinct 'First SURNAME' names (at most 22 characters, as in RES files)."""
+    names: List[str] = []
+    firsts = FIRST_NAMES[gender]
+    while len(names) < count:
+        surname = ''.join(rng.choice(part) for part in SURNAME_PARTS)
+        name = f"{rng.choice(firsts)} {surname}"[:22]
+        if name not in taken:
+            taken.add(name)
+            names.append(name)
+    return names
+
+
+def generate_meet(output_dir: str, events: int = BASE_EVENTS, swimmers: int = BASE_SWIMMERS,
+                  clubs: int = 3, age_groups: int = 8, min_age: int = 9, entries: float = 7.0,
+                  dnc_rate: float = 0.03, dq_rate: float = 0.02, malformed_rate: float = 0.005,
+                  home_share: float = 0.9, seed: int = 0, year: int = 25,
+                  zip_name: Optional[str] = None) -> Dict[str, int]:
+    """
+    Write a synthetic meet as one .RES file per event.
+
+    Args:
+        output_dir: Folder to write the .RES files (or the .zip archive) into
+        events: Number of events (both genders; at most 891)
+        swimmers: Number of distinct swimmers, split evenly by gender
+        clubs: Number of clubs (the home club plus visitors)
+        age_groups: Number of age-group blocks; the last one is 'Yrs/Over'
+        min_age: Age of the youngest age group
+        entries: Mean number of events entered per swimmer
+        dnc_rate: Share of entries listed as DNC/DNF
+        dq_rate: Share of entries listed as DQ
+        malformed_rate: Share of result rows written malformed (half
+            space-aligned but recoverable, half truncated)
+        home_share: Share of swimmers from the home club when clubs > 1
+        seed: Random seed; the same arguments and seed give identical files
+        year: Two-digit year used in the title and file names (CC25E101.RES)
+        zip_name: Write the files as members of this archive in output_dir
+            instead of loose files
+
+    Returns:
+        Dict of counts: files, events, swimmers, entries, results (rows the
+        extractor should keep), non_scoring and malformed (rejected rows)
+    """
+    if not 1 <= events <= MAX_EVENTS:
+        raise ValueError(f"events must be between 1 and {MAX_EVENTS}, got {events}")
+    if swimmers < 2 or clubs < 1 or age_groups < 1:
+        raise ValueError("need at least 2 swimmers, 1 club and 1 age group")
+
+    rng = random.Random(seed)
+    club_names = [HOME_CLUB] + [VISITING_CLUBS[i] if i < len(VISITING_CLUBS) else f"Club {i + 1:03d}"
+                                for i in range(clubs - 1)]
+    max_age = min_age + age_groups - 1
+
+    # Event list: cycle the programme, alternating Female / Open/Male
+    event_list: List[Tuple[str, str, int, str]] = []
+    for index in range(events):
+        distance, stroke = PROGRAMME[(index // 2) % len(PROGRAMME)]
+        gender = 'Female' if index % 2 == 0 else 'Male/Open'
+        event_list.append((_event_number(index), gender, distance, stroke))
+    events_by_gender = {g: [i for i, e in enumerate(event_list) if e[1] == g] for g in ('Female', 'Male/Open')}
+
+    # Swimmers: (name, age, club, base points)
+    taken: set = set()
+    roster: List[Tuple[str, int, str, float, str]] = []
+    for gender, count in (('Female', swimmers - swimmers // 2), ('Male/Open', swimmers // 2)):
+        for name in _unique_names(rng, count, gender, taken):
+            age = rng.randint(min_age, max_age)
+            if age == max_age and age_groups > 1:
+                age += rng.choice((0, 0, 1, 2))
+            if clubs == 1 or rng.random() < home_share:
+                club = HOME_CLUB
+            else:
+                club = rng.choice(club_names[1:])
+            ability = min(900.0, max(30.0, rng.gauss(120 + 35 * (age - min_age), 80)))
+            roster.append((name, age, club, ability, gender))
+
+    # Entries per event
+    entrants: List[List[int]] = [[] for _ in event_list]
+    for swimmer_index, (_, _, _, _, gender) in enumerate(roster):
+        options = events_by_gender[gender]
+        if not options:
+            continue
+        k = min(len(options), max(1, int(round(rng.gauss(entries, 2)))))
+        for event_index in rng.sample(options, k):
+            entrants[event_index].append(swimmer_index)
+
+    summary = {'files': 0, 'events': len(event_list), 'swimmers': len(roster), 'entries': 0,
+               'results': 0, 'non_scoring': 0, 'malformed': 0}
+    os.makedirs(output_dir, exist_ok=True)
+    archive = zipfile.ZipFile(os.path.join(output_dir, zip_name), 'w', zipfile.ZIP_DEFLATED) if zip_name else None
+    try:
+        for event_index, (number, gender, distance, stroke) in enumerate(event_list):
+            title = f"{'Female' if gender == 'Female' else 'Open/Male'} {distance}m {stroke}"
+            base_time = BASE_TIMES.get((distance, stroke), (60.0, 66.0))[0 if gender == 'Male/Open' else 1]
+            lines = [f"Worcester SC Club Championships {year}", "", f"Session - {number[0]}", "at",
+                     f"EVENT {number} {title}".ljust(45)]
+
+            blocks: Dict[int, List[int]] = {}
+            for swimmer_index in entrants[event_index]:
+                blocks.setdefault(min(roster[swimmer_index][1], max_age), []).append(swimmer_index)
+
+            for block_age in sorted(blocks):
+                label = (f"{block_age:02d} Yrs/Over" if block_age == max_age and age_groups > 1
+                         else f"{block_age:02d} Yrs")
+                lines.append(f"{label} Age Group - Full Results")
+                lines.append("Place\tName\tAaD\tClub\t\tTime\t\t\tWA Pts\t")
+
+                finished, non_scoring = [], []
+                for swimmer_index in blocks[block_age]:
+                    name, age, club, ability, _ = roster[swimmer_index]
+                    roll = rng.random()
+                    if roll < dnc_rate:
+                        non_scoring.append((name, age, club, rng.choice(STATUS_TIMES[:2])))
+                        continue
+                    if roll < dnc_rate + dq_rate:
+                        non_scoring.append((name, age, club, STATUS_TIMES[2]))
+                        continue
+                    points = min(999.0, max(1.0, ability * rng.gauss(1.0, 0.12)))
+                    seconds = round(base_time * (1000.0 / points) ** (1 / 3), 2)
+                    wa = max(1, min(999, int(1000 * (base_time / seconds) ** 3)))
+                    finished.append((seconds, name, age, club, wa))
+
+                finished.sort()
+                for place, (seconds, name, age, club, wa) in enumerate(finished, start=1):
+                    time_text = _format_time(seconds)
+                    roll = rng.random()
+                    if roll < malformed_rate / 2:
+                        # Space-aligned export; the fallback tokenizer still reads it
+                        lines.append(f"{place}.  {name}  {age}  {club}  {time_text.strip()}  {wa}")
+                        summary['results'] += 1
+                    elif roll < malformed_rate:
+                        # Truncated mid-row; the extractor must reject it
+                        lines.append(f"{place}.\t{name}\t{str(age)[:1]}")
+                        summary['malformed'] += 1
+                    else:
+                        lines.append(f"{place}.\t{name}\t{age}\t{club}\t\t{time_text}\t\t\t{wa}\t")
+                        summary['results'] += 1
+                for name, age, club, status in non_scoring:
+                    lines.append(f" \t{name}\t{age}\t{club}\t\t{status}\t\t\t\t")
+                summary['non_scoring'] += len(non_scoring)
+                summary['entries'] += len(finished) + len(non_scoring)
+
+            content = '\r\n'.join(lines) + '\r\n'
+            filename = f"CC{year:02d}E{number}.RES"
+            if archive is not None:
+                archive.writestr(filename, content)
+            else:
+                with open(os.path.join(output_dir, filename), 'w', encoding='utf-8', newline='') as f:
+                    f.write(content)
+            summary['files'] += 1
+    finally:
+        if archive is not None:
+            archive.close()
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output-dir', required=True, help='Folder to write the .RES files into')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help=f'Multiplier on the default {BASE_SWIMMERS} swimmers (e.g. 10, 100, 1000)')
+    parser.add_argument('--swimmers', type=int, help='Exact number of swimmers (overrides --scale)')
+    parser.add_argument('--events', type=int, default=BASE_EVENTS, help='Number of events (default: %(default)s)')
+    parser.add_argument('--clubs', type=int, default=3, help='Number of clubs (default: %(default)s)')
+    parser.add_argument('--age-groups', type=int, default=8, help='Age-group blocks per event (default: %(default)s)')
+    parser.add_argument('--entries', type=float, default=7.0, help='Mean events per swimmer (default: %(default)s)')
+    parser.add_argument('--dnc-rate', type=float, default=0.03, help='Share of DNC/DNF entries (default: %(default)s)')
+    parser.add_argument('--dq-rate', type=float, default=0.02, help='Share of DQ entries (default: %(default)s)')
+    parser.add_argument('--malformed-rate', type=float, default=0.005,
+                        help='Share of malformed result rows (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: %(default)s)')
+    parser.add_argument('--zip', action='store_true', help='Write one synthetic_meet.zip archive instead of loose files')
+    args = parser.parse_args()
+
+    swimmers = args.swimmers or max(2, int(round(BASE_SWIMMERS * args.scale)))
+    try:
+        summary = generate_meet(args.output_dir, events=args.events, swimmers=swimmers, clubs=args.clubs,
+                                age_groups=args.age_groups, entries=args.entries, dnc_rate=args.dnc_rate,
+                                dq_rate=args.dq_rate, malformed_rate=args.malformed_rate, seed=args.seed,
+                                zip_name='synthetic_meet.zip' if args.zip else None)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"✓ Wrote {summary['files']} RES files to {args.output_dir}"
+          f"{' (synthetic_meet.zip)' if args.zip else ''}")
+    print(f"  Swimmers: {summary['swimmers']:,}  Entries: {summary['entries']:,}  "
+          f"Results: {summary['results']:,}  Non-scoring: {summary['non_scoring']:,}  "
+          f"Malformed: {summary['malformed']:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ Streamlit Frontend - Data Ingest + Scoreboard Runner
 
 Allows a user to:
 - Select a championship year (creates `WSC_Club_Champs_{YEAR}` if missing)
-- Upload .RES files and extract events via SwimEventExtractor into `cleaned_files/`
+- Upload .RES files (or .zip archives of them) and extract events via SwimEventExtractor into `cleaned_files/`
 - Run the scoreboard process to generate results into `championship_results/`
 """
 
@@ -18,13 +18,15 @@ from typing import List, Dict
 
 # Local imports
 from swim_event_extractor import SwimEventExtractor
+from championship_scoring import build_selection_table, summarise_selection
+from score_artifact import SCORE_ARTIFACT_NAME, SELECTION_ARTIFACT_NAME
 from club_championships_scoreboard import (
     get_event_gender_map_from_csvs,
     load_all_events,
     export_all_events_union,
-    calculate_championship_scores,
-    create_age_groups,
+    identify_swimmers,
     export_scoreboard,
+    export_selection_table,
     export_swimmer_narratives,
 )
 
@@ -129,9 +131,9 @@ def main():
 
     uploaded_files = st.file_uploader(
         "MeetManager .RES files", 
-        type=["RES", "res"], 
+        type=["RES", "res", "zip"], 
         accept_multiple_files=True,
-        help="Upload one or more .RES files from MeetManager"
+        help="Upload one or more .RES files from MeetManager, or the session .zip archives"
     )
     extract_btn = st.button("Extract events to cleaned_files")
 
@@ -144,7 +146,7 @@ def main():
                 raw_files_dir = os.path.join(base_folder, "raw_files")
                 os.makedirs(raw_files_dir, exist_ok=True)
                 
-                st.write(f"Saving {len(uploaded_files)} .RES file(s) to raw_files…")
+                st.write(f"Saving {len(uploaded_files)} .RES/.zip file(s) to raw_files…")
                 for uploaded_file in uploaded_files:
                     target_path = os.path.join(raw_files_dir, uploaded_file.name)
                     if os.path.exists(target_path):
@@ -184,16 +186,20 @@ def main():
             df_all = load_all_events(base_folder)
             st.write(f"Loaded {len(df_all)} rows across {df_all['Event Number'].nunique() if 'Event Number' in df_all.columns else 0} events")
 
+            st.write("Identifying swimmers…")
+            df_all = identify_swimmers(base_folder, df_all)
+
             st.write("Exporting unioned events file (Parquet/CSV)…")
             export_all_events_union(base_folder, df_all)
 
             st.write("Calculating championship scores…")
-            df_champs = calculate_championship_scores(df_all, event_gender_map)
-            df_champs = create_age_groups(df_champs)
+            selection = build_selection_table(df_all, event_gender_map)
+            df_champs = summarise_selection(selection)
 
             st.write("Exporting scoreboards and narratives…")
             export_scoreboard(df_champs, base_folder)
-            export_swimmer_narratives(base_folder, df_all, event_gender_map)
+            export_selection_table(base_folder, selection)
+            export_swimmer_narratives(base_folder, selection)
 
             results_dir = os.path.join(base_folder, "championship_results")
             produced = [
@@ -202,6 +208,8 @@ def main():
                 os.path.join(results_dir, "championship_age_group_winners.csv"),
                 os.path.join(results_dir, "championship_swimmer_narratives.csv"),
                 os.path.join(results_dir, "events_all.parquet"),
+                os.path.join(results_dir, SCORE_ARTIFACT_NAME),
+                os.path.join(results_dir, SELECTION_ARTIFACT_NAME),
             ]
 
             st.success("✓ Scoreboard complete. Files written under `championship_results/`.")
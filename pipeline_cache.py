@@ -0,0 +1,256 @@
+"""
+Pipeline Cache
+==============
+
+Skips pipeline stages whose inputs have not changed since the last run.
+
+A stage's key is a SHA-256 over its parameters, the contents of its input
+files and the keys of the stages it depends on. When the key matches the one
+recorded in the cache state and the files the stage wrote are still as it
+left them, the stage is a hit: it does not run, and its result is read back
+from the cache only if a later stage that does run needs it. Files are
+compared by size and mtime first and only re-hashed when those differ, as in
+the extractor's manifest.
+
+Results are stored next to the state: DataFrames (or dicts of them) as
+Parquet, anything else as JSON.
+
+Usage:
+    from pipeline_cache import PipelineRunner
+
+    runner = PipelineRunner('WSC_Club_Champs_2025/championship_results/.pipeline_cache')
+    events = runner.stage('load', lambda: load_all_events(folder), files=csv_paths)
+    scores = runner.stage('score', lambda: score(events.value), deps=[events], params={'max_events': 8})
+    runner.print_report()
+    runner.save()
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from stage_profiler import StageProfiler
+
+PIPELINE_CACHE_DIR = '.pipeline_cache'
+STATE_NAME = '_state.json'
+STATE_VERSION = 1
+
+_MISSING = object()
+
+
+class Stage:
+    """One stage of a run: its key, whether it ran, and its (lazily loaded) result."""
+
+    def __init__(self, runner: 'PipelineRunner', name: str, key: str):
+        self.runner = runner
+        self.name = name
+        self.key = key
+        self.hit = False
+        self.seconds = 0.0
+        self._value = _MISSING
+
+    @property
+    def value(self) -> Any:
+        """The stage's result, read from the cache on first use after a hit."""
+        if self._value is _MISSING:
+            start = time.perf_counter()
+            self._value = self.runner._load_value(self.name)
+            self.seconds += time.perf_counter() - start
+        return self._value
+
+
+class PipelineRunner:
+    """Runs named stages in order, skipping those whose inputs are unchanged."""
+
+    def __init__(self, cache_dir: str, use_cache: bool = True, code_files: Iterable[str] = (),
+                 profiler: Optional[StageProfiler] = None):
+        """
+        Args:
+            cache_dir: Folder for the cache state and stored results
+            use_cache: When False every stage runs (the cache is still refreshed)
+            code_files: Source files whose edits invalidate every stage
+            profiler: Records time and memory for every stage when given
+        """
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.profiler = profiler
+        self.stages: List[Stage] = []
+        state = self._load_state()
+        self._entries: Dict[str, Dict] = state.get('stages', {})
+        # path -> {size, mtime_ns, sha256}, so unchanged files are never re-read
+        self._file_hashes: Dict[str, Dict] = state.get('files', {})
+        self._code_key = self._files_digest(code_files)
+
+    def stage(self, name: str, run: Callable[[], Any], deps: Iterable[Stage] = (),
+              files: Iterable[str] = (), params: Optional[Dict] = None,
+              outputs: Iterable[str] = ()) -> Stage:
+        """
+        Run a stage unless its inputs and outputs are unchanged since it last ran.
+
+        Args:
+            name: Stage name, unique within the pipeline
+            run: Computes the stage result (may be None)
+            deps: Stages whose results `run` uses
+            files: Input files (missing files count as an input too)
+            params: JSON-serialisable parameters that change the result
+            outputs: Files `run` writes; the stage re-runs if any has changed
+
+        Returns:
+            The Stage, whose .value is the result
+        """
+        with self.measure(name) as record:
+            stage = self._run_stage(name, run, deps, files, params, outputs)
+            record['cache'] = 'hit' if stage.hit else 'miss'
+        return stage
+
+    def measure(self, name: str) -> ContextManager[Dict]:
+        """Profile a block that is not a cached stage (a no-op without a profiler)."""
+        return self.profiler.measure(name) if self.profiler else nullcontext({})
+
+    def _run_stage(self, name: str, run: Callable[[], Any], deps: Iterable[Stage], files: Iterable[str],
+                   params: Optional[Dict], outputs: Iterable[str]) -> Stage:
+        start = time.perf_counter()
+        deps, files, outputs = list(deps), list(files), list(outputs)
+        stage = Stage(self, name, self._key(name, deps, files, params))
+        self.stages.append(stage)
+        entry = self._entries.get(name)
+        if (self.use_cache and entry and entry.get('key') == stage.key
+                and self._outputs_unchanged(entry.get('outputs', {}))):
+            stage.hit = True
+            stage.seconds += time.perf_counter() - start
+            print(f"♻️  {name}: inputs unchanged, using cached result")
+            return stage
+
+        stage._value = run()
+        # The stage may have rewritten its own inputs (e.g. an index it keeps),
+        # so the recorded key reflects the files as it left them
+        stage.key = self._key(name, deps, files, params)
+        stored, artifacts = self._store_value(name, stage._value)
+        # Cached results count as outputs, so a hit is never left without one
+        self._entries[name] = {
+            'key': stage.key,
+            'stored': stored,
+            'outputs': {path: self._stat(path) for path in outputs + artifacts if os.path.exists(path)},
+        }
+        stage.seconds += time.perf_counter() - start
+        return stage
+
+    def print_report(self) -> None:
+        """Print each stage's hit/miss and time."""
+        print(f"\n{'Stage':<16} {'Cache':<6} {'Time':>10}")
+        print('-' * 34)
+        for stage in self.stages:
+            print(f"{stage.name:<16} {'hit' if stage.hit else 'miss':<6} {stage.seconds * 1000:>7.1f} ms")
+        total = sum(stage.seconds for stage in self.stages)
+        hits = sum(stage.hit for stage in self.stages)
+        print('-' * 34)
+        print(f"{'total':<16} {f'{hits}/{len(self.stages)}':<6} {total * 1000:>7.1f} ms")
+
+    def save(self) -> None:
+        """Atomically write the cache state (stage keys and file hashes)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = os.path.join(self.cache_dir, STATE_NAME)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'stages': self._entries,
+                       'files': dict(sorted(self._file_hashes.items()))}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _load_state(self) -> Dict:
+        """The saved state; empty if missing, unreadable or an older version."""
+        try:
+            with open(os.path.join(self.cache_dir, STATE_NAME), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if state.get('version') == STATE_VERSION else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _key(self, name: str, deps: List[Stage], files: List[str], params: Optional[Dict]) -> str:
+        """Hash of everything the stage's result depends on."""
+        digest = hashlib.sha256(json.dumps({'stage': name, 'params': params}, sort_keys=True,
+                                           default=str).encode())
+        digest.update(self._code_key.encode())
+        for dep in deps:
+            digest.update(f"{dep.name}={dep.key}".encode())
+        digest.update(self._files_digest(files).encode())
+        return digest.hexdigest()
+
+    def _files_digest(self, paths: Iterable[str]) -> str:
+        """Combined hash of the files' paths and contents."""
+        digest = hashlib.sha256()
+        for path in sorted(os.path.normpath(p) for p in paths):
+            digest.update(f"{path}\0{self._file_hash(path)}\0".encode())
+        return digest.hexdigest()
+
+    def _file_hash(self, path: str) -> str:
+        """SHA-256 of a file, reusing the recorded hash while size and mtime match."""
+        try:
+            stat = self._stat(path)
+        except OSError:
+            self._file_hashes.pop(path, None)
+            return 'missing'
+        known = self._file_hashes.get(path)
+        if known and known['size'] == stat['size'] and known['mtime_ns'] == stat['mtime_ns']:
+            return known['sha256']
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self._file_hashes[path] = {**stat, 'sha256': digest.hexdigest()}
+        return digest.hexdigest()
+
+    @staticmethod
+    def _stat(path: str) -> Dict[str, int]:
+        st = os.stat(path)
+        return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    def _outputs_unchanged(self, outputs: Dict[str, Dict]) -> bool:
+        """True when every file the stage wrote still has the size and mtime it left."""
+        for path, recorded in outputs.items():
+            try:
+                if self._stat(path) != recorded:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _artifact_path(self, name: str, part: Optional[str], ext: str) -> str:
+        slug = name.replace(' ', '_')
+        return os.path.join(self.cache_dir, f"{slug}.{part}.{ext}" if part else f"{slug}.{ext}")
+
+    def _store_value(self, name: str, value: Any) -> Tuple[Dict, List[str]]:
+        """Write a stage result to the cache; returns how it was stored and the files written."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if value is None:
+            return {'kind': 'none'}, []
+        if isinstance(value, pd.DataFrame):
+            path = self._artifact_path(name, None, 'parquet')
+            value.to_parquet(path)
+            return {'kind': 'frame'}, [path]
+        if isinstance(value, dict) and value and all(isinstance(v, pd.DataFrame) for v in value.values()):
+            paths = []
+            for part, frame in value.items():
+                paths.append(self._artifact_path(name, part, 'parquet'))
+                frame.to_parquet(paths[-1])
+            return {'kind': 'frames', 'parts': list(value)}, paths
+        path = self._artifact_path(name, None, 'json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(value, f)
+        return {'kind': 'json'}, [path]
+
+    def _load_value(self, name: str) -> Any:
+        """Read back a stage result written by _store_value."""
+        stored = self._entries[name]['stored']
+        if stored['kind'] == 'none':
+            return None
+        if stored['kind'] == 'frame':
+            return pd.read_parquet(self._artifact_path(name, None, 'parquet'))
+        if stored['kind'] == 'frames':
+            return {part: pd.read_parquet(self._artifact_path(name, part, 'parquet')) for part in stored['parts']}
+        with open(self._artifact_path(name, None, 'json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
@@ -0,0 +1,78 @@
+"""
+Compact Result Records
+======================
+
+Row type produced by the RES parser. A ``ResultRecord`` is a NamedTuple, so a
+parsed row costs one tuple instead of a ten-key dict, and the event-level
+strings (event name, category, gender, age group) plus club names are interned
+so every row of an event shares the same string objects.
+
+``records_to_columns`` transposes a list of records into one tuple per column
+in a single pass, which is what the CSV and Arrow writers consume.
+
+Usage:
+    from res_records import ResultRecord, records_to_columns
+
+    columns = records_to_columns(records)
+    columns['WA Points']  # -> (359, 412, ...)
+"""
+
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
+
+# Columns of the per-event CSV files, in file order
+CSV_COLUMNS = ('Event Number', 'Event Name', 'Event Category', 'Gender',
+               'Name', 'Age', 'Club', 'Time', 'WA Points')
+# CSV columns plus the age-group block each row was listed under
+RECORD_COLUMNS = CSV_COLUMNS + ('Age Group',)
+
+
+class ResultRecord(NamedTuple):
+    """One swimmer result, in RECORD_COLUMNS order."""
+
+    event_number: str
+    event_name: str
+    event_category: str
+    gender: str
+    name: str
+    age: int
+    club: str
+    time: str
+    wa_points: int
+    age_group: str
+
+    def as_dict(self) -> Dict[str, Union[str, int]]:
+        """Return the row as a dict keyed by the CSV column names."""
+        return dict(zip(RECORD_COLUMNS, self))
+
+
+def intern_str(value: str) -> str:
+    """Intern a repeated string (event fields, club names); passes None through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def as_records(rows: Iterable[Union[ResultRecord, Dict]]) -> List[ResultRecord]:
+    """Accept ResultRecords or legacy row dicts and return a list of records."""
+    records: List[ResultRecord] = []
+    for row in rows:
+        if isinstance(row, ResultRecord):
+            records.append(row)
+        else:
+            records.append(ResultRecord(*(row.get(col, '') for col in RECORD_COLUMNS)))
+    return records
+
+
+def records_to_columns(records: Sequence[ResultRecord]) -> Dict[str, Tuple]:
+    """
+    Transpose records into columns in one pass.
+
+    Args:
+        records: Parsed result records
+
+    Returns:
+        Dict mapping each RECORD_COLUMNS name to a tuple of values
+        (empty tuples when there are no records)
+    """
+    if not records:
+        return {col: () for col in RECORD_COLUMNS}
+    return dict(zip(RECORD_COLUMNS, zip(*records)))
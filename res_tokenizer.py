@@ -0,0 +1,143 @@
+"""
+RES Result-Line Tokenizer
+=========================
+
+Splits MeetManager .RES result lines into their fields using precompiled,
+tab-aware patterns. Result lines in our RES files follow the header layout
+
+    Place<TAB>Name<TAB>AaD<TAB>Club<TAB><TAB>Time<TAB><TAB><TAB>WA Pts
+
+so the common case is a single ``str.split('\\t')`` (the fast path). Lines
+that do not fit that layout (space-aligned exports, odd spacing) fall back to
+the permissive regex/split logic the extractor has always used.
+
+Usage:
+    from res_tokenizer import TokenizerStats, tokenize_result_line
+
+    stats = TokenizerStats()
+    fields = tokenize_result_line('1.\\tLucy PIPER\\t12\\tWORM\\t\\t6:04.09\\t\\t\\t359', stats)
+    # -> ('Lucy PIPER', '12', 'WORM', '6:04.09', '359')
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+# (name, age, club, time, wa_points) as raw strings
+ResultFields = Tuple[str, str, str, str, str]
+
+# Non-scoring markers, matched as standalone tokens only
+# (avoid false positives like 'JENKINS' containing 'NS')
+STATUS_TOKENS = frozenset({'DNC', 'DNF', 'DQ', 'NS'})
+
+# Field count of a tab-separated result line (trailing tab stripped)
+_TAB_FIELDS = 9
+
+_PLACE_FIELD_RE = re.compile(r'\d+\.', re.ASCII)
+_STATUS_RE = re.compile(r'(?:^|\s)(?:DNC|DNF|DQ|NS)(?:\s|$)')
+_STRICT_ROW_RE = re.compile(
+    r'^\s*\d+\.\s+(.+?)\s+(\d{1,2})\s+([A-Za-z]{3,4})\s+([0-9:\.]+)\s+(\d+)\s*$'
+)
+_LOOSE_SPLIT_RE = re.compile(r'\t+|\s{2,}')
+
+
+class TokenizerStats:
+    """Counts how result lines were tokenized."""
+
+    __slots__ = ('fast', 'fallback', 'rejected')
+
+    def __init__(self):
+        self.fast = 0
+        self.fallback = 0
+        self.rejected = 0
+
+    def add(self, other: Dict[str, int]) -> None:
+        """Accumulate counts from another stats dict (e.g. from a worker process)."""
+        self.fast += other.get('fast', 0)
+        self.fallback += other.get('fallback', 0)
+        self.rejected += other.get('rejected', 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {'fast': self.fast, 'fallback': self.fallback, 'rejected': self.rejected}
+
+    def __repr__(self) -> str:
+        return f"TokenizerStats(fast={self.fast}, fallback={self.fallback}, rejected={self.rejected})"
+
+
+def _tokenize_tabbed(line: str) -> Optional[ResultFields]:
+    """Fast path: split a tab-separated result line by position.
+
+    Returns None when the line does not have the expected layout, so the caller
+    can try the fallback path. Non-scoring rows are returned as an empty tuple.
+    """
+    fields = line.split('\t')
+    if len(fields) != _TAB_FIELDS or fields[4] or fields[6] or fields[7]:
+        return None
+    place, name, age, club, _, time_token, _, _, wa = fields
+    time_token = time_token.strip()
+    wa = wa.strip()
+    if not (_PLACE_FIELD_RE.fullmatch(place.strip()) and time_token):
+        return None
+    if any(tok in STATUS_TOKENS for tok in time_token.upper().split()) or wa.upper() in STATUS_TOKENS:
+        return ()
+    age = age.strip()
+    if not (age.isdigit() and wa.isdigit()):
+        return None
+    return name.strip(), age, club.strip(), time_token, wa
+
+
+def _tokenize_fallback(line: str) -> Optional[ResultFields]:
+    """Fallback path: strict whitespace regex, then a permissive split."""
+    if _STATUS_RE.search(line.upper()):
+        return None
+
+    m = _STRICT_ROW_RE.match(line)
+    if m:
+        return (m.group(1).strip(), m.group(2).strip(), m.group(3).strip(),
+                m.group(4).strip(), m.group(5).strip())
+
+    # Permissive split on tabs / multi-space, then pick last numeric as WA
+    parts = [p for p in _LOOSE_SPLIT_RE.split(line) if p]
+    # Expect at least: place, name, age, club, time, wa
+    if len(parts) < 6:
+        return None
+    # WA points tends to be the last numeric token, time the token before it
+    for wa_index in range(len(parts) - 1, 0, -1):
+        if parts[wa_index].isdigit():
+            break
+    else:
+        return None
+    time_token = parts[wa_index - 1]
+    if not time_token:
+        return None
+    return parts[1], parts[2], parts[3], time_token, parts[wa_index]
+
+
+def tokenize_result_line(line: str, stats: Optional[TokenizerStats] = None) -> Optional[ResultFields]:
+    """
+    Split one stripped result line into (name, age, club, time, wa_points).
+
+    Args:
+        line: A result line with surrounding whitespace stripped
+            (e.g. '1.\\tLucy PIPER\\t12\\tWORM\\t\\t6:04.09\\t\\t\\t359')
+        stats: Optional counters updated with the path the line took
+
+    Returns:
+        Tuple of raw field strings, or None for non-scoring (DNC/DQ/...) or
+        unparseable lines. Values still need the extractor's validators.
+    """
+    fields = _tokenize_tabbed(line)
+    if fields is not None:
+        if stats is not None:
+            if fields:
+                stats.fast += 1
+            else:
+                stats.rejected += 1
+        return fields or None
+
+    fields = _tokenize_fallback(line)
+    if stats is not None:
+        if fields is None:
+            stats.rejected += 1
+        else:
+            stats.fallback += 1
+    return fields
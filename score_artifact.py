@@ -0,0 +1,195 @@
+"""
+Score Artifacts
+===============
+
+Files the scoreboard writes so the dashboard can load results instead of
+re-scoring on every cold start, both in championship_results/:
+- championship_scores_all.parquet: championship scores for every swimmer
+  (the full summarise_selection output; the scoreboard CSVs hold only the
+  boys/girls tables)
+- championship_selection.parquet: every race with the selection outcome
+  (the build_selection_table output): Included, the Reason it does or does
+  not count, and its Category_Rank and Scoring_Rank
+
+Each file's Parquet metadata records:
+- schema_version: bumped whenever the columns or their meaning change
+- rules: the championship rules the file was computed under
+- events_file / events_sha256: the events union it came from
+
+A reader treats a file as stale, and scores live instead, when any of these
+no longer match: an older schema, changed rules, or a union file that has
+been rewritten since (e.g. by the results watcher).
+
+Usage:
+    from score_artifact import (load_score_artifact, load_selection_artifact,
+                                write_score_artifact, write_selection_artifact)
+
+    write_score_artifact(results_dir, df_champs)
+    write_selection_artifact(results_dir, selection)
+    df_scores = load_score_artifact(results_dir)  # None when missing or stale
+    selection = load_selection_artifact(results_dir)
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from championship_scoring import SCORE_COLUMNS, SELECTION_COLUMNS, scoring_rules
+from swimmer_identity import SWIMMER_ID
+
+SCORE_ARTIFACT_NAME = 'championship_scores_all.parquet'
+SCORE_SCHEMA_VERSION = 1
+SELECTION_ARTIFACT_NAME = 'championship_selection.parquet'
+SELECTION_SCHEMA_VERSION = 1
+# Key of the JSON entry in the Parquet schema metadata
+METADATA_KEY = b'championship_scores'
+# Events union files, in the order readers prefer them
+EVENTS_FILES = ('events_all.parquet', 'events_all.csv')
+
+
+def events_fingerprint(results_dir: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Identify the events union in a results folder.
+
+    Returns:
+        (file name, SHA-256 of its contents), or (None, None) without one
+    """
+    for name in EVENTS_FILES:
+        path = os.path.join(results_dir, name)
+        if os.path.exists(path):
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            return name, digest.hexdigest()
+    return None, None
+
+
+def write_score_artifact(results_dir: str, df_scores: pd.DataFrame) -> str:
+    """
+    Atomically write every swimmer's scores with their provenance.
+
+    Write the events union first: the artifact records the union's hash.
+
+    Args:
+        results_dir: The championship_results/ folder
+        df_scores: summarise_selection output (all swimmers)
+
+    Returns:
+        Path of the written file
+    """
+    return _write_artifact(os.path.join(results_dir, SCORE_ARTIFACT_NAME), df_scores[SCORE_COLUMNS],
+                           SCORE_SCHEMA_VERSION, swimmers=len(df_scores))
+
+
+def write_selection_artifact(results_dir: str, selection: pd.DataFrame) -> str:
+    """
+    Atomically write every race's selection outcome with its provenance.
+
+    Write the events union first: the artifact records the union's hash.
+
+    Args:
+        results_dir: The championship_results/ folder
+        selection: build_selection_table output (index labels are not kept)
+
+    Returns:
+        Path of the written file
+    """
+    return _write_artifact(os.path.join(results_dir, SELECTION_ARTIFACT_NAME), selection,
+                           SELECTION_SCHEMA_VERSION, rows=len(selection))
+
+
+def _write_artifact(path: str, df: pd.DataFrame, schema_version: int, **fields) -> str:
+    """Write df to path via a temporary file, with provenance plus `fields` in its metadata."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    events_file, events_sha256 = events_fingerprint(os.path.dirname(path))
+    metadata = {
+        'schema_version': schema_version,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'rules': scoring_rules(),
+        'events_file': events_file,
+        'events_sha256': events_sha256,
+        **fields,
+    }
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           METADATA_KEY: json.dumps(metadata).encode()})
+    tmp_path = path + '.tmp'
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_score_metadata(path: str) -> Optional[Dict]:
+    """The provenance recorded in a score artifact, or None if it has none or cannot be read."""
+    try:
+        import pyarrow.parquet as pq
+        raw = (pq.read_schema(path).metadata or {}).get(METADATA_KEY)
+        return json.loads(raw) if raw else None
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def stale_reason(results_dir: str, metadata: Optional[Dict],
+                 schema_version: int = SCORE_SCHEMA_VERSION) -> Optional[str]:
+    """Why an artifact with this metadata cannot be used, or None when it is current."""
+    if metadata is None:
+        return 'missing or unreadable'
+    if metadata.get('schema_version') != schema_version:
+        return f"schema version {metadata.get('schema_version')} (expected {schema_version})"
+    if metadata.get('rules') != scoring_rules():
+        return 'championship rules have changed'
+    if (metadata.get('events_file'), metadata.get('events_sha256')) != events_fingerprint(results_dir):
+        return 'events have changed since it was written'
+    return None
+
+
+def load_score_artifact(results_dir: str) -> Optional[pd.DataFrame]:
+    """
+    Load every swimmer's scores if the artifact is present and current.
+
+    Args:
+        results_dir: The championship_results/ folder
+
+    Returns:
+        Scores with SCORE_COLUMNS, or None when the caller should score live
+    """
+    df = _load_artifact(results_dir, SCORE_ARTIFACT_NAME, SCORE_SCHEMA_VERSION)
+    return df if df is not None and list(df.columns) == SCORE_COLUMNS else None
+
+
+def load_selection_artifact(results_dir: str) -> Optional[pd.DataFrame]:
+    """
+    Load every race's selection outcome if the artifact is present and current.
+
+    Args:
+        results_dir: The championship_results/ folder
+
+    Returns:
+        The selection table (RangeIndex), or None when the caller should
+        build it live
+    """
+    df = _load_artifact(results_dir, SELECTION_ARTIFACT_NAME, SELECTION_SCHEMA_VERSION)
+    required = {SWIMMER_ID, 'Event Number', 'Gender', 'WA Points', *SELECTION_COLUMNS}
+    return df if df is not None and required <= set(df.columns) else None
+
+
+def _load_artifact(results_dir: str, name: str, schema_version: int) -> Optional[pd.DataFrame]:
+    """Read an artifact, or None (with a warning) when it is missing, stale or unreadable."""
+    path = os.path.join(results_dir, name)
+    reason = stale_reason(results_dir, read_score_metadata(path) if os.path.exists(path) else None,
+                          schema_version)
+    if reason is not None:
+        print(f"⚠️ Not using {name}: {reason}")
+        return None
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read {path} ({e})")
+        return None
@@ -0,0 +1,158 @@
+"""
+Stage Profiler
+==============
+
+Wall time, CPU time and memory per pipeline stage, for spotting regressions as
+meets grow and checking that optimisations help.
+
+Per stage it records:
+- wall_s / cpu_s: elapsed and process CPU seconds
+- peak_rss_mb: the process's peak resident set size at the end of the stage
+  (the OS only keeps a high-water mark, so this never goes down)
+- py_peak_mb: tracemalloc high-water above the stage's starting allocation,
+  i.e. the most Python/NumPy memory the stage itself held at once (Arrow
+  buffers are not traced)
+
+Usage:
+    from stage_profiler import StageProfiler
+
+    profiler = StageProfiler(cprofile=True)
+    with profiler.measure('load'):
+        df_all = load_all_events(folder)
+    profiler.print_report()
+    profiler.write_json('timings.json', folder=folder)
+    profiler.dump_stats('scoreboard.prof')
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, or None where unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / (1 << 20) if sys.platform == 'darwin' else peak / 1024
+
+
+class StageProfiler:
+    """Collects per-stage timing and memory figures."""
+
+    def __init__(self, trace_memory: bool = True, cprofile: bool = False):
+        """
+        Args:
+            trace_memory: Track Python allocations with tracemalloc (slows
+                allocation-heavy code somewhat)
+            cprofile: Also run cProfile over every measured stage
+        """
+        self.stages: List[Dict] = []
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._profile = None
+        if cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[Dict]:
+        """
+        Measure the enclosed block as one stage.
+
+        Yields the stage's record, so callers can add fields (e.g. cache hit).
+        """
+        record: Dict = {'name': name}
+        if self.trace_memory:
+            traced_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        if self._profile is not None:
+            self._profile.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = time.perf_counter() - wall
+            record['cpu_s'] = time.process_time() - cpu
+            if self._profile is not None:
+                self._profile.disable()
+            record['peak_rss_mb'] = peak_rss_mb()
+            if self.trace_memory:
+                record['py_peak_mb'] = (tracemalloc.get_traced_memory()[1] - traced_start) / (1 << 20)
+            self.stages.append(record)
+
+    def print_report(self) -> None:
+        """Print one row per stage plus totals."""
+        print(f"\n{'Stage':<16} {'Cache':<6} {'Wall':>10} {'CPU':>10} {'Peak RSS':>10} {'Py peak':>10}")
+        print('-' * 67)
+        for stage in self.stages:
+            print(f"{stage['name']:<16} {stage.get('cache', '-'):<6} {stage['wall_s'] * 1000:>7.1f} ms "
+                  f"{stage['cpu_s'] * 1000:>7.1f} ms {_mb(stage['peak_rss_mb']):>10} {_mb(stage.get('py_peak_mb')):>10}")
+        print('-' * 67)
+        print(f"{'total':<16} {'':<6} {sum(s['wall_s'] for s in self.stages) * 1000:>7.1f} ms "
+              f"{sum(s['cpu_s'] for s in self.stages) * 1000:>7.1f} ms {_mb(peak_rss_mb()):>10}")
+
+    def write_json(self, path: str, **metadata) -> None:
+        """
+        Write the stage figures, with machine details, as JSON.
+
+        Args:
+            path: Output file
+            **metadata: Extra top-level fields (e.g. folder, row counts)
+        """
+        report = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            **metadata,
+            'machine': machine_info(),
+            'stages': self.stages,
+            'total_wall_s': sum(s['wall_s'] for s in self.stages),
+            'total_cpu_s': sum(s['cpu_s'] for s in self.stages),
+            'peak_rss_mb': peak_rss_mb(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    def dump_stats(self, path: str) -> None:
+        """Write the cProfile statistics (open with pstats or snakeviz)."""
+        if self._profile is None:
+            raise ValueError("profiler was created without cprofile=True")
+        self._profile.dump_stats(path)
+
+
+def machine_info() -> Dict:
+    """Interpreter, library and hardware details to store with timings."""
+    import numpy as np
+    import pandas as pd
+    info = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+    try:
+        import pyarrow
+        info['pyarrow'] = pyarrow.__version__
+    except ImportError:
+        info['pyarrow'] = None
+    return info
+
+
+def _mb(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value:.1f} MB"
@@ -13,27 +13,64 @@ Usage:
     extractor.extract_all_events_from_res('WSC_Club_Champs_2025/raw_files')
 
 Or run from command line:
-    python swim_event_extractor.py --res-dir <folder> [--output-dir <folder>]
+    python swim_event_extractor.py --res-dir <folder|archive.zip> [--output-dir <folder>] [--jobs N] [--full]
+                                  [--format csv|parquet]
+
+--res-dir may point at a folder of .RES files, a folder of .zip archives as
+exported by the meet software, or a single .zip; archives are read in place.
+Re-runs only re-parse RES files that are new or changed since the last run
+(tracked in cleaned_files/_manifest.json); pass --full to re-parse everything.
+Every run also rewrites cleaned_files/_event_index.csv (number, name, gender,
+category, rows and source of each event) for readers that need event metadata.
+--format parquet writes typed Arrow batches (times as int hundredths,
+categorical event/club columns) into one partitioned Parquet dataset at
+cleaned_files/events_parquet/ instead of one CSV per event.
 """
 
 import csv
+import hashlib
+import json
 import os
 import re
+import shutil
 import sys
-from typing import List, Dict, Optional, Tuple
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from event_descriptor import clean_event_title, describe_event
+from event_index import write_event_index
+from res_records import CSV_COLUMNS, ResultRecord, as_records, intern_str, records_to_columns
+from res_tokenizer import TokenizerStats, tokenize_result_line
 
 
 class SwimEventExtractor:
     """Extract and clean swimming event data from .RES files."""
+
+    # Written to cleaned_files/ to record which RES files produced which CSVs
+    MANIFEST_NAME = '_manifest.json'
+    MANIFEST_VERSION = 2
+    # Partitioned Parquet dataset (one event_number=XXX/ folder per event) under cleaned_files/
+    PARQUET_DATASET = 'events_parquet'
+    OUTPUT_FORMATS = ('csv', 'parquet')
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, output_format: str = 'csv'):
         """
         Initialize the extractor.
         
         Args:
             output_dir: Directory to save CSV files (defaults to current directory)
+            output_format: 'csv' (one event_XXX.csv per event) or 'parquet'
+                (typed Arrow batches in cleaned_files/events_parquet/)
         """
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {self.OUTPUT_FORMATS}, got {output_format!r}")
         self.output_dir = output_dir or '.'
+        self.output_format = output_format
+        # Change set from the most recent extract_all_events_from_res() call
+        self.last_change_set: Dict[str, List[str]] = {}
+        # How result lines were tokenized (fast tab split vs fallback regex)
+        self.tokenizer_stats = TokenizerStats()
     
     @staticmethod
     def sanitize_folder_name(name: str) -> str:
@@ -72,23 +109,8 @@ class SwimEventExtractor:
         Returns:
             Clean event name with gender (e.g., "Male 400m Freestyle", "Female 100m IM")
         """
-        # Remove "EVENT XXX" prefix (e.g., "EVENT 103 Open/Male 400m Freestyle" -> "Open/Male 400m Freestyle")
-        clean_name = re.sub(r'^EVENT\s+\d+\s+', '', event_name, flags=re.IGNORECASE)
-        
-        # Keep gender markers - don't remove them!
-        # The gender information is important for the dashboard
-        
-        # If nothing left or looks wrong, return the original
-        if not clean_name or len(clean_name.strip()) < 3:
-            # Try to extract just the race description from original
-            # Look for patterns like "400m Freestyle", "100m IM", etc.
-            match = re.search(r'(\d+m?\s+[\w\s]+)$', event_name, flags=re.IGNORECASE)
-            if match:
-                clean_name = match.group(1)
-            else:
-                clean_name = event_name
-        
-        return clean_name.strip()
+        # e.g. "EVENT 103 Open/Male 400m Freestyle" -> "Open/Male 400m Freestyle"
+        return clean_event_title(event_name)
     
     @staticmethod
     def _determine_gender_from_event_name(event_name: str) -> str:
@@ -101,14 +123,7 @@ class SwimEventExtractor:
         Returns:
             Gender string ("Male/Open", "Female", or "Unknown")
         """
-        event_lower = event_name.lower()
-        
-        if 'female' in event_lower:
-            return 'Female'
-        elif 'male' in event_lower or 'open' in event_lower:
-            return 'Male/Open'
-        else:
-            return 'Unknown'
+        return describe_event(event_name).gender
     
     @staticmethod
     def _categorize_event(event_name: str) -> str:
@@ -129,40 +144,7 @@ class SwimEventExtractor:
         Returns:
             Event category
         """
-        event_lower = event_name.lower()
-        
-        # Check for 50m events (Sprint)
-        if '50m' in event_lower or '50 m' in event_lower:
-            return 'Sprint'
-        
-        # Check for Distance events (800m and 1500m)
-        if '800m' in event_lower or '1500m' in event_lower:
-            return 'Distance'
-        
-        # Check for IM events
-        if 'im' in event_lower or 'medley' in event_lower:
-            return 'IM'
-        
-        # Check for Freestyle events (100m, 200m, 400m - excluding 50m Sprint and 800m/1500m Distance)
-        if 'freestyle' in event_lower or 'free' in event_lower:
-            return 'Free'
-        
-        # Check for Form events (Backstroke, Breaststroke, Butterfly)
-        # Split into 100 Form and 200 Form
-        is_form_stroke = any(stroke in event_lower for stroke in ['backstroke', 'breaststroke', 'butterfly', 'back', 'breast', 'fly'])
-        
-        if is_form_stroke:
-            # Determine if it's 100m or 200m
-            if '100m' in event_lower or '100 m' in event_lower:
-                return '100 Form'
-            elif '200m' in event_lower or '200 m' in event_lower:
-                return '200 Form'
-            else:
-                # Default to form if distance unclear
-                return '100 Form'
-        
-        # Default fallback
-        return 'Other'
+        return describe_event(event_name).category
     
     @staticmethod
     def validate_name(name) -> bool:
@@ -291,12 +273,12 @@ class SwimEventExtractor:
         except (ValueError, TypeError):
             return None
     
-    def save_to_csv(self, data: List[Dict], event_number: str) -> str:
+    def save_to_csv(self, data: List[ResultRecord], event_number: str) -> str:
         """
         Save event data to a CSV file.
         
         Args:
-            data: List of swimmer data dictionaries
+            data: List of ResultRecords (or swimmer data dictionaries)
             event_number: The event number (used for filename)
             
         Returns:
@@ -308,14 +290,98 @@ class SwimEventExtractor:
         
         filename = os.path.join(cleaned_files_dir, f"event_{event_number}.csv")
         
+        n_columns = len(CSV_COLUMNS)
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Event Number', 'Event Name', 'Event Category', 'Gender', 'Name', 'Age', 'Club', 'Time', 'WA Points']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_COLUMNS)
+            # Trailing record fields such as 'Age Group' are not written
+            writer.writerows(record[:n_columns] for record in as_records(data))
         
         return filename
     
+    def _rows_to_record_batch(self, data: List[ResultRecord]):
+        """
+        Convert parsed rows into one typed Arrow record batch.
+
+        Event-level and club columns are dictionary-encoded (categorical) and
+        times are stored as int32 hundredths in 'Time_Hundredths'.
+        """
+        import pyarrow as pa
+
+        from time_codec import parse_times
+
+        columns = records_to_columns(as_records(data))
+
+        def dict_col(name):
+            return pa.array(columns[name], type=pa.string()).dictionary_encode()
+
+        return pa.RecordBatch.from_arrays([
+            dict_col('Event Number'),
+            dict_col('Event Name'),
+            dict_col('Event Category'),
+            dict_col('Gender'),
+            pa.array(columns['Name'], type=pa.string()),
+            pa.array(columns['Age'], type=pa.int16()),
+            dict_col('Club'),
+            pa.array(parse_times(columns['Time']), type=pa.int32()),
+            pa.array(columns['WA Points'], type=pa.int16()),
+            dict_col('Age Group'),
+        ], names=['Event Number', 'Event Name', 'Event Category', 'Gender', 'Name', 'Age', 'Club',
+                  'Time_Hundredths', 'WA Points', 'Age Group'])
+
+    def save_to_parquet(self, data: List[ResultRecord], event_number: str) -> str:
+        """
+        Save event data as one partition of the cleaned_files/events_parquet/ dataset.
+
+        Each event is written to ``event_number=XXX/part-0.parquet`` (replaced
+        atomically), so workers never write to the same file and the folder can
+        be read back as a single Hive-partitioned dataset.
+
+        Args:
+            data: List of ResultRecords (or swimmer data dictionaries)
+            event_number: The event number (used for the partition folder)
+
+        Returns:
+            Path to the created Parquet file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        part_dir = self._output_path(event_number)
+        os.makedirs(part_dir, exist_ok=True)
+        filename = os.path.join(part_dir, 'part-0.parquet')
+        tmp_filename = filename + '.tmp'
+        pq.write_table(pa.Table.from_batches([self._rows_to_record_batch(data)]), tmp_filename)
+        os.replace(tmp_filename, filename)
+        return filename
+
+    def _output_path(self, event_number: str) -> str:
+        """Path of the CSV file or Parquet partition folder written for an event."""
+        cleaned_files_dir = os.path.join(self.output_dir, 'cleaned_files')
+        if self.output_format == 'parquet':
+            return os.path.join(cleaned_files_dir, self.PARQUET_DATASET, f"event_number={event_number}")
+        return os.path.join(cleaned_files_dir, f"event_{event_number}.csv")
+
+    def save_event(self, data: List[ResultRecord], event_number: str) -> str:
+        """Save event data in the configured output format."""
+        if self.output_format == 'parquet':
+            return self.save_to_parquet(data, event_number)
+        return self.save_to_csv(data, event_number)
+
+    def _remove_event_outputs(self, event_number: str) -> List[str]:
+        """Delete an event's CSV file and Parquet partition, whichever exist; returns the removed paths."""
+        removed = []
+        for fmt in self.OUTPUT_FORMATS:
+            output_path = SwimEventExtractor(self.output_dir, fmt)._output_path(event_number)
+            if os.path.isdir(output_path):
+                shutil.rmtree(output_path)
+            elif os.path.exists(output_path):
+                os.remove(output_path)
+            else:
+                continue
+            removed.append(output_path)
+        return removed
+
     @staticmethod
     def _map_club_code(club_code: str) -> str:
         """
@@ -328,105 +394,105 @@ class SwimEventExtractor:
         }
         return mapping.get(code, club_code)
 
-    def _parse_res_file(self, res_path: str) -> Tuple[str, str, str, str, List[Dict]]:
+    # Event header like: "EVENT 302 Open/Male 400m Freestyle"
+    _EVENT_HEADER_RE = re.compile(r'^\s*EVENT\s+(\d{3})\s+(.+?)\s*$', flags=re.IGNORECASE)
+    # Age-group block header like: "11 Yrs Age Group - Full Results"
+    _AGE_GROUP_RE = re.compile(r'^\s*(.*?age group)\b', flags=re.IGNORECASE)
+    _PLACE_LINE_RE = re.compile(r'^\s*\d+\.', re.ASCII)
+
+    def _event_info(self, event_number: str, event_full_name: str) -> Tuple[str, str, str]:
+        """Return interned (event_name_clean, gender, event_category) for an event header."""
+        event_name_clean = self._extract_clean_event_name(f"EVENT {event_number} {event_full_name}", event_number or '')
+        descriptor = describe_event(event_name_clean)
+        return intern_str(event_name_clean), intern_str(descriptor.gender), intern_str(descriptor.category)
+
+    def iter_res_records(self, source, event_info: Optional[Dict[str, str]] = None) -> Iterator[Dict]:
         """
-        Parse a single .RES file into standardized event rows.
+        Stream standardized result rows from a .RES file as dicts.
 
-        Returns:
-            (event_number, event_name_clean, gender, event_category, data_rows)
+        Dict-per-row view of iter_result_records(); prefer that (or
+        _parse_res_file) when holding many rows in memory.
+
+        Args:
+            source: Path to a .RES file, or an open file object
+            event_info: Optional dict filled in with the first event's details
+
+        Yields:
+            Dicts with the CSV columns ('Event Number' ... 'WA Points', Age
+            and WA Points as int) plus 'Age Group', the block the row sat in
         """
-        event_number: Optional[str] = None
-        event_full_name: Optional[str] = None
-        data: List[Dict] = []
+        for record in self.iter_result_records(source, event_info):
+            yield record.as_dict()
 
-        try:
-            with open(res_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = [ln.rstrip('\n') for ln in f]
-        except Exception as e:
-            print(f"⚠ Failed to read {res_path}: {e}")
-            return '', '', 'Unknown', 'Other', []
+    def iter_result_records(self, source, event_info: Optional[Dict[str, str]] = None) -> Iterator[ResultRecord]:
+        """
+        Stream standardized result rows from a .RES file in a single pass.
 
-        # Find event header like: "EVENT 302 Open/Male 400m Freestyle"
-        header_re = re.compile(r'^\s*EVENT\s+(\d{3})\s+(.+?)\s*$', flags=re.IGNORECASE)
-        for ln in lines:
-            m = header_re.match(ln)
-            if m:
-                event_number = m.group(1)
-                event_full_name = m.group(2).strip()
-                break
-
-        if not event_number:
-            # If filename is like CC25E302.RES, fall back to extracting digits
-            base = os.path.basename(res_path)
-            m = re.search(r'E(\d{3})', base, flags=re.IGNORECASE)
-            if m:
-                event_number = m.group(1)
-            else:
-                event_number = ''
-        if not event_full_name:
-            # Try to derive a minimal name from file if header missing
-            event_full_name = f"Event {event_number}" if event_number else "Event"
+        Lines are read one at a time, so memory stays flat however large the
+        file is. The current ``EVENT`` header and age-group block header are
+        tracked as state, which means concatenated files containing several
+        events yield rows tagged with the right event each.
 
-        event_name_clean = self._extract_clean_event_name(f"EVENT {event_number} {event_full_name}", event_number or '')
-        gender = self._determine_gender_from_event_name(event_name_clean)
-        event_category = self._categorize_event(event_name_clean)
+        Args:
+            source: Path to a .RES file, or an open file object (text or
+                binary lines; bytes are decoded as UTF-8)
+            event_info: Optional dict filled in with the first event's
+                'event_number', 'event_name', 'gender' and 'event_category'
+                as soon as they are known
+
+        Yields:
+            ResultRecords (CSV columns plus the 'Age Group' block the row sat
+            in); event-level fields and clubs are interned strings
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8', errors='ignore') as f:
+                yield from self.iter_result_records(f, event_info)
+            return
 
-        # Parse result rows. Typical line example (tabs/separated spacing):
-        # 1.\tLucy PIPER\t12\tWORM\t 6:04.09\t\t\t359
-        # Skip header lines containing 'Place' or 'Age Group'
-        place_line_re = re.compile(r'^\s*\d+\.', re.ASCII)
+        source_name = os.path.basename(str(getattr(source, 'name', '') or ''))
+        event_number: Optional[str] = None
+        event_name_clean = gender = event_category = ''
+        age_group = ''
 
-        for raw in lines:
+        for raw in source:
+            if isinstance(raw, bytes):
+                raw = raw.decode('utf-8', errors='ignore')
             line = raw.strip()
             if not line:
                 continue
+
+            m = self._EVENT_HEADER_RE.match(line)
+            if m:
+                event_number = intern_str(m.group(1))
+                event_name_clean, gender, event_category = self._event_info(event_number, m.group(2).strip())
+                age_group = ''
+                if event_info is not None and 'event_number' not in event_info:
+                    event_info.update(event_number=event_number, event_name=event_name_clean,
+                                      gender=gender, event_category=event_category)
+                continue
+
             upper = line.upper()
-            if 'AGE GROUP' in upper or 'PLACE' in upper:
+            if 'AGE GROUP' in upper:
+                m = self._AGE_GROUP_RE.match(line)
+                age_group = intern_str(m.group(1).strip() if m else line)
                 continue
-            if not place_line_re.match(line):
+            if 'PLACE' in upper:
                 continue
-            # Skip non-scoring rows only if markers appear as standalone tokens
-            # (avoid false positives like 'JENKINS' containing 'NS')
-            if re.search(r'(?:^|\s)(?:DNC|DNF|DQ|NS)(?:\s|$)', upper):
+            if not self._PLACE_LINE_RE.match(line):
+                continue
+            fields = tokenize_result_line(line, self.tokenizer_stats)
+            if fields is None:
+                # Non-scoring (DNC/DQ/...) or unparseable row
                 continue
 
-            # Extract columns via regex aimed at: place, name, age, club, time, wa
-            # Name can include spaces and hyphens; club typically 3-4 uppercase letters
-            m = re.match(r'^\s*\d+\.\s+(.+?)\s+(\d{1,2})\s+([A-Za-z]{3,4})\s+([0-9:\.]+)\s+(\d+)\s*$', line)
-            if not m:
-                # Try a more permissive split on tabs / multi-space, then pick last numeric as WA
-                parts = [p for p in re.split(r'\t+|\s{2,}', line) if p]
-                # Expect at least: place, name, age, club, time, wa
-                if len(parts) < 6:
-                    continue
-                place = parts[0]
-                name = parts[1]
-                age = parts[2]
-                club = parts[3]
-                # WA points tends to be last numeric token
-                wa_match = None
-                for p in reversed(parts):
-                    if re.fullmatch(r'\d+', p):
-                        wa_match = p
-                        break
-                if not wa_match:
-                    continue
-                time_token = None
-                # time likely the token just before last numeric
-                try:
-                    wa_index = parts.index(wa_match)
-                    if wa_index - 1 >= 0:
-                        time_token = parts[wa_index - 1]
-                except ValueError:
-                    pass
-                if not time_token:
-                    continue
-            else:
-                name = m.group(1).strip()
-                age = m.group(2).strip()
-                club = m.group(3).strip()
-                time_token = m.group(4).strip()
-                wa_match = m.group(5).strip()
+            if event_number is None:
+                # Rows before any header: fall back to digits in a name like CC25E302.RES
+                m = re.search(r'E(\d{3})', source_name, flags=re.IGNORECASE)
+                event_number = intern_str(m.group(1)) if m else ''
+                event_name_clean, gender, event_category = self._event_info(
+                    event_number, f"Event {event_number}" if event_number else "Event")
+
+            name, age, club, time_token, wa_match = fields
 
             # Validate using existing validators
             if not self.validate_name(name):
@@ -434,7 +500,7 @@ class SwimEventExtractor:
             age_valid = self.validate_age(age)
             if age_valid is None:
                 continue
-            club_clean = self._map_club_code(club)
+            club_clean = intern_str(self._map_club_code(club))
             if self.validate_club(club_clean) is None:
                 continue
             time_clean = self.validate_time(time_token)
@@ -442,33 +508,192 @@ class SwimEventExtractor:
             if wa_valid is None:
                 continue
 
-            data.append({
-                'Event Number': event_number,
-                'Event Name': event_name_clean,
-                'Event Category': event_category,
-                'Gender': gender,
-                'Name': str(name).strip(),
-                'Age': age_valid,
-                'Club': club_clean,
-                'Time': time_clean,
-                'WA Points': wa_valid,
-            })
+            yield ResultRecord(event_number, event_name_clean, event_category, gender,
+                               str(name).strip(), age_valid, club_clean, time_clean, wa_valid, age_group)
+
+    def _parse_res_file(self, res_path: str, member: Optional[str] = None) -> Tuple[str, str, str, str, List[ResultRecord]]:
+        """
+        Parse a single .RES file into standardized event rows.
+
+        Thin wrapper over iter_result_records() for the one-event-per-file layout
+        written by the meet software.
+
+        Args:
+            res_path: Path to a .RES file, or to a .zip archive when member is given
+            member: Name of the .RES member to stream from the archive
+
+        Returns:
+            (event_number, event_name_clean, gender, event_category, data_rows)
+        """
+        info: Dict[str, str] = {}
+        try:
+            if member is None:
+                data = list(self.iter_result_records(res_path, info))
+            else:
+                with zipfile.ZipFile(res_path) as zf, zf.open(member) as raw:
+                    data = list(self.iter_result_records(raw, info))
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            print(f"⚠ Failed to read {res_path}{'/' + member if member else ''}: {e}")
+            return '', '', 'Unknown', 'Other', []
+
+        if 'event_number' not in info:
+            # No header: rows (if any) already carry the file-name fallback
+            if data:
+                first = data[0]
+                return first.event_number, first.event_name, first.gender, first.event_category, data
+            m = re.search(r'E(\d{3})', os.path.basename(member or res_path), flags=re.IGNORECASE)
+            event_number = m.group(1) if m else ''
+            event_name_clean, gender, event_category = self._event_info(
+                event_number, f"Event {event_number}" if event_number else "Event")
+            return event_number, event_name_clean, gender, event_category, data
+
+        return info['event_number'], info['event_name'], info['gender'], info['event_category'], data
+
+    @staticmethod
+    def _file_sha256(path: str) -> str:
+        """Return the SHA-256 hex digest of a file, read in 1 MB chunks."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def list_res_sources(res_path: str) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        List the .RES inputs found at a folder or .zip archive.
+
+        Folders may hold .RES files and/or .zip archives of them (as exported
+        by the meet software, e.g. "Results Session 6.zip"). Archive members
+        are read in place later, never unpacked to disk.
+
+        Args:
+            res_path: Folder of .RES/.zip files, or a single .zip file
+
+        Returns:
+            Sorted list of (key, path, member) where key is the manifest key
+            ("CC25E101.RES" or "Results Session 6.zip/CC25E601.RES"), path is
+            the file on disk and member the archive member name (None for
+            plain .RES files)
+        """
+        if os.path.isfile(res_path) and res_path.lower().endswith('.zip'):
+            folder, zip_names, res_names = os.path.dirname(res_path), [os.path.basename(res_path)], []
+        elif os.path.isdir(res_path):
+            folder = res_path
+            names = os.listdir(res_path)
+            zip_names = [f for f in names if f.lower().endswith('.zip')]
+            res_names = [f for f in names if f.upper().endswith('.RES')]
+        else:
+            raise FileNotFoundError(f"RES folder or .zip archive not found: {res_path}")
+
+        sources = [(f, os.path.join(folder, f), None) for f in res_names]
+        for zip_name in zip_names:
+            zip_path = os.path.join(folder, zip_name)
+            try:
+                with zipfile.ZipFile(zip_path) as zf:
+                    members = [i.filename for i in zf.infolist()
+                               if not i.is_dir() and i.filename.upper().endswith('.RES')]
+            except zipfile.BadZipFile:
+                print(f"⚠ Skipping {zip_name}: not a valid .zip archive")
+                continue
+            sources.extend((f"{zip_name}/{m}", zip_path, m) for m in members)
+        return sorted(sources)
+
+    @staticmethod
+    def _source_fingerprint(path: str, member: Optional[str]) -> Dict:
+        """
+        Cheap change-detection fields for a source (no content read).
+
+        Plain files use size + mtime; archive members use the size and CRC-32
+        stored in the zip's central directory, which is already a content hash.
+        """
+        if member is None:
+            st = os.stat(path)
+            return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        with zipfile.ZipFile(path) as zf:
+            info = zf.getinfo(member)
+        return {'size': info.file_size, 'hash': f"crc32:{info.CRC:08x}",
+                'mtime': '%04d-%02d-%02dT%02d:%02d:%02d' % info.date_time}
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """
+        Load the per-source manifest from cleaned_files/.
+
+        Returns:
+            Mapping of source key -> entry (hash, size, mtime, event_number,
+            event_name, rows). Empty if missing, unreadable or an older version.
+        """
+        path = os.path.join(self.output_dir, 'cleaned_files', self.MANIFEST_NAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != self.MANIFEST_VERSION:
+                return {}
+            return dict(manifest.get('files', {}))
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _save_manifest(self, entries: Dict[str, Dict]) -> None:
+        """Atomically write the manifest to cleaned_files/."""
+        path = os.path.join(self.output_dir, 'cleaned_files', self.MANIFEST_NAME)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.MANIFEST_VERSION,
+                       'files': dict(sorted(entries.items()))}, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _is_unchanged(self, path: str, entry: Optional[Dict], fingerprint: Dict) -> bool:
+        """
+        Decide whether a source still matches its manifest entry.
 
-        return event_number or '', event_name_clean, gender, event_category, data
+        Size and mtime (or the archive CRC) are checked first so untouched files
+        are never re-read; a plain file's SHA-256 is only computed when its
+        mtime differs (e.g. after a copy that reset mtimes). The event output
+        (CSV or Parquet partition) must also still exist on disk.
+        """
+        if not entry:
+            return False
+        if entry.get('rows') and entry.get('event_number'):
+            if not os.path.exists(self._output_path(entry['event_number'])):
+                return False
+        if entry.get('size') != fingerprint['size']:
+            return False
+        if 'hash' in fingerprint:
+            return entry.get('hash') == fingerprint['hash']
+        if entry.get('mtime_ns') == fingerprint['mtime_ns']:
+            return True
+        if entry.get('hash') != f"sha256:{self._file_sha256(path)}":
+            return False
+        entry['mtime_ns'] = fingerprint['mtime_ns']
+        return True
 
-    def extract_all_events_from_res(self, res_dir: str, verbose: bool = True) -> Dict[str, int]:
+    def extract_all_events_from_res(self, res_dir: str, verbose: bool = True, jobs: int = 1,
+                                    incremental: bool = True) -> Dict[str, int]:
         """
-        Parse all .RES files in a folder and write standardized CSVs to cleaned_files/.
+        Parse all .RES files in a folder or .zip archive(s) and write standardized CSVs to cleaned_files/.
+
+        ``res_dir`` may be a folder of .RES files, a folder of .zip archives
+        (or a mix), or a single .zip file. Archive members are streamed
+        straight through the parser; nothing is unpacked to disk.
+
+        A manifest (cleaned_files/_manifest.json) records each source's hash,
+        size and mtime together with the event number and row count it
+        produced. With ``incremental`` enabled only new or changed sources are
+        re-parsed, and CSVs whose source was removed are deleted. The event
+        index (cleaned_files/_event_index.csv) is rewritten from the manifest.
+        What changed is available afterwards in ``self.last_change_set``.
         
         Args:
-            res_dir: Directory containing .RES files
+            res_dir: Folder containing .RES and/or .zip files, or a .zip file
             verbose: Whether to print progress information
+            jobs: Number of worker processes used to parse files and write CSVs
+                (1 = run in this process, 0 or None = one per CPU)
+            incremental: Skip sources that are unchanged since the last run
             
         Returns:
-            Dictionary mapping event numbers to swimmer counts
+            Dictionary mapping event numbers to swimmer counts (in source order)
         """
-        if not os.path.isdir(res_dir):
-            raise FileNotFoundError(f"RES folder not found: {res_dir}")
+        sources = self.list_res_sources(res_dir)
 
         # Ensure output directory configured
         if self.output_dir is None:
@@ -478,56 +703,174 @@ class SwimEventExtractor:
         cleaned_dir = os.path.join(self.output_dir, 'cleaned_files')
         os.makedirs(cleaned_dir, exist_ok=True)
 
+        if self.output_format == 'parquet':
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError as e:
+                print(f"⚠️ Parquet output unavailable ({e}); falling back to CSV…")
+                self.output_format = 'csv'
+
         results: Dict[str, int] = {}
         total_swimmers = 0
 
-        files = sorted([f for f in os.listdir(res_dir) if f.upper().endswith('.RES')])
-        if verbose:
-            print(f"\n🏊 Found {len(files)} RES files")
-            print(f"📂 Output directory: {self.output_dir}/cleaned_files\n")
+        keys = [key for key, _, _ in sources]
+        previous = self._load_manifest()
+        manifest: Dict[str, Dict] = {}
+        fingerprints = {key: self._source_fingerprint(path, member) for key, path, member in sources}
+
+        to_parse: List[Tuple[str, str, Optional[str]]] = []
+        for key, path, member in sources:
+            entry = previous.get(key)
+            if incremental and self._is_unchanged(path, entry, fingerprints[key]):
+                manifest[key] = entry
+            else:
+                to_parse.append((key, path, member))
 
-        for fname in files:
-            path = os.path.join(res_dir, fname)
-            event_number, event_name, _, _, rows = self._parse_res_file(path)
-            if not event_number:
+        if not jobs:
+            jobs = os.cpu_count() or 1
+        jobs = max(1, min(jobs, len(to_parse) or 1))
+        if verbose:
+            print(f"\n🏊 Found {len(sources)} RES files ({len(to_parse)} to parse, "
+                  f"{len(sources) - len(to_parse)} unchanged)")
+            print(f"📂 Output directory: {self.output_dir}/cleaned_files")
+            if jobs > 1:
+                print(f"⚙️  Using {jobs} worker processes")
+            print()
+
+        paths = [path for _, path, _ in to_parse]
+        members = [member for _, _, member in to_parse]
+        if jobs > 1:
+            # Outcomes come back in submission order, so the summary below is
+            # identical to a sequential run regardless of which worker finishes first.
+            chunksize = max(1, len(paths) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                outcomes = list(pool.map(_extract_res_file, [self.output_dir] * len(paths), paths, members,
+                                         [self.output_format] * len(paths), chunksize=chunksize))
+        else:
+            outcomes = [_extract_res_file(self.output_dir, path, member, self.output_format)
+                        for path, member in zip(paths, members)]
+
+        # A file that fails to parse (e.g. half-written) keeps its previous
+        # manifest entry, so the outputs it last produced are left in place
+        failed_keys: List[str] = []
+        for (key, path, member), (event_number, event_name, row_count, error, line_stats) in zip(to_parse, outcomes):
+            self.tokenizer_stats.add(line_stats)
+            if error or not event_number:
+                failed_keys.append(key)
+                if key in previous:
+                    manifest[key] = previous[key]
                 if verbose:
-                    print(f"⚠ Skipping {fname}: could not determine event number")
+                    reason = error or "could not determine event number"
+                    kept = " (keeping previous output)" if key in previous else ""
+                    print(f"⚠ Failed to process {key}: {reason}{kept}")
                 continue
-            if rows:
-                self.save_to_csv(rows, event_number)
-                results[event_number] = len(rows)
-                total_swimmers += len(rows)
-                if verbose:
-                    print(f"✓ event_{event_number}.csv: {len(rows)} swimmers ({event_name})")
-            else:
-                results[event_number] = 0
+            entry = dict(fingerprints[key])
+            if member is None:
+                entry['hash'] = f"sha256:{self._file_sha256(path)}"
+            entry.update(event_number=event_number, event_name=event_name, rows=row_count)
+            manifest[key] = entry
+            if verbose:
+                if row_count:
+                    print(f"✓ event_{event_number}: {row_count} swimmers ({event_name})")
+                else:
+                    print(f"⚠ event_{event_number}: 0 swimmers ({event_name})")
+
+        # Delete CSVs for events no remaining source produces (the source was
+        # removed, or now holds another event). Only events the manifest
+        # previously recorded are touched, never hand-placed CSVs.
+        live_events = {e['event_number'] for e in manifest.values()}
+        events_deleted = sorted({e.get('event_number') for e in previous.values()
+                                 if e.get('event_number') and e['event_number'] not in live_events})
+        for event_number in events_deleted:
+            for output_path in self._remove_event_outputs(event_number):
                 if verbose:
-                    print(f"⚠ event_{event_number}.csv: 0 swimmers ({event_name})")
+                    print(f"🗑 Removed {os.path.basename(output_path)} (no RES file produces this event any more)")
+
+        self._save_manifest(manifest)
+        write_event_index(cleaned_dir, [(key, manifest[key]) for key in keys if key in manifest])
+
+        for key in keys:
+            entry = manifest.get(key)
+            if entry:
+                results[entry['event_number']] = entry['rows']
+        total_swimmers = sum(results.values())
+
+        parse_keys = [key for key, _, _ in to_parse]
+        parsed = [key for key in parse_keys if key not in failed_keys]
+        self.last_change_set = {
+            'added': [k for k in parsed if k not in previous],
+            'changed': [k for k in parsed if k in previous],
+            'removed': sorted(k for k in previous if k not in fingerprints),
+            'unchanged': [k for k in keys if k not in parse_keys],
+            'failed': failed_keys,
+            'events_updated': sorted({manifest[k]['event_number'] for k in parsed}),
+            'events_deleted': events_deleted,
+        }
 
         if verbose:
+            changes = self.last_change_set
             print(f"\n{'='*60}")
             print("SUMMARY:")
             print(f"  Total events: {len(results)}")
             print(f"  Total swimmers: {total_swimmers}")
-            print(f"  CSV files saved to: {self.output_dir}/cleaned_files")
+            print(f"  Changes: {len(changes['added'])} added, {len(changes['changed'])} changed, "
+                  f"{len(changes['removed'])} removed, {len(changes['unchanged'])} unchanged")
+            if failed_keys:
+                print(f"  Failed files: {len(failed_keys)}")
+            if to_parse:
+                line_stats = self.tokenizer_stats
+                print(f"  Result lines: {line_stats.fast} fast path, {line_stats.fallback} fallback, "
+                      f"{line_stats.rejected} skipped (DNC/DQ/unparseable)")
+            if self.output_format == 'parquet':
+                print(f"  Parquet dataset saved to: {self.output_dir}/cleaned_files/{self.PARQUET_DATASET}")
+            else:
+                print(f"  CSV files saved to: {self.output_dir}/cleaned_files")
             print(f"{'='*60}")
 
         return results
 
 
+def _extract_res_file(output_dir: str, res_path: str, member: Optional[str] = None,
+                      output_format: str = 'csv') -> Tuple[str, str, int, Optional[str], Dict[str, int]]:
+    """
+    Parse one .RES file (or .zip archive member) and write its event output.
+
+    Kept at module level so it can be pickled into ProcessPoolExecutor workers.
+    Errors are returned rather than raised so one bad file does not stop the
+    remaining workers.
+
+    Returns:
+        (event_number, event_name_clean, row_count, error_message_or_None,
+         tokenizer_stats_dict)
+    """
+    extractor = SwimEventExtractor(output_dir=output_dir, output_format=output_format)
+    try:
+        event_number, event_name, _, _, rows = extractor._parse_res_file(res_path, member)
+        if event_number and rows:
+            extractor.save_event(rows, event_number)
+        elif event_number:
+            # No valid results (e.g. all DQ): drop any earlier output, as a
+            # first extraction would never have written one
+            extractor._remove_event_outputs(event_number)
+        return event_number, event_name, len(rows), None, extractor.tokenizer_stats.as_dict()
+    except Exception as e:
+        return '', '', 0, f"{type(e).__name__}: {e}", extractor.tokenizer_stats.as_dict()
+
+
 def main():
     """Command-line interface."""
     args = sys.argv[1:]
     if not args or '--res-dir' not in args:
         print("Usage:")
-        print("  python swim_event_extractor.py --res-dir <folder> [--output-dir <folder>]")
+        print("  python swim_event_extractor.py --res-dir <folder|archive.zip> [--output-dir <folder>] [--jobs N] [--full]")
+        print("                                 [--format csv|parquet]")
         sys.exit(1)
 
     try:
         res_idx = args.index('--res-dir')
         res_dir = args[res_idx + 1]
     except Exception:
-        print("Error: --res-dir requires a folder path")
+        print("Error: --res-dir requires a folder or .zip path")
         sys.exit(1)
 
     output_dir = None
@@ -539,8 +882,28 @@ def main():
             print("Error: --output-dir requires a folder path")
             sys.exit(1)
 
-    extractor = SwimEventExtractor(output_dir=output_dir)
-    extractor.extract_all_events_from_res(res_dir)
+    jobs = 1
+    if '--jobs' in args:
+        try:
+            jobs_idx = args.index('--jobs')
+            jobs = int(args[jobs_idx + 1])
+        except Exception:
+            print("Error: --jobs requires a number of worker processes (0 = one per CPU)")
+            sys.exit(1)
+
+    output_format = 'csv'
+    if '--format' in args:
+        try:
+            fmt_idx = args.index('--format')
+            output_format = args[fmt_idx + 1]
+            if output_format not in SwimEventExtractor.OUTPUT_FORMATS:
+                raise ValueError(output_format)
+        except Exception:
+            print("Error: --format must be 'csv' or 'parquet'")
+            sys.exit(1)
+
+    extractor = SwimEventExtractor(output_dir=output_dir, output_format=output_format)
+    extractor.extract_all_events_from_res(res_dir, jobs=jobs, incremental='--full' not in args)
     print("\n✓ RES processing complete!")
 
 
@@ -0,0 +1,150 @@
+"""
+Swimmer Identity
+================
+
+Assigns every result row a stable integer swimmer_id, so grouping and joins
+run on int32 codes instead of free-text names, and two different swimmers who
+share a name are not merged.
+
+A swimmer is identified by a normalised (name, club, birth-year estimate)
+key: names and clubs are casefolded with whitespace collapsed, and the birth
+year is estimated as meet year minus age. The lookup table from keys to ids
+is kept in championship_results/swimmer_index.csv; ids already in it never
+change, and new swimmers are appended in key order, so the same data always
+gets the same ids.
+
+Known limits: a swimmer listed under two club names, or whose age changes
+during the meet, gets two ids.
+
+Usage:
+    from swimmer_identity import SWIMMER_ID, SwimmerIndex, meet_year_from_folder
+
+    swimmers = SwimmerIndex.load(index_path, meet_year_from_folder('WSC_Club_Champs_2025'))
+    df_all[SWIMMER_ID] = swimmers.assign(df_all)
+    swimmers.save(index_path)
+"""
+
+import os
+import re
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+SWIMMER_ID = 'swimmer_id'
+SWIMMER_INDEX_NAME = 'swimmer_index.csv'
+# Rows without a name are never a swimmer
+MISSING_ID = -1
+
+KEY_COLUMNS = ['Name_Key', 'Club_Key', 'Birth_Year']
+INDEX_COLUMNS = [SWIMMER_ID, 'Name', 'Club', 'Birth_Year', 'Name_Key', 'Club_Key']
+
+
+def normalise_names(values: pd.Series) -> pd.Series:
+    """Casefold and collapse whitespace ('  Jane  SMITH ' -> 'jane smith'); blanks become <NA>."""
+    normalised = values.astype('string').str.replace(r'\s+', ' ', regex=True).str.strip().str.casefold()
+    return normalised.mask(normalised == '')
+
+
+def meet_year_from_folder(folder: str) -> Optional[int]:
+    """The meet year in a championship folder name ('WSC_Club_Champs_2025' -> 2025), if any."""
+    years = re.findall(r'(?<!\d)(\d{4})(?!\d)', os.path.basename(os.path.normpath(folder)))
+    return int(years[-1]) if years else None
+
+
+class SwimmerIndex:
+    """Lookup table from normalised swimmer keys to integer ids."""
+
+    def __init__(self, meet_year: Optional[int] = None, table: Optional[pd.DataFrame] = None):
+        """
+        Args:
+            meet_year: Year ages were recorded in; birth years are estimated as
+                meet_year - age (just -age when unknown, which still tells
+                swimmers of one meet apart)
+            table: Existing lookup table with INDEX_COLUMNS (empty when None)
+        """
+        self.meet_year = meet_year or 0
+        if table is None:
+            table = pd.DataFrame({column: [] for column in INDEX_COLUMNS})
+        self.table = table.astype({SWIMMER_ID: 'int32', 'Birth_Year': 'Int32', 'Name': 'string',
+                                   'Club': 'string', 'Name_Key': 'string', 'Club_Key': 'string'})
+
+    @classmethod
+    def load(cls, path: str, meet_year: Optional[int] = None) -> 'SwimmerIndex':
+        """Load a saved lookup table; a missing or unreadable file gives an empty index."""
+        try:
+            table = pd.read_csv(path, dtype={'Name': 'string', 'Club': 'string', 'Name_Key': 'string',
+                                             'Club_Key': 'string'}, keep_default_na=False,
+                                na_values={'Birth_Year': ['']})
+            if not set(INDEX_COLUMNS) <= set(table.columns):
+                raise ValueError(f"missing columns in {path}")
+            return cls(meet_year, table[INDEX_COLUMNS])
+        except (OSError, ValueError) as e:
+            if os.path.exists(path):
+                print(f"⚠️ Could not read swimmer index {path} ({e}); starting a new one")
+            return cls(meet_year)
+
+    def save(self, path: str) -> None:
+        """Atomically write the lookup table as CSV."""
+        tmp_path = path + '.tmp'
+        self.table.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def assign(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Swimmer id of every row, registering swimmers not seen before.
+
+        Args:
+            df: Rows with Name, Club and Age columns (Club and Age optional)
+
+        Returns:
+            int32 array aligned with df; MISSING_ID where the name is blank
+        """
+        if len(df) == 0:
+            return np.empty(0, dtype=np.int32)
+        raw = pd.DataFrame({
+            'Name': df['Name'].to_numpy(),
+            'Club': df['Club'].to_numpy() if 'Club' in df.columns else None,
+            # float, so small integer ages (int8) cannot overflow against the year
+            'Age': pd.to_numeric(df['Age'], errors='coerce').astype('float64').to_numpy()
+            if 'Age' in df.columns else np.nan,
+        })
+        # Normalise each distinct raw triple once, not every row
+        codes = raw.groupby(['Name', 'Club', 'Age'], dropna=False, sort=False).ngroup().to_numpy()
+        uniques = raw.drop_duplicates().reset_index(drop=True)
+        keys = pd.DataFrame({
+            'Name': uniques['Name'].astype('string').str.strip(),
+            'Club': uniques['Club'].astype('string').str.strip(),
+            'Name_Key': normalise_names(uniques['Name']),
+            'Club_Key': normalise_names(uniques['Club']).fillna(''),
+            'Birth_Year': (self.meet_year - uniques['Age']).round().astype('Int32'),
+        })
+
+        named = keys['Name_Key'].notna()
+        found = keys[named].drop_duplicates(KEY_COLUMNS)
+        known = found.merge(self.table[KEY_COLUMNS], on=KEY_COLUMNS, how='left', indicator=True)
+        new = known[known['_merge'] == 'left_only'].drop(columns='_merge').sort_values(KEY_COLUMNS)
+        if len(new):
+            start = int(self.table[SWIMMER_ID].max()) + 1 if len(self.table) else 0
+            new.insert(0, SWIMMER_ID, np.arange(start, start + len(new), dtype=np.int32))
+            self.table = pd.concat([self.table, new[INDEX_COLUMNS].astype(self.table.dtypes)], ignore_index=True)
+
+        unique_ids = keys.merge(self.table[KEY_COLUMNS + [SWIMMER_ID]], on=KEY_COLUMNS, how='left')[SWIMMER_ID]
+        unique_ids = unique_ids.where(named, MISSING_ID).fillna(MISSING_ID).to_numpy(dtype=np.int32)
+        return unique_ids[codes]
+
+
+def with_swimmer_ids(df: pd.DataFrame, swimmers: Optional[SwimmerIndex] = None) -> pd.DataFrame:
+    """
+    Return df with a SWIMMER_ID column, assigning ids only if it has none.
+
+    Frames written before swimmer ids existed (e.g. an older events_all.parquet)
+    get ids from `swimmers`, or from a fresh in-memory index when None.
+    """
+    if SWIMMER_ID in df.columns:
+        return df
+    swimmers = swimmers if swimmers is not None else SwimmerIndex()
+    return df.assign(**{SWIMMER_ID: swimmers.assign(df)})
@@ -0,0 +1,111 @@
+"""
+Time Codec
+==========
+
+Race times as integer hundredths of a second. Whole columns are parsed in one
+vectorised pass, stored and compared as nullable int32 ('Time_Hundredths'),
+and only turned back into text for display.
+
+Accepted inputs: '31.95', '1:57.04', '4:17', '00:02:31.75', '75' (seconds).
+Decimals are truncated to hundredths ('31.9' is 31.90). Blanks, '-' and
+anything else unparsable become <NA>.
+
+Usage:
+    from time_codec import format_times, parse_times
+
+    hs = parse_times(df['Time'])         # '1:57.04' -> 11704
+    hs.min()                             # exact integer comparisons
+    format_times(hs)                     # 11704 -> '00:01:57.04'
+    format_times(hs, compact=True)       # 11704 -> '1:57.04'
+"""
+
+from typing import Iterable, Optional, Union
+
+import pandas as pd
+
+TIME_COLUMN = 'Time_Hundredths'
+TIME_DTYPE = 'Int32'
+
+# [[H:]M:]S[.frac]
+_TIME_PATTERN = r'^(?:(?:(\d{1,3}):)?(\d{1,3}):)?(\d{1,5})(?:\.(\d*))?$'
+
+
+def parse_times(values: Union[pd.Series, Iterable]) -> pd.Series:
+    """
+    Parse a column of time strings into integer hundredths.
+
+    Args:
+        values: Series (index kept) or any iterable of time strings
+
+    Returns:
+        Int32 Series of hundredths, <NA> where a time is missing or unparsable
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(list(values), dtype=object)
+    if pd.api.types.is_integer_dtype(values.dtype):
+        # Already hundredths
+        return values.astype(TIME_DTYPE)
+    parts = values.astype('string').str.strip().str.extract(_TIME_PATTERN)
+    matched = parts[2].notna()
+    hours, minutes, seconds = (parts[i].fillna('0').astype('int64') for i in range(3))
+    fraction = parts[3].fillna('').str[:2].str.ljust(2, '0').astype('int64')
+    hundredths = ((hours * 60 + minutes) * 60 + seconds) * 100 + fraction
+    return hundredths.astype(TIME_DTYPE).where(matched)
+
+
+def format_times(hundredths: Union[pd.Series, Iterable], compact: bool = False,
+                 missing: str = '-') -> pd.Series:
+    """
+    Format hundredths for display.
+
+    Args:
+        hundredths: Series (index kept) or iterable of integer hundredths
+        compact: 'M:SS.hh' / 'S.hh' without leading zeros instead of 'HH:MM:SS.hh'
+        missing: Text shown for missing times
+
+    Returns:
+        Series of formatted strings
+    """
+    if not isinstance(hundredths, pd.Series):
+        hundredths = pd.Series(list(hundredths), dtype=TIME_DTYPE)
+    valid = hundredths.notna()
+    hs = hundredths.fillna(0).astype('int64')
+    fraction = _two_digits(hs % 100)
+    if compact:
+        minutes = hs // 6000
+        text = (minutes.astype(str) + ':' + _two_digits(hs // 100 % 60) + '.' + fraction).where(
+            minutes > 0, (hs // 100).astype(str) + '.' + fraction)
+    else:
+        text = (_two_digits(hs // 360000) + ':' + _two_digits(hs // 6000 % 60) + ':'
+                + _two_digits(hs // 100 % 60) + '.' + fraction)
+    return text.where(valid, missing)
+
+
+def format_time(hundredths: Optional[int], compact: bool = False, missing: str = '-') -> str:
+    """Format a single value; see format_times."""
+    if hundredths is None or pd.isna(hundredths):
+        return missing
+    hs = int(hundredths)
+    if compact:
+        minutes, rest = divmod(hs, 6000)
+        return f"{minutes}:{rest // 100:02d}.{rest % 100:02d}" if minutes else f"{hs // 100}.{hs % 100:02d}"
+    return f"{hs // 360000:02d}:{hs // 6000 % 60:02d}:{hs // 100 % 60:02d}.{hs % 100:02d}"
+
+
+def with_time_hundredths(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with its text 'Time' column replaced by TIME_COLUMN in place.
+
+    Frames that already carry TIME_COLUMN (or have no times) are returned as is,
+    so older events files written with text times still load.
+    """
+    if TIME_COLUMN in df.columns or 'Time' not in df.columns:
+        return df
+    df = df.copy()
+    df.insert(df.columns.get_loc('Time'), TIME_COLUMN, parse_times(df.pop('Time')))
+    return df
+
+
+def _two_digits(values: pd.Series) -> pd.Series:
+    """Zero-pad non-negative integers to at least two digits."""
+    return values.astype(str).str.zfill(2)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Live Results Watcher
+====================
+
+Long-running companion to the ingest app for use during a gala session. Polls
+`raw_files/` (or a separate drop folder) and, as soon as a new or changed .RES
+file has finished landing, parses only that file, patches the in-memory events
+union, re-scores only the swimmers in the affected events and atomically
+refreshes `championship_results/` so the dashboard picks the change up.
+
+Usage:
+    python watch_results.py [YEAR|FOLDER] [--drop-dir <folder>] [--interval SECONDS]
+                            [--debounce SECONDS] [--format csv|parquet]
+
+Files appearing in --drop-dir are moved into `raw_files/` once they have
+stopped changing for --debounce seconds. Stop with Ctrl+C.
+"""
+
+import contextlib
+import glob
+import io
+import os
+import shutil
+import sys
+import time
+from typing import Dict, Optional, Set, Tuple
+
+import pandas as pd
+
+from res_records import CSV_COLUMNS
+from swim_event_extractor import SwimEventExtractor
+from championship_scoring import IncrementalScorer
+from event_index import event_gender
+from swimmer_identity import SWIMMER_INDEX_NAME, SwimmerIndex, meet_year_from_folder
+from club_championships_scoreboard import (
+    export_all_events_union,
+    export_all_swimmer_scores,
+    export_selection_table,
+    export_scoreboard_tables,
+    get_event_gender_map_from_csvs,
+    load_all_events,
+)
+
+WATCH_EXTENSIONS = ('.res', '.zip')
+STAGING_DIR = '.championship_results.staging'
+
+# (size, mtime_ns) per watched file name
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def snapshot_folder(folder: str) -> Snapshot:
+    """Return the size and mtime of every RES/zip file directly inside folder."""
+    snapshot: Snapshot = {}
+    try:
+        entries = list(os.scandir(folder))
+    except FileNotFoundError:
+        return snapshot
+    for entry in entries:
+        if entry.is_file() and entry.name.lower().endswith(WATCH_EXTENSIONS):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[entry.name] = (st.st_size, st.st_mtime_ns)
+    return snapshot
+
+
+class LiveResultsUpdater:
+    """Keeps the events union and scores in memory and patches them per RES change."""
+
+    def __init__(self, base_folder: str, output_format: str = 'csv'):
+        self.base_folder = base_folder
+        self.raw_dir = os.path.join(base_folder, 'raw_files')
+        self.results_dir = os.path.join(base_folder, 'championship_results')
+        self.extractor = SwimEventExtractor(output_dir=base_folder, output_format=output_format)
+        # Shared with every scorer so swimmer ids stay stable across refreshes
+        self.swimmers = SwimmerIndex.load(os.path.join(self.results_dir, SWIMMER_INDEX_NAME),
+                                          meet_year_from_folder(base_folder))
+        self.scorer = IncrementalScorer(pd.DataFrame(columns=CSV_COLUMNS), {}, self.swimmers)
+
+    @property
+    def df_all(self) -> pd.DataFrame:
+        """All loaded event rows."""
+        return self.scorer.df_all
+
+    @property
+    def df_champs(self) -> pd.DataFrame:
+        """Current championship scores, one row per swimmer."""
+        return self.scorer.scores
+
+    def full_refresh(self) -> None:
+        """Extract anything new, then load and score everything from scratch."""
+        os.makedirs(self.raw_dir, exist_ok=True)
+        self.extractor.extract_all_events_from_res(self.raw_dir, verbose=False)
+        event_gender_map = get_event_gender_map_from_csvs(self.base_folder)
+        try:
+            df_all = load_all_events(self.base_folder)
+        except (FileNotFoundError, ValueError):
+            # No events extracted yet
+            df_all = pd.DataFrame(columns=CSV_COLUMNS)
+        self.scorer = IncrementalScorer(df_all, event_gender_map, self.swimmers)
+        self.publish()
+
+    def update(self) -> Optional[Set[str]]:
+        """
+        Re-extract changed RES files and re-score the swimmers in them.
+
+        Returns:
+            Set of event numbers that changed, or None when nothing did
+        """
+        self.extractor.extract_all_events_from_res(self.raw_dir, verbose=False)
+        changes = self.extractor.last_change_set
+        updated = {str(n) for n in changes.get('events_updated', [])}
+        deleted = {str(n) for n in changes.get('events_deleted', [])}
+        affected = updated | deleted
+        if not affected:
+            return None
+
+        df_new = load_all_events(self.base_folder, event_numbers=updated)
+        event_gender_map = dict(self.scorer.event_gender_map)
+        for event_number in deleted - updated:
+            event_gender_map.pop(event_number, None)
+        if len(df_new):
+            for event_number, event_name in (df_new[['Event Number', 'Event Name']]
+                                             .drop_duplicates('Event Number').itertuples(index=False)):
+                event_gender_map[str(event_number)] = event_gender(event_name)
+
+        self.scorer.update_events(df_new, affected, event_gender_map)
+        self.publish()
+        return affected
+
+    def publish(self) -> None:
+        """
+        Write all results into a staging folder, then move them into place.
+
+        Each file is swapped in with os.replace so the dashboard never sees a
+        half-written file; last_updated.txt goes last so a reader that sees the
+        new timestamp also sees the new results.
+        """
+        staging_base = os.path.join(self.base_folder, STAGING_DIR)
+        shutil.rmtree(staging_base, ignore_errors=True)
+        staging_results = os.path.join(staging_base, 'championship_results')
+        os.makedirs(staging_results)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                # Written even when empty, so a union of deleted results never survives
+                export_all_events_union(staging_base, self.df_all)
+                export_scoreboard_tables(staging_base, self.scorer.boys, self.scorer.girls, self.scorer.winners)
+                # Hash the staged union, which is moved into place unchanged
+                export_all_swimmer_scores(staging_base, self.df_champs)
+                export_selection_table(staging_base, self.scorer.selection)
+            # Written even when empty (headers only) so no stale narratives survive
+            self.scorer.narratives.to_csv(
+                os.path.join(staging_results, 'championship_swimmer_narratives.csv'), index=False)
+            self.swimmers.save(os.path.join(staging_results, SWIMMER_INDEX_NAME))
+
+            os.makedirs(self.results_dir, exist_ok=True)
+            names = sorted(os.listdir(staging_results), key=lambda n: n == 'last_updated.txt')
+            for name in names:
+                os.replace(os.path.join(staging_results, name), os.path.join(self.results_dir, name))
+        finally:
+            shutil.rmtree(staging_base, ignore_errors=True)
+
+
+def watch(base_folder: str, drop_dir: Optional[str] = None, interval: float = 0.5,
+          debounce: float = 1.0, output_format: str = 'csv') -> None:
+    """
+    Poll for RES changes and refresh results until interrupted.
+
+    Args:
+        base_folder: Championship folder (e.g. 'WSC_Club_Champs_2025')
+        drop_dir: Optional folder the meet software exports into; settled files
+            are moved into raw_files/
+        interval: Seconds between polls
+        debounce: Seconds a change must stay still before it is processed
+        output_format: Extractor output format ('csv' or 'parquet')
+    """
+    updater = LiveResultsUpdater(base_folder, output_format=output_format)
+    start = time.perf_counter()
+    updater.full_refresh()
+    print(f"✓ Loaded {len(updater.df_all)} entries, {len(updater.df_champs)} swimmers scored "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    watched = drop_dir or updater.raw_dir
+    print(f"👀 Watching {watched} (poll {interval}s, debounce {debounce}s) - Ctrl+C to stop")
+
+    last_seen = snapshot_folder(watched)
+    processed = {} if drop_dir else dict(last_seen)
+    settled_since = time.monotonic()
+    while True:
+        time.sleep(interval)
+        current = snapshot_folder(watched)
+        if current != last_seen:
+            # Still being written (or another file just landed): restart the debounce
+            last_seen = current
+            settled_since = time.monotonic()
+            continue
+        if current == processed or time.monotonic() - settled_since < debounce:
+            continue
+
+        start = time.perf_counter()
+        if drop_dir:
+            os.makedirs(updater.raw_dir, exist_ok=True)
+            for name in sorted(current):
+                shutil.move(os.path.join(drop_dir, name), os.path.join(updater.raw_dir, name))
+            last_seen = {}
+
+        try:
+            affected = updater.update()
+        except Exception as e:
+            # Not marked processed, so the next settled poll (after another
+            # debounce) retries; moved drop files are already in raw_files/
+            print(f"⚠️ Update failed: {e} (will retry)")
+            processed = None
+            settled_since = time.monotonic()
+            continue
+        processed = last_seen
+        if affected:
+            print(f"⚡ Events {', '.join(sorted(affected))} refreshed, {len(updater.df_champs)} swimmers "
+                  f"on the scoreboard ({time.perf_counter() - start:.2f}s)")
+
+
+def main():
+    """Parse command-line arguments and start watching."""
+    args = sys.argv[1:]
+    base_folder = None
+    drop_dir = None
+    interval = 0.5
+    debounce = 1.0
+    output_format = 'csv'
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ('--drop-dir', '--interval', '--debounce', '--format'):
+            if i + 1 >= len(args):
+                print(f"Error: {arg} requires a value")
+                sys.exit(1)
+            value = args[i + 1]
+            try:
+                if arg == '--drop-dir':
+                    drop_dir = value
+                elif arg == '--interval':
+                    interval = float(value)
+                elif arg == '--debounce':
+                    debounce = float(value)
+                else:
+                    if value not in SwimEventExtractor.OUTPUT_FORMATS:
+                        raise ValueError(value)
+                    output_format = value
+            except ValueError:
+                print(f"Error: invalid value for {arg}: {value}")
+                sys.exit(1)
+            i += 2
+        elif arg in ('-h', '--help'):
+            print(__doc__)
+            return
+        else:
+            base_folder = f'WSC_Club_Champs_{arg}' if arg.isdigit() else arg
+            i += 1
+
+    if base_folder is None:
+        folders = sorted(glob.glob('WSC_Club_Champs_*'))
+        if not folders:
+            print("Error: no WSC_Club_Champs_* folder found; pass a year or folder")
+            sys.exit(1)
+        base_folder = folders[-1]
+        print(f"📁 Auto-detected folder: {base_folder}")
+
+    try:
+        watch(base_folder, drop_dir=drop_dir, interval=interval, debounce=debounce,
+              output_format=output_format)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+if __name__ == '__main__':
+    main()